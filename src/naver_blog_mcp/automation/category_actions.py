@@ -2,7 +2,9 @@
 
 import logging
 import re
-from typing import Dict, Any, List, Optional
+from typing import Dict, Any, List, Optional, Sequence
+from urllib.parse import urljoin
+
 from playwright.async_api import Page
 
 from ..utils.exceptions import NaverBlogError
@@ -11,6 +13,128 @@ from ..utils.error_handler import handle_playwright_error
 logger = logging.getLogger(__name__)
 
 
+# 카테고리 링크를 [text, href, categoryNo, parentCategoryNo, depth] 목록으로 추출
+# depth는 링크를 감싸는 ul/ol 개수 (filter_category_links에서 0부터로 정규화)
+CATEGORY_LINKS_SCRIPT = """
+() => {
+    const param = (href, key) => {
+        const match = href.match(new RegExp('[?&]' + key + '=([0-9]+)'));
+        return match ? match[1] : null;
+    };
+    return Array.from(document.querySelectorAll("a[href*='PostList']"), (a) => {
+        const href = a.getAttribute('href') || '';
+        let depth = 0;
+        for (let el = a.parentElement; el; el = el.parentElement) {
+            if (el.tagName === 'UL' || el.tagName === 'OL') depth++;
+        }
+        return [
+            a.textContent || '',
+            href,
+            param(href, 'categoryNo'),
+            param(href, 'parentCategoryNo'),
+            depth,
+        ];
+    });
+}
+"""
+
+# 카테고리가 아닌 내비게이션 링크 텍스트
+EXCLUDED_LINK_NAMES = {"블로그 홈", "전체보기"}
+
+
+def filter_category_links(
+    links: List[Sequence[Any]],
+    blog_id: Optional[str] = None,
+) -> List[Dict[str, Any]]:
+    """추출한 PostList 링크 중 실제 카테고리만 골라냅니다.
+
+    브라우저 없이 동작하는 순수 함수이므로 저장된 HTML로 테스트할 수 있습니다.
+
+    Args:
+        links: [text, href, categoryNo, parentCategoryNo, depth] 목록
+            (CATEGORY_LINKS_SCRIPT 결과)
+        blog_id: 블로그 아이디 (블로그 이름 링크 제외용)
+
+    Returns:
+        [
+            {
+                "name": str,                      # 카테고리명
+                "url": str,                       # 카테고리 URL
+                "categoryNo": str,                # 카테고리 번호
+                "parentCategoryNo": str | None,   # 상위 카테고리 번호
+                "depth": int,                     # 0: 최상위, 1: 하위 카테고리
+            },
+            ...
+        ]
+    """
+    categories = []
+    raw_depths = []
+    seen_category_nos = set()  # categoryNo로 중복 제거
+    seen_names = set()  # 이름으로도 중복 제거
+
+    for text, href, category_no, parent_no, raw_depth in links:
+        if not text or not href:
+            continue
+
+        name = text.strip()
+
+        # 필터링 조건
+        # 1. 텍스트가 있어야 함
+        # 2. 너무 길지 않아야 함 (카테고리명은 짧음)
+        # 3. 숫자만 있는 경우 제외 (페이지 번호)
+        # 4. 특정 키워드 제외
+        if not name or len(name) > 50:
+            continue
+
+        if name.isdigit():
+            continue
+
+        if name in EXCLUDED_LINK_NAMES:
+            continue
+
+        # blog_id가 알려진 경우 블로그 이름 제외
+        if blog_id and name == blog_id:
+            continue
+
+        # currentPage가 있으면 페이징 링크
+        if "currentPage=" in href:
+            continue
+
+        # categoryNo가 있는 경우만 추가 (실제 카테고리)
+        # categoryNo가 0인 "전체보기"는 제외
+        if not category_no or category_no == "0":
+            continue
+
+        # 같은 categoryNo나 같은 이름이 이미 있으면 건너뛰기
+        if category_no in seen_category_nos or name in seen_names:
+            continue
+
+        # 상위 카테고리 링크는 자기 자신을 parentCategoryNo로 갖기도 함
+        if parent_no == category_no:
+            parent_no = None
+
+        categories.append({
+            "name": name,
+            "url": urljoin("https://blog.naver.com/", href),
+            "categoryNo": category_no,
+            "parentCategoryNo": parent_no,
+            "depth": 0,
+        })
+        raw_depths.append(raw_depth)
+        seen_category_nos.add(category_no)
+        seen_names.add(name)
+
+    # ul 중첩 깊이를 가장 얕은 카테고리 기준 0부터로 정규화
+    base_depth = min(raw_depths, default=0)
+    for category, raw_depth in zip(categories, raw_depths):
+        depth = raw_depth - base_depth
+        if category["parentCategoryNo"] and depth == 0:
+            depth = 1
+        category["depth"] = depth
+
+    return categories
+
+
 async def get_categories(
     page: Page,
     blog_id: Optional[str] = None
@@ -27,9 +151,11 @@ async def get_categories(
             "message": str,
             "categories": [
                 {
-                    "name": str,           # 카테고리명
-                    "url": str,            # 카테고리 URL
-                    "categoryNo": str,     # 카테고리 번호
+                    "name": str,                      # 카테고리명
+                    "url": str,                       # 카테고리 URL
+                    "categoryNo": str,                # 카테고리 번호
+                    "parentCategoryNo": str | None,   # 상위 카테고리 번호
+                    "depth": int,                     # 카테고리 깊이
                 },
                 ...
             ]
@@ -86,13 +212,11 @@ async def get_categories(
                 "categories": []
             }
 
-        # 3. 카테고리 링크 찾기
+        # 3. 카테고리 링크 추출 (한 번의 evaluate로 텍스트/href/번호/깊이를 모두 가져옴)
         # PostList 링크는 카테고리 링크를 나타냄
         try:
-            category_links = await main_frame.query_selector_all(
-                "a[href*='PostList']"
-            )
-            logger.info(f"PostList 링크 {len(category_links)}개 발견")
+            links = await main_frame.evaluate(CATEGORY_LINKS_SCRIPT)
+            logger.info(f"PostList 링크 {len(links)}개 발견")
         except Exception as e:
             logger.error(f"카테고리 링크 조회 실패: {e}")
             return {
@@ -101,76 +225,8 @@ async def get_categories(
                 "categories": []
             }
 
-        # 4. 카테고리 정보 추출
-        categories = []
-        seen_category_nos = set()  # categoryNo로 중복 제거
-        seen_names = set()  # 이름으로도 중복 제거
-
-        for link in category_links:
-            try:
-                text = await link.text_content()
-                href = await link.get_attribute("href")
-
-                if not text or not href:
-                    continue
-
-                name = text.strip()
-
-                # 필터링 조건
-                # 1. 텍스트가 있어야 함
-                # 2. 너무 길지 않아야 함 (카테고리명은 짧음)
-                # 3. 숫자만 있는 경우 제외 (페이지 번호)
-                # 4. 특정 키워드 제외
-                if not name or len(name) > 50:
-                    continue
-
-                if name.isdigit():
-                    continue
-
-                if name in ["블로그 홈", "전체보기"]:
-                    continue
-
-                # blog_id가 알려진 경우 블로그 이름 제외
-                if blog_id and name == blog_id:
-                    continue
-
-                # URL에 특정 파라미터가 있으면 제외
-                # currentPage, from=postList 등이 있으면 페이징이나 내비게이션 링크
-                if "currentPage=" in href or "parentCategoryNo=" in href:
-                    continue
-
-                # URL에서 categoryNo 추출
-                category_no = None
-                if "categoryNo=" in href:
-                    match = re.search(r'categoryNo=(\d+)', href)
-                    if match:
-                        category_no = match.group(1)
-
-                # categoryNo가 있는 경우만 추가 (실제 카테고리)
-                # categoryNo가 0인 "전체보기"는 제외
-                # 이미 추가한 categoryNo면 건너뛰기 (중복 제거)
-                if category_no and category_no != "0":
-                    # 같은 categoryNo가 이미 있으면 건너뛰기
-                    if category_no in seen_category_nos:
-                        continue
-
-                    # 같은 이름이 이미 있으면 건너뛰기
-                    if name in seen_names:
-                        continue
-
-                    category_info = {
-                        "name": name,
-                        "url": href if href.startswith("http") else f"https://blog.naver.com{href}",
-                        "categoryNo": category_no,
-                    }
-                    categories.append(category_info)
-                    seen_category_nos.add(category_no)
-                    seen_names.add(name)
-                    logger.debug(f"카테고리 추가: {name} (categoryNo={category_no})")
-
-            except Exception as e:
-                logger.warning(f"카테고리 정보 추출 중 오류: {e}")
-                continue
+        # 4. 카테고리 정보 필터링/중복 제거
+        categories = filter_category_links(links, blog_id)
 
         # 5. 결과 반환
         if categories:
@@ -0,0 +1,98 @@
+"""글쓰기 에디터 프레임 확인 및 캐시.
+
+글쓰기 페이지에는 에디터 iframe(#mainFrame, PostWriteForm.naver) 외에도 광고/통계
+iframe이 여러 개 붙어 있어, 요소를 찾을 때마다 page.frames 전체를 검사하면 프레임
+수만큼 브라우저 왕복이 늘어납니다. 에디터 프레임을 한 번 확인해 페이지별로 기억해
+두고, 그 프레임에서 찾지 못했을 때만 전체 프레임을 검사합니다.
+"""
+
+import logging
+import weakref
+from typing import List, Optional
+
+from playwright.async_api import Frame, Page
+
+from ..utils.metrics import FRAMES_PROBED
+from ..utils.timing import current_recorder
+
+logger = logging.getLogger(__name__)
+
+
+# 에디터 iframe의 name / URL 표시
+EDITOR_FRAME_NAMES = ("mainFrame",)
+EDITOR_FRAME_URL_MARKERS = ("PostWriteForm",)
+
+# 페이지별로 확인한 에디터 프레임 (글 하나를 쓰는 동안 유지)
+_editor_frames: "weakref.WeakKeyDictionary[Page, Frame]" = weakref.WeakKeyDictionary()
+
+
+def _looks_like_editor(frame: Frame) -> bool:
+    """name/URL로 에디터 iframe인지 판단합니다."""
+    return frame.name in EDITOR_FRAME_NAMES or any(
+        marker in frame.url for marker in EDITOR_FRAME_URL_MARKERS
+    )
+
+
+def remember_editor_frame(page: Page, frame: Frame) -> None:
+    """에디터가 준비된 프레임을 기억합니다."""
+    _editor_frames[page] = frame
+
+
+def forget_editor_frame(page: Page) -> None:
+    """기억한 에디터 프레임을 지웁니다 (글 작성이 끝났을 때)."""
+    _editor_frames.pop(page, None)
+
+
+def find_editor_frame(page: Page) -> Optional[Frame]:
+    """
+    에디터 프레임을 반환합니다 (브라우저 왕복 없음).
+
+    기억해 둔 프레임이 아직 붙어 있으면 그대로 쓰고, 아니면 name/URL로
+    에디터 iframe을 찾아 기억합니다.
+
+    Args:
+        page: Playwright Page 객체
+
+    Returns:
+        에디터 Frame (찾지 못하면 None)
+    """
+    frame = _editor_frames.get(page)
+    if frame is not None and not frame.is_detached():
+        return frame
+
+    for frame in page.frames:
+        if frame is not page.main_frame and _looks_like_editor(frame):
+            logger.debug(f"Editor frame resolved: name={frame.name} url={frame.url}")
+            _editor_frames[page] = frame
+            return frame
+
+    _editor_frames.pop(page, None)
+    return None
+
+
+def frames_to_probe(page: Page, preferred: Optional[Frame] = None) -> List[Frame]:
+    """
+    검사할 프레임을 우선순위 순서로 반환합니다.
+
+    preferred(또는 에디터 프레임)를 맨 앞에 두고, 나머지 프레임은 그 뒤에
+    붙입니다. 호출하는 쪽은 앞 프레임에서 찾으면 멈추므로 보통 한 프레임만
+    검사합니다.
+
+    Args:
+        page: Playwright Page 객체
+        preferred: 가장 먼저 검사할 프레임 (None이면 에디터 프레임)
+
+    Returns:
+        Frame 목록
+    """
+    first = preferred if preferred is not None and not preferred.is_detached() else find_editor_frame(page)
+    frames = [frame for frame in page.frames if frame is not first]
+    return [first] + frames if first is not None else frames
+
+
+def count_probed_frames(step: str, count: int = 1) -> None:
+    """검사한 프레임 수를 메트릭과 현재 span 기록에 남깁니다."""
+    FRAMES_PROBED.inc(count, step=step)
+    recorder = current_recorder()
+    if recorder is not None:
+        recorder.incr(f"frames_probed.{step}", count)
@@ -6,19 +6,36 @@ Playwright 자동화 함수를 제공합니다.
 
 import asyncio
 import base64
+import html
 import logging
-import tempfile
-from pathlib import Path
+from itertools import groupby
+from pathlib import Path, PurePosixPath
 from typing import Optional, Union, List
-
-from playwright.async_api import Page, Frame, TimeoutError as PlaywrightTimeoutError
+from urllib.parse import unquote, urlparse
+
+from playwright.async_api import (
+    Page,
+    Frame,
+    Locator,
+    FilePayload,
+    TimeoutError as PlaywrightTimeoutError,
+)
 
 from ..utils.exceptions import (
     UploadError,
     ElementNotFoundError,
     TimeoutError,
 )
+from ..config import config
+from ..services.image_cache import image_cache
+from ..utils.image_processing import preprocess_images
+from ..utils.metrics import UPLOAD_BYTES, UPLOAD_IMAGES
 from ..utils.retry import retry_on_error
+from ..utils.selector_helper import count_selectors, matching_selectors
+from ..utils.timing import span, traced
+from .editor_frame import find_editor_frame, remember_editor_frame
+from .readiness import wait_for_upload_settled
+from .text_input import paste_html
 
 logger = logging.getLogger(__name__)
 
@@ -39,6 +56,51 @@ UPLOADED_IMAGE_SELECTORS = [
     "img[data-type='img']",
 ]
 
+# 업로드 가능한 파일 형식과 크기
+SUPPORTED_IMAGE_FORMATS = ['.jpg', '.jpeg', '.png', '.gif', '.bmp', '.heic', '.heif', '.webp']
+MAX_IMAGE_SIZE = 10 * 1024 * 1024  # 10MB
+
+# Base64 이미지 MIME 타입 → 확장자
+BASE64_IMAGE_EXTENSIONS = {
+    "image/jpeg": ".jpg",
+    "image/jpg": ".jpg",
+    "image/png": ".png",
+    "image/gif": ".gif",
+    "image/bmp": ".bmp",
+    "image/webp": ".webp",
+    "image/heic": ".heic",
+    "image/heif": ".heif",
+}
+
+# data URI 헤더가 없는 순수 base64의 형식 판별용 시그니처
+_IMAGE_SIGNATURES = [
+    (b"\xff\xd8\xff", "image/jpeg"),
+    (b"\x89PNG\r\n\x1a\n", "image/png"),
+    (b"GIF8", "image/gif"),
+    (b"BM", "image/bmp"),
+]
+
+# Base64 스트리밍 디코딩 단위 (base64 문자 수, 4의 배수)
+BASE64_DECODE_CHUNK = 1024 * 1024
+
+# 업로드 완료 대기 시간 (ms): 한 장 기준 + 배치에서 한 장 늘어날 때마다 추가
+UPLOAD_TIMEOUT = 10000
+UPLOAD_TIMEOUT_PER_EXTRA_FILE = 2000
+
+# 캐시된 URL을 붙여넣을 에디터 본문 영역
+PASTE_TARGET_SELECTOR = ".se-content [contenteditable='true'], .se-content[contenteditable='true']"
+
+# 마지막으로 삽입된 이미지 n개의 URL/크기
+_INSERTED_IMAGES_SCRIPT = """
+(count) => Array.from(document.querySelectorAll('.se-image-resource'))
+    .slice(-count)
+    .map((img) => ({
+        url: img.currentSrc || img.src || '',
+        width: img.naturalWidth || 0,
+        height: img.naturalHeight || 0,
+    }))
+"""
+
 
 async def get_editor_frame(page: Page) -> Frame:
     """글쓰기 에디터가 있는 iframe을 가져옵니다.
@@ -53,6 +115,11 @@ async def get_editor_frame(page: Page) -> Frame:
         ElementNotFoundError: iframe을 찾을 수 없는 경우
         TimeoutError: iframe 로딩 타임아웃
     """
+    # 이미 확인한 에디터 프레임이 있으면 다시 찾지 않음
+    cached = find_editor_frame(page)
+    if cached is not None:
+        return cached
+
     try:
         # iframe 찾기
         iframe_selectors = ["iframe#mainFrame", "iframe[name='mainFrame']"]
@@ -64,6 +131,7 @@ async def get_editor_frame(page: Page) -> Frame:
                     main_frame = await iframe_element.content_frame()
                     if main_frame:
                         logger.info(f"Editor iframe found: {selector}")
+                        remember_editor_frame(page, main_frame)
                         return main_frame
             except PlaywrightTimeoutError:
                 continue
@@ -89,14 +157,11 @@ async def click_image_button(frame: Frame) -> None:
     Raises:
         ElementNotFoundError: 이미지 버튼을 찾을 수 없는 경우
     """
-    for selector in IMAGE_BUTTON_SELECTORS:
+    async for selector in matching_selectors(frame, IMAGE_BUTTON_SELECTORS, "image_button"):
         try:
-            button = frame.locator(selector).first
-            if await button.count() > 0:
-                await button.click()
-                logger.info(f"Image button clicked: {selector}")
-                await asyncio.sleep(0.5)  # 파일 input 생성 대기
-                return
+            await frame.locator(selector).first.click()
+            logger.info(f"Image button clicked: {selector}")
+            return
         except Exception as e:
             logger.debug(f"Failed to click {selector}: {e}")
             continue
@@ -126,27 +191,17 @@ async def wait_for_upload_complete(
         TimeoutError: 업로드 타임아웃
     """
     try:
-        # 이미지가 에디터에 삽입될 때까지 대기
-        for selector in UPLOADED_IMAGE_SELECTORS:
-            try:
-                # 새로운 이미지가 추가되었는지 확인
-                current_count = await frame.locator(selector).count()
-                if current_count > initial_count:
-                    logger.info(f"Image uploaded successfully: {selector}")
-                    return True
-
-                # 이미지가 나타날 때까지 대기
-                await frame.wait_for_selector(
-                    selector,
-                    state="visible",
-                    timeout=timeout,
-                )
-                logger.info(f"Image element appeared: {selector}")
-                return True
-
-            except PlaywrightTimeoutError:
-                continue
+        # 이미지가 에디터에 삽입되고 업로드 진행 표시가 사라질 때까지 대기
+        await wait_for_upload_settled(
+            frame,
+            UPLOADED_IMAGE_SELECTORS,
+            expected_count=initial_count + 1,
+            timeout=timeout,
+        )
+        logger.info("Image uploaded successfully")
+        return True
 
+    except PlaywrightTimeoutError:
         raise TimeoutError(
             "Upload completion timeout",
             details={
@@ -160,6 +215,196 @@ async def wait_for_upload_complete(
         raise
 
 
+def validate_image_file(image_path: Union[str, Path]) -> Path:
+    """업로드할 이미지 파일의 존재/크기/형식을 검사합니다.
+
+    Args:
+        image_path: 이미지 파일 경로
+
+    Returns:
+        검증된 Path 객체
+
+    Raises:
+        UploadError: 파일이 없거나, 너무 크거나, 지원하지 않는 형식인 경우
+    """
+    image_path = Path(image_path)
+    if not image_path.exists():
+        raise UploadError(
+            f"Image file not found: {image_path}",
+            details={"path": str(image_path)}
+        )
+
+    # 파일 크기 확인 (10MB 제한)
+    file_size = image_path.stat().st_size
+    if file_size > MAX_IMAGE_SIZE:
+        raise UploadError(
+            f"Image file too large: {file_size / 1024 / 1024:.2f}MB (max 10MB)",
+            details={"path": str(image_path), "size": file_size}
+        )
+
+    # 포맷 검증
+    if image_path.suffix.lower() not in SUPPORTED_IMAGE_FORMATS:
+        raise UploadError(
+            f"Unsupported image format: {image_path.suffix}",
+            details={"path": str(image_path), "format": image_path.suffix}
+        )
+
+    return image_path
+
+
+async def count_uploaded_images(frame: Frame) -> int:
+    """에디터에 삽입된 이미지 개수를 반환합니다 (셀렉터별 최댓값)."""
+    return max(await count_selectors(frame, UPLOADED_IMAGE_SELECTORS), default=0)
+
+
+async def get_inserted_images(frame: Frame, count: int) -> List[dict]:
+    """마지막으로 삽입된 이미지 count개의 URL과 크기를 반환합니다."""
+    if count <= 0:
+        return []
+    try:
+        return await frame.evaluate(_INSERTED_IMAGES_SCRIPT, count)
+    except Exception as e:
+        logger.debug(f"Failed to read inserted images: {e}")
+        return []
+
+
+def match_inserted_images(image_paths: List[Path], images: List[dict]) -> Optional[List[int]]:
+    """
+    부분 성공한 배치에서 어느 파일이 올라갔는지 이미지 URL의 파일명으로 찾습니다.
+
+    네이버 이미지 URL 경로는 업로드한 파일명으로 끝납니다. 파일명이 겹치거나
+    URL이 아직 미리보기(blob:)라 파일명을 알 수 없으면 None을 반환합니다.
+
+    Args:
+        image_paths: 배치로 선택한 파일 경로 리스트
+        images: get_inserted_images()가 반환한 이번 배치의 이미지 리스트
+
+    Returns:
+        올라간 파일의 image_paths 인덱스 리스트 (알 수 없으면 None)
+    """
+    names = [path.name for path in image_paths]
+    if len(set(names)) != len(names):
+        return None
+
+    matched = []
+    for image in images:
+        name = unquote(PurePosixPath(urlparse(image.get("url", "")).path).name)
+        if name not in names or names.index(name) in matched:
+            return None
+        matched.append(names.index(name))
+    return matched
+
+
+def remember_uploaded_image(digest: Optional[str], image: Optional[dict]) -> None:
+    """업로드된 이미지의 네이버 URL을 캐시에 저장합니다."""
+    if not digest or not image:
+        return
+    url = image.get("url", "")
+    # 업로드 중 미리보기(blob:/data:)는 다른 글에서 쓸 수 없음
+    if not url.startswith("http"):
+        return
+    image_cache.put(digest, url, image.get("width", 0), image.get("height", 0))
+
+
+async def reinsert_cached_image(page: Page, entry: dict) -> bool:
+    """캐시된 이미지 URL을 에디터에 붙여넣어 재업로드 없이 삽입합니다.
+
+    Args:
+        page: Playwright Page 객체
+        entry: image_cache.get()이 반환한 항목
+
+    Returns:
+        에디터에 이미지가 삽입되었는지 여부
+    """
+    try:
+        frame = await get_editor_frame(page)
+        initial_image_count = await count_uploaded_images(frame)
+
+        target = frame.locator(PASTE_TARGET_SELECTOR).last
+        await target.click()
+        await paste_html(target, f'<img src="{html.escape(entry["url"])}">')
+
+        await wait_for_upload_settled(
+            frame,
+            UPLOADED_IMAGE_SELECTORS,
+            expected_count=initial_image_count + 1,
+            timeout=5000,
+        )
+        return True
+    except Exception as e:
+        logger.debug(f"Cached image reinsert failed: {e}")
+        return False
+
+
+async def open_file_input(frame: Frame) -> Locator:
+    """이미지 버튼을 눌러 숨겨진 파일 input을 준비합니다.
+
+    Args:
+        frame: 에디터 iframe
+
+    Returns:
+        파일 input Locator
+
+    Raises:
+        ElementNotFoundError: 이미지 버튼이나 파일 input을 찾을 수 없는 경우
+    """
+    await click_image_button(frame)
+
+    try:
+        file_input = frame.locator(FILE_INPUT_SELECTOR)
+        await file_input.wait_for(state="attached", timeout=3000)
+        return file_input
+    except PlaywrightTimeoutError:
+        raise ElementNotFoundError(
+            "File input not found after clicking image button",
+            details={"selector": FILE_INPUT_SELECTOR}
+        )
+
+
+async def select_file_and_wait(
+    page: Page,
+    file: Union[str, FilePayload],
+    wait_for_complete: bool = True,
+) -> Optional[dict]:
+    """파일 input에 파일(경로 또는 메모리 payload)을 넣고 삽입을 기다립니다.
+
+    Args:
+        page: Playwright Page 객체
+        file: 파일 경로 또는 {"name", "mimeType", "buffer"} payload
+        wait_for_complete: 업로드 완료까지 대기 여부
+
+    Returns:
+        삽입된 이미지의 URL/크기 (대기하지 않았거나 읽지 못하면 None)
+    """
+    # 에디터 iframe 가져오기
+    frame = await get_editor_frame(page)
+
+    # 업로드 전 이미지 개수 확인
+    initial_image_count = await count_uploaded_images(frame)
+
+    # 이미지 버튼 클릭 후 파일 input 찾기
+    file_input = await open_file_input(frame)
+
+    # 파일 업로드
+    await file_input.set_input_files(file)
+    if isinstance(file, str):
+        UPLOAD_BYTES.inc(Path(file).stat().st_size, source="file")
+    else:
+        UPLOAD_BYTES.inc(len(file["buffer"]), source="memory")
+
+    # 업로드 완료 대기
+    if not wait_for_complete:
+        return None
+
+    await wait_for_upload_complete(
+        frame,
+        timeout=UPLOAD_TIMEOUT,
+        initial_count=initial_image_count,
+    )
+    inserted = await get_inserted_images(frame, 1)
+    return inserted[0] if inserted else None
+
+
 @retry_on_error
 async def upload_image(
     page: Page,
@@ -185,73 +430,20 @@ async def upload_image(
     """
     try:
         # 경로 검증
-        image_path = Path(image_path)
-        if not image_path.exists():
-            raise UploadError(
-                f"Image file not found: {image_path}",
-                details={"path": str(image_path)}
-            )
-
-        # 파일 크기 확인 (10MB 제한)
-        file_size = image_path.stat().st_size
-        if file_size > 10 * 1024 * 1024:  # 10MB
-            raise UploadError(
-                f"Image file too large: {file_size / 1024 / 1024:.2f}MB (max 10MB)",
-                details={"path": str(image_path), "size": file_size}
-            )
-
-        # 포맷 검증
-        supported_formats = ['.jpg', '.jpeg', '.png', '.gif', '.bmp', '.heic', '.heif', '.webp']
-        if image_path.suffix.lower() not in supported_formats:
-            raise UploadError(
-                f"Unsupported image format: {image_path.suffix}",
-                details={"path": str(image_path), "format": image_path.suffix}
-            )
+        image_path = validate_image_file(image_path)
 
         logger.info(f"Uploading image: {image_path}")
 
-        # 에디터 iframe 가져오기
-        frame = await get_editor_frame(page)
-
-        # 업로드 전 이미지 개수 확인
-        initial_image_count = 0
-        for selector in UPLOADED_IMAGE_SELECTORS:
-            try:
-                count = await frame.locator(selector).count()
-                if count > initial_image_count:
-                    initial_image_count = count
-            except:
-                pass
-
-        # 이미지 버튼 클릭
-        await click_image_button(frame)
-
-        # 파일 input 찾기
-        try:
-            file_input = frame.locator(FILE_INPUT_SELECTOR)
-            await file_input.wait_for(state="attached", timeout=3000)
-        except PlaywrightTimeoutError:
-            raise ElementNotFoundError(
-                "File input not found after clicking image button",
-                details={"selector": FILE_INPUT_SELECTOR}
-            )
-
-        # 파일 업로드
-        await file_input.set_input_files(str(image_path.absolute()))
+        image = await select_file_and_wait(
+            page, str(image_path.absolute()), wait_for_complete
+        )
         logger.info(f"File selected: {image_path}")
 
-        # 업로드 완료 대기
-        if wait_for_complete:
-            await wait_for_upload_complete(
-                frame,
-                timeout=10000,
-                initial_count=initial_image_count,
-            )
-
         return {
             "success": True,
             "file": str(image_path),
             "message": f"Image uploaded successfully: {image_path.name}",
+            "image": image,
         }
 
     except (UploadError, ElementNotFoundError, TimeoutError) as e:
@@ -266,34 +458,98 @@ async def upload_image(
         )
 
 
-def decode_base64_image(base64_string: str) -> tuple[bytes, str]:
+def _parse_base64_header(base64_string: str) -> tuple[int, Optional[str]]:
+    """data URI 헤더를 해석합니다.
+
+    Returns:
+        (base64 본문 시작 위치, MIME 타입 또는 None)
+    """
+    if not base64_string.startswith("data:"):
+        return 0, None
+
+    comma = base64_string.find(",", 0, 256)
+    if comma < 0:
+        raise UploadError("Invalid data URI: missing ',' separator")
+
+    header = base64_string[5:comma]
+    if ";base64" not in header:
+        raise UploadError(
+            "Only base64 data URIs are supported",
+            details={"header": header[:64]}
+        )
+    return comma + 1, header.split(";")[0].lower() or None
+
+
+def _sniff_mime_type(head: bytes) -> str:
+    """파일 앞부분 시그니처로 이미지 형식을 추정합니다 (기본값 PNG)."""
+    for signature, mime_type in _IMAGE_SIGNATURES:
+        if head.startswith(signature):
+            return mime_type
+    if head[:4] == b"RIFF" and head[8:12] == b"WEBP":
+        return "image/webp"
+    return "image/png"
+
+
+def decode_base64_image(
+    base64_string: str,
+    chunk_size: int = BASE64_DECODE_CHUNK,
+) -> tuple[bytearray, str, str]:
     """Base64 인코딩된 이미지를 디코딩합니다.
 
+    입력 전체를 한 번에 bytes로 변환하지 않고 chunk_size 글자씩 잘라
+    미리 잡아 둔 버퍼에 바로 디코딩하므로, 입력 문자열 외에 추가로
+    필요한 메모리는 결과 크기 + 청크 하나 정도입니다.
+
     Args:
         base64_string: Base64 문자열 (data:image/png;base64,... 또는 순수 base64)
+        chunk_size: 한 번에 디코딩할 base64 글자 수 (4의 배수로 맞춤)
 
     Returns:
-        (이미지 바이트, 파일 확장자) 튜플
+        (이미지 바이트, 파일 확장자, MIME 타입) 튜플
 
     Raises:
-        UploadError: 디코딩 실패
+        UploadError: 디코딩 실패, 지원하지 않는 형식, 크기 초과
     """
+    start, mime_type = _parse_base64_header(base64_string)
+    if mime_type is not None and mime_type not in BASE64_IMAGE_EXTENSIONS:
+        raise UploadError(
+            f"Unsupported image type: {mime_type}",
+            details={"mime_type": mime_type}
+        )
+
+    # 결과 크기 상한 (공백이 섞여 있으면 실제로는 더 작음)
+    max_size = (len(base64_string) - start) // 4 * 3 + 3
+
+    # 명백히 큰 입력은 버퍼를 잡기 전에 거름 (정확한 검사는 디코딩 후)
+    if max_size > 2 * MAX_IMAGE_SIZE:
+        raise UploadError(
+            f"Image too large: ~{max_size / 1024 / 1024:.1f}MB (max: 10MB)",
+            details={"max_size": MAX_IMAGE_SIZE}
+        )
+
+    chunk_size = max(4, chunk_size - chunk_size % 4)
+    buffer = bytearray(max_size)
+    written = 0
+    carry = ""
+    position = start
+    total = len(base64_string)
+
     try:
-        # data:image/... 형식 처리
-        if base64_string.startswith("data:image/"):
-            # data:image/png;base64,iVBORw0KG... 형식
-            header, encoded = base64_string.split(",", 1)
-            # image/png 추출
-            mime_type = header.split(";")[0].split(":")[1]
-            extension = "." + mime_type.split("/")[1]
-        else:
-            # 순수 base64 문자열
-            encoded = base64_string
-            extension = ".png"  # 기본값
-
-        # 디코딩
-        image_bytes = base64.b64decode(encoded)
-        return image_bytes, extension
+        while position < total:
+            piece = base64_string[position:position + chunk_size]
+            position += chunk_size
+
+            # 줄바꿈 등 공백이 섞인 입력은 4글자 경계가 어긋나므로 남는 글자를 이월
+            piece = carry + "".join(piece.split())
+            if position < total:
+                cut = len(piece) - len(piece) % 4
+                piece, carry = piece[:cut], piece[cut:]
+            else:
+                carry = ""
+
+            decoded = base64.b64decode(piece)
+            buffer[written:written + len(decoded)] = decoded
+            written += len(decoded)
 
     except Exception as e:
         raise UploadError(
@@ -301,8 +557,65 @@ def decode_base64_image(base64_string: str) -> tuple[bytes, str]:
             details={"error": str(e)}
         )
 
+    del buffer[written:]
+
+    if written == 0:
+        raise UploadError("Empty base64 image")
+    if written > MAX_IMAGE_SIZE:
+        raise UploadError(
+            f"Image too large: {written / 1024 / 1024:.1f}MB (max: 10MB)",
+            details={"size": written, "max_size": MAX_IMAGE_SIZE}
+        )
+
+    if mime_type is None:
+        mime_type = _sniff_mime_type(bytes(buffer[:12]))
+    return buffer, BASE64_IMAGE_EXTENSIONS[mime_type], mime_type
+
 
 @retry_on_error
+async def upload_image_payload(
+    page: Page,
+    payload: FilePayload,
+    wait_for_complete: bool = True,
+) -> dict:
+    """메모리에 있는 이미지를 임시 파일 없이 업로드합니다.
+
+    Args:
+        page: Playwright Page 객체
+        payload: {"name", "mimeType", "buffer"} 형식의 파일 payload
+        wait_for_complete: 업로드 완료까지 대기 여부
+
+    Returns:
+        업로드 결과 딕셔너리
+
+    Raises:
+        UploadError: 이미지 업로드 실패
+    """
+    try:
+        logger.info(
+            f"Uploading image from memory: {payload['name']} "
+            f"({len(payload['buffer']) / 1024:.0f}KB)"
+        )
+        image = await select_file_and_wait(page, payload, wait_for_complete)
+
+        return {
+            "success": True,
+            "file": payload["name"],
+            "message": f"Image uploaded successfully: {payload['name']}",
+            "image": image,
+        }
+
+    except (UploadError, ElementNotFoundError, TimeoutError):
+        raise
+
+    except Exception as e:
+        logger.error(f"Unexpected error during in-memory upload: {e}", exc_info=True)
+        raise UploadError(
+            f"Failed to upload image: {str(e)}",
+            details={"file": payload["name"], "error": str(e)}
+        )
+
+
 async def upload_base64_image(
     page: Page,
     base64_string: str,
@@ -311,10 +624,13 @@ async def upload_base64_image(
 ) -> dict:
     """Base64 인코딩된 이미지를 업로드합니다.
 
+    디코딩한 바이트를 파일로 쓰지 않고 set_input_files의 payload로 바로 넘깁니다.
+    디코딩은 한 번만 하고 재시도는 업로드 단계에서만 합니다.
+
     Args:
         page: Playwright Page 객체
         base64_string: Base64 인코딩된 이미지 문자열
-        filename: 파일명 (선택, 미지정시 임시 파일명 사용)
+        filename: 파일명 (선택, 미지정시 image.<확장자>)
         wait_for_complete: 업로드 완료까지 대기 여부
 
     Returns:
@@ -323,70 +639,102 @@ async def upload_base64_image(
     Raises:
         UploadError: 이미지 업로드 실패
     """
-    temp_file = None
-    try:
-        # Base64 디코딩
-        image_bytes, extension = decode_base64_image(base64_string)
+    image_bytes, extension, mime_type = decode_base64_image(base64_string)
 
-        # 임시 파일 생성
-        if filename is None:
-            filename = f"image{extension}"
+    if filename is None:
+        filename = f"image{extension}"
 
-        with tempfile.NamedTemporaryFile(
-            suffix=extension,
-            delete=False,
-        ) as temp_file:
-            temp_file.write(image_bytes)
-            temp_path = Path(temp_file.name)
+    result = await upload_image_payload(
+        page,
+        {"name": filename, "mimeType": mime_type, "buffer": image_bytes},
+        wait_for_complete,
+    )
+    result["message"] = f"Base64 image uploaded successfully: {filename}"
+    return result
 
-        logger.info(f"Base64 image saved to temporary file: {temp_path}")
 
-        # 일반 이미지 업로드 사용
-        result = await upload_image(page, temp_path, wait_for_complete)
+async def upload_image_batch(
+    page: Page,
+    image_paths: List[Path],
+) -> tuple[int, List[dict]]:
+    """여러 이미지를 한 번의 set_input_files로 업로드합니다.
 
-        # 결과 수정 (임시 파일 경로 대신 원래 파일명 사용)
-        result["file"] = filename
-        result["message"] = f"Base64 image uploaded successfully: {filename}"
+    숨겨진 파일 input(#hidden-file)은 여러 파일을 받으므로 버튼 클릭과
+    파일 선택을 한 번만 하고, 이미지 노드가 N개 늘어날 때까지 기다립니다.
 
-        return result
+    Args:
+        page: Playwright Page 객체
+        image_paths: 검증된 이미지 파일 경로 리스트
 
-    except (UploadError, ElementNotFoundError, TimeoutError) as e:
-        raise
+    Returns:
+        (에디터에 새로 삽입된 이미지 개수, 삽입된 이미지 URL/크기 리스트)
 
-    except Exception as e:
-        logger.error(f"Unexpected error during base64 upload: {e}", exc_info=True)
-        raise UploadError(
-            f"Failed to upload base64 image: {str(e)}",
-            details={"error": str(e)}
+    Raises:
+        ElementNotFoundError: 이미지 버튼이나 파일 input을 찾을 수 없는 경우
+    """
+    frame = await get_editor_frame(page)
+    initial_image_count = await count_uploaded_images(frame)
+
+    file_input = await open_file_input(frame)
+    await file_input.set_input_files([str(path.absolute()) for path in image_paths])
+    UPLOAD_BYTES.inc(sum(path.stat().st_size for path in image_paths), source="file")
+    logger.info(f"Files selected: {len(image_paths)}")
+
+    timeout = UPLOAD_TIMEOUT + UPLOAD_TIMEOUT_PER_EXTRA_FILE * (len(image_paths) - 1)
+    try:
+        await wait_for_upload_settled(
+            frame,
+            UPLOADED_IMAGE_SELECTORS,
+            expected_count=initial_image_count + len(image_paths),
+            timeout=timeout,
         )
+        appeared = len(image_paths)
+    except PlaywrightTimeoutError:
+        appeared = await count_uploaded_images(frame) - initial_image_count
+        appeared = max(0, min(appeared, len(image_paths)))
+        logger.warning(f"Batch upload incomplete: {appeared}/{len(image_paths)}")
 
-    finally:
-        # 임시 파일 삭제
-        if temp_file and Path(temp_file.name).exists():
-            try:
-                Path(temp_file.name).unlink()
-                logger.debug(f"Temporary file deleted: {temp_file.name}")
-            except Exception as e:
-                logger.warning(f"Failed to delete temporary file: {e}")
+    return appeared, await get_inserted_images(frame, appeared)
 
 
 @retry_on_error
+@traced("upload_images")
 async def upload_images(
     page: Page,
     image_paths: List[Union[str, Path]],
+    batch: Optional[bool] = None,
+    batch_size: Optional[int] = None,
+    preprocess: Optional[bool] = None,
+    use_cache: Optional[bool] = None,
 ) -> dict:
-    """여러 이미지를 순차적으로 업로드합니다.
+    """여러 이미지를 업로드합니다.
+
+    배치 모드에서는 파일을 batch_size개씩 묶어 한 번에 선택합니다. 배치 업로드가
+    예외로 실패하면 해당 묶음만 한 장씩 다시 업로드합니다. 일부만 올라간 경우에는
+    삽입된 이미지 URL의 파일명으로 올라간 파일을 확인해 빠진 파일만 한 장씩 다시
+    올리고(다시 올린 이미지는 묶음 뒤에 붙음), 확인할 수 없으면 묶음 전체를
+    실패한 배치로 보고 한 장씩 다시 업로드합니다.
+    전처리를 켜면 업로드 전에 리사이즈/재압축/메타데이터 제거를 거칩니다.
+    캐시를 켜면 이전에 올린 적 있는 이미지(내용 해시 기준)는 파일을 다시
+    보내지 않고 업로드된 URL로 재삽입하며, 재삽입이 실패하면 업로드합니다.
 
     Args:
         page: Playwright Page 객체
         image_paths: 이미지 파일 경로 리스트
+        batch: 배치 업로드 사용 여부 (None이면 config.IMAGE_UPLOAD_BATCH)
+        batch_size: 한 번에 선택할 최대 파일 수
+            (None이면 config.IMAGE_UPLOAD_BATCH_SIZE)
+        preprocess: 업로드 전 전처리 여부 (None이면 config.IMAGE_PREPROCESS)
+        use_cache: 업로드 이미지 캐시 사용 여부 (None이면 config.IMAGE_CACHE_ENABLED)
 
     Returns:
         업로드 결과 딕셔너리
         - success: 전체 성공 여부
         - uploaded: 성공한 파일 리스트
         - failed: 실패한 파일 리스트
+        - reused: 캐시에서 재삽입한 파일 리스트
         - message: 결과 메시지
+        - cache: 캐시 카운터 (캐시 사용 시)
 
     Raises:
         UploadError: 모든 이미지 업로드 실패
@@ -396,41 +744,171 @@ async def upload_images(
             "success": True,
             "uploaded": [],
             "failed": [],
+            "reused": [],
             "message": "No images to upload",
         }
 
+    if batch is None:
+        batch = config.IMAGE_UPLOAD_BATCH
+    if batch_size is None:
+        batch_size = config.IMAGE_UPLOAD_BATCH_SIZE
+    if preprocess is None:
+        preprocess = config.IMAGE_PREPROCESS
+    if use_cache is None:
+        use_cache = config.IMAGE_CACHE_ENABLED
+
+    # 결과는 항상 원본 경로 기준으로 보고
+    originals = [str(image_path) for image_path in image_paths]
+    if preprocess:
+        with span("upload_images.preprocess"):
+            upload_paths = await preprocess_images(
+                originals,
+                output_dir=config.IMAGE_PREPROCESS_DIR,
+                max_edge=config.IMAGE_MAX_EDGE,
+                quality=config.IMAGE_QUALITY,
+                max_workers=config.IMAGE_PREPROCESS_WORKERS,
+            )
+    else:
+        upload_paths = originals
+
+    # 실제로 올릴 파일 내용 기준으로 해시 (전처리 결과가 같으면 같은 키)
+    digests: List[Optional[str]] = []
+    for upload_path in upload_paths:
+        digest = None
+        if use_cache:
+            try:
+                # 큰 파일 해시가 이벤트 루프(다른 세션)를 막지 않도록 스레드에서 계산
+                digest = await asyncio.to_thread(image_cache.hash_file, upload_path)
+            except OSError:
+                pass  # 없는 파일은 업로드 단계에서 실패로 기록
+        digests.append(digest)
+    items = list(zip(originals, upload_paths, digests))
+
     uploaded = []
     failed = []
+    reused = []
 
-    for image_path in image_paths:
-        try:
-            result = await upload_image(page, image_path, wait_for_complete=True)
-            if result["success"]:
-                uploaded.append(str(image_path))
-                logger.info(f"✓ {Path(image_path).name}")
-            else:
-                failed.append(str(image_path))
-                logger.warning(f"✗ {Path(image_path).name}")
+    async def upload_one_by_one(entries: List[tuple]) -> None:
+        for original, upload_path, digest in entries:
+            try:
+                result = await upload_image(page, upload_path, wait_for_complete=True)
+                if result["success"]:
+                    uploaded.append(original)
+                    remember_uploaded_image(digest, result.get("image"))
+                    logger.info(f"✓ {Path(original).name}")
+                else:
+                    failed.append(original)
+                    logger.warning(f"✗ {Path(original).name}")
 
-            # 이미지 간 간격
-            await asyncio.sleep(0.5)
+            except Exception as e:
+                logger.error(f"Failed to upload {original}: {e}")
+                failed.append(original)
 
-        except Exception as e:
-            logger.error(f"Failed to upload {image_path}: {e}")
-            failed.append(str(image_path))
+    async def upload_entries(entries: List[tuple]) -> None:
+        if not batch or len(entries) == 1:
+            await upload_one_by_one(entries)
+            return
+
+        # 검증 실패한 파일은 배치에서 제외하고 실패로 기록
+        valid_entries = []
+        for original, upload_path, digest in entries:
+            try:
+                valid_entries.append((original, validate_image_file(upload_path), digest))
+            except UploadError as e:
+                logger.error(f"Failed to upload {original}: {e}")
+                failed.append(original)
+
+        for start in range(0, len(valid_entries), max(1, batch_size)):
+            chunk = valid_entries[start:start + max(1, batch_size)]
+            try:
+                with span("upload_images.batch"):
+                    appeared, images = await upload_image_batch(
+                        page, [path for _, path, _ in chunk]
+                    )
+            except Exception as e:
+                logger.warning(f"Batch upload failed, retrying one by one: {e}")
+                await upload_one_by_one(chunk)
+                continue
+
+            if appeared == len(chunk):
+                # 묶음 전체가 올라갔을 때만 위치로 URL을 짝지어 캐시
+                cache_urls = len(images) == len(chunk)
+                for idx, (original, _, digest) in enumerate(chunk):
+                    uploaded.append(original)
+                    if cache_urls:
+                        remember_uploaded_image(digest, images[idx])
+                    logger.info(f"✓ {Path(original).name}")
+                continue
+
+            # 일부만 올라가면 어느 파일의 URL인지 위치로는 알 수 없으므로 캐시하지 않음
+            matched = (
+                match_inserted_images([path for _, path, _ in chunk], images)
+                if len(images) == appeared
+                else None
+            )
+            if matched is None:
+                logger.warning(
+                    f"Batch upload incomplete ({appeared}/{len(chunk)}) and uploaded files "
+                    "could not be identified, retrying the chunk one by one"
+                )
+                await upload_one_by_one(chunk)
+                continue
+
+            for idx in sorted(matched):
+                uploaded.append(chunk[idx][0])
+                logger.info(f"✓ {Path(chunk[idx][0]).name}")
+            missing = [entry for idx, entry in enumerate(chunk) if idx not in matched]
+            logger.warning(
+                f"Batch upload incomplete ({appeared}/{len(chunk)}), "
+                f"retrying {len(missing)} files one by one"
+            )
+            await upload_one_by_one(missing)
+
+    # 캐시 적중/미적중이 연속된 구간별로 처리해 삽입 순서를 유지
+    def cached_entry(item: tuple) -> Optional[dict]:
+        return image_cache.get(item[2]) if item[2] else None
+
+    lookups = [(item, cached_entry(item)) for item in items]
+    for is_hit, group in groupby(lookups, key=lambda pair: pair[1] is not None):
+        group = list(group)
+        if not is_hit:
+            await upload_entries([item for item, _ in group])
+            continue
+
+        for item, entry in group:
+            original, _, digest = item
+            if await reinsert_cached_image(page, entry):
+                uploaded.append(original)
+                reused.append(original)
+                logger.info(f"✓ {Path(original).name} (cached)")
+                continue
+
+            # URL이 만료되었거나 에디터가 붙여넣기를 거부한 경우
+            logger.warning(f"Cached image reinsert failed, uploading: {Path(original).name}")
+            image_cache.record_reinsert_failure()
+            image_cache.discard(digest)
+            await upload_one_by_one([item])
 
     # 결과 정리
     success = len(uploaded) > 0 and len(failed) == 0
+    UPLOAD_IMAGES.inc(len(uploaded) - len(reused), result="uploaded")
+    UPLOAD_IMAGES.inc(len(reused), result="reused")
+    UPLOAD_IMAGES.inc(len(failed), result="failed")
 
-    if len(failed) == len(image_paths):
+    if len(failed) == len(items):
         raise UploadError(
             "All images failed to upload",
             details={"failed": failed}
         )
 
-    return {
+    result = {
         "success": success,
         "uploaded": uploaded,
         "failed": failed,
-        "message": f"Uploaded {len(uploaded)}/{len(image_paths)} images",
+        "reused": reused,
+        "message": f"Uploaded {len(uploaded)}/{len(items)} images",
     }
+    if use_cache:
+        result["cache"] = image_cache.stats()
+        logger.info(f"Image cache: {result['cache']}")
+    return result
@@ -1,13 +1,24 @@
 """네이버 로그인 자동화."""
 
 import asyncio
+import logging
+import time
 from pathlib import Path
 from typing import Optional
 
 from playwright.async_api import Page, BrowserContext, TimeoutError as PlaywrightTimeout
 
+from .readiness import wait_for_login_form
 from .selectors import LOGIN_ID_INPUT, LOGIN_PW_INPUT, LOGIN_BTN
 
+logger = logging.getLogger(__name__)
+
+# 로그인 상태를 나타내는 네이버 인증 쿠키
+NAVER_AUTH_COOKIES = ("NID_AUT", "NID_SES")
+
+# 로그인 상태에서만 블로그로 리다이렉트되고, 아니면 로그인 페이지로 보내는 URL
+LOGIN_PROBE_URL = "https://blog.naver.com/MyBlog.naver"
+
 
 class NaverLoginError(Exception):
     """네이버 로그인 관련 에러."""
@@ -63,7 +74,7 @@ async def login_to_naver(
     try:
         # 1. 로그인 페이지로 이동
         await page.goto("https://nid.naver.com/nidlogin.login", wait_until="networkidle")
-        await asyncio.sleep(1)  # 페이지 로딩 대기
+        await wait_for_login_form(page)
 
         # 2. 아이디 입력
         await page.fill(LOGIN_ID_INPUT, user_id)
@@ -126,7 +137,6 @@ async def login_to_naver(
 
         # 7. 블로그 페이지로 이동하여 로그인 확인
         await page.goto("https://blog.naver.com", wait_until="load")
-        await asyncio.sleep(2)  # 추가 로딩 대기
 
         # 로그인 상태 확인
         current_url = page.url
@@ -187,7 +197,7 @@ async def _wait_for_captcha_manual(page: Page, timeout: int = 60000) -> None:
             timeout=timeout,
         )
         logger.info("CAPTCHA 해결 완료!")
-        await asyncio.sleep(2)  # 추가 대기
+        await page.wait_for_load_state("load")
     except PlaywrightTimeout:
         raise NaverLoginError("CAPTCHA 해결 시간 초과")
 
@@ -204,7 +214,6 @@ async def verify_login_session(page: Page) -> bool:
     """
     try:
         await page.goto("https://blog.naver.com", wait_until="load", timeout=10000)
-        await asyncio.sleep(1)  # 추가 로딩 대기
 
         # URL 및 쿠키 확인
         current_url = page.url
@@ -224,6 +233,82 @@ async def verify_login_session(page: Page) -> bool:
         return False
 
 
+def check_auth_cookies(
+    cookies: list[dict],
+    now: Optional[float] = None,
+    margin_seconds: int = 300,
+) -> Optional[bool]:
+    """
+    인증 쿠키만 보고 로그인 상태를 판단합니다 (네트워크 요청 없음).
+
+    Args:
+        cookies: context.cookies() 또는 storage state의 쿠키 리스트
+        now: 기준 시각 (epoch 초, 기본: 현재 시각)
+        margin_seconds: 이 시간 안에 만료되는 쿠키는 만료된 것으로 봄
+
+    Returns:
+        True: 인증 쿠키가 모두 있고 만료 시각이 충분히 남음
+        False: 인증 쿠키가 없거나 만료됨
+        None: 만료 시각이 없는 세션 쿠키라 서버에 확인해야 함
+    """
+    if now is None:
+        now = time.time()
+
+    auth_cookies = {
+        c["name"]: c
+        for c in cookies
+        if c.get("name") in NAVER_AUTH_COOKIES and "naver.com" in c.get("domain", "")
+    }
+    if any(name not in auth_cookies for name in NAVER_AUTH_COOKIES):
+        return False
+
+    uncertain = False
+    for cookie in auth_cookies.values():
+        expires = cookie.get("expires", -1)
+        if expires is None or expires <= 0:
+            # 브라우저 세션 쿠키: 서버에서 만료됐는지 알 수 없음
+            uncertain = True
+        elif expires < now + margin_seconds:
+            return False
+
+    return None if uncertain else True
+
+
+async def probe_login_session(
+    context: BrowserContext, timeout: float = 5000
+) -> Optional[bool]:
+    """
+    페이지를 열지 않고 HTTP 요청 하나로 로그인 상태를 확인합니다.
+
+    컨텍스트 쿠키를 실어 LOGIN_PROBE_URL을 요청하고, 리다이렉트 대상이
+    로그인 페이지인지만 확인합니다 (리다이렉트는 따라가지 않음).
+
+    Args:
+        context: 확인할 BrowserContext
+        timeout: 요청 타임아웃 (ms)
+
+    Returns:
+        로그인 여부 (요청 실패 등으로 판단할 수 없으면 None)
+    """
+    try:
+        response = await context.request.get(
+            LOGIN_PROBE_URL, max_redirects=0, timeout=timeout
+        )
+    except Exception as e:
+        logger.debug(f"Login probe request failed: {e}")
+        return None
+
+    try:
+        if 300 <= response.status < 400:
+            location = response.headers.get("location", "")
+            return "nid.naver.com" not in location
+        if response.ok:
+            return "nid.naver.com" not in response.url
+        return None
+    finally:
+        await response.dispose()
+
+
 async def logout_from_naver(page: Page) -> None:
     """
     네이버에서 로그아웃합니다.
@@ -233,6 +318,5 @@ async def logout_from_naver(page: Page) -> None:
     """
     try:
         await page.goto("https://nid.naver.com/nidlogin.logout")
-        await asyncio.sleep(1)
     except Exception as e:
         raise NaverLoginError(f"로그아웃 중 오류 발생: {str(e)}")
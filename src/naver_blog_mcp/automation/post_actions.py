@@ -2,11 +2,29 @@
 
 import asyncio
 import logging
-from typing import Optional, Dict, Any
+import weakref
+from typing import Optional, Dict, Any, Union
 from pathlib import Path
-
-from playwright.async_api import Page, TimeoutError as PlaywrightTimeout
-
+from urllib.parse import urlencode, urlparse, parse_qsl, urlunparse
+
+from playwright.async_api import Frame, Page, TimeoutError as PlaywrightTimeout
+
+from ..config import config
+from ..utils.selector_helper import matching_selectors, race_selectors
+from ..utils.timing import recording, span, traced
+from .editor_frame import (
+    count_probed_frames,
+    forget_editor_frame,
+    frames_to_probe,
+    remember_editor_frame,
+)
+from .readiness import (
+    PUBLISH_DIALOG_SELECTOR,
+    wait_for_dialog,
+    wait_for_editor_ready,
+    wait_for_hidden,
+)
+from .text_input import insert_content
 from .selectors import (
     POST_WRITE_TITLE,
     POST_WRITE_CONTENT_FRAME,
@@ -26,102 +44,327 @@ class NaverBlogPostError(Exception):
     pass
 
 
+# 미리 열어 두고 아직 아무 작업도 하지 않은 글쓰기 페이지
+_warm_editor_pages: "weakref.WeakSet[Page]" = weakref.WeakSet()
+
+# 발행을 마쳐 다음 글을 위해 에디터를 다시 열어 둘 페이지 (RECYCLE_EDITOR)
+_recycle_pages: "weakref.WeakSet[Page]" = weakref.WeakSet()
+
+# "작성 중인 글이 있습니다" 이어쓰기 팝업과 취소(새 글로 시작) 버튼
+DRAFT_POPUP_SELECTOR = ".se-popup-alert-confirm, .se-popup-alert"
+DRAFT_POPUP_CANCEL_SELECTORS = [
+    ".se-popup-alert-confirm .se-popup-button-cancel",
+    ".se-popup-alert .se-popup-button-cancel",
+    ".se-popup-alert-confirm button:has-text('취소')",
+]
+
+
+def _is_write_page_url(url: str) -> bool:
+    """글쓰기 페이지 URL인지 확인합니다."""
+    return (
+        "postwrite" in url.lower()
+        or "PostWriteForm" in url
+        or "Redirect=Write" in url
+    )
+
+
+async def warm_up_editor(page: Page, timeout: int = 30000) -> None:
+    """
+    글쓰기 에디터를 미리 열어 둡니다.
+
+    다음 navigate_to_post_write_page() 호출은 이 페이지를 다시 불러오지 않고
+    바로 사용합니다 (한 번만).
+
+    Args:
+        page: Playwright Page 객체 (로그인된 상태)
+        timeout: 페이지 로딩 대기 시간 (ms)
+
+    Raises:
+        NaverBlogPostError: 페이지 이동 실패 시
+    """
+    await navigate_to_post_write_page(page, timeout=timeout)
+    _warm_editor_pages.add(page)
+
+
+async def recycle_editor(page: Page, timeout: int = 30000) -> bool:
+    """
+    발행을 마친 페이지에 새 글쓰기 에디터를 다시 열어 둡니다.
+
+    페이지 풀이 페이지를 반납받을 때 호출합니다 (RECYCLE_EDITOR). 같은 탭에서
+    캐시된 글쓰기 URL로 바로 이동하므로 블로그 메인을 거치지 않고, 다음 글은
+    이 페이지를 받아 이동 없이 바로 입력을 시작합니다. 이번에 발행한 페이지가
+    아니면 아무것도 하지 않습니다.
+
+    Args:
+        page: Playwright Page 객체
+        timeout: 페이지 로딩 대기 시간 (ms)
+
+    Returns:
+        에디터를 다시 열어 두었는지 여부
+    """
+    if page not in _recycle_pages:
+        return False
+    _recycle_pages.discard(page)
+    if page.is_closed():
+        return False
+
+    try:
+        with span("recycle_editor"):
+            await warm_up_editor(page, timeout=timeout)
+        logger.info("다음 글을 위해 글쓰기 에디터를 다시 열어 두었습니다")
+        return True
+    except NaverBlogPostError as e:
+        # 다음 글이 평소처럼 글쓰기 페이지로 이동하므로 무시
+        logger.warning(f"에디터 재사용 준비 실패 (무시): {e}")
+        return False
+
+
+async def dismiss_draft_popup(scope: Union[Page, Frame]) -> bool:
+    """
+    이전 글 이어쓰기 팝업이 떠 있으면 취소를 눌러 새 글로 시작합니다.
+
+    Args:
+        scope: 에디터 Page 또는 Frame
+
+    Returns:
+        팝업을 닫았는지 여부
+    """
+    selector = await race_selectors(scope, DRAFT_POPUP_CANCEL_SELECTORS, "draft_popup")
+    if not selector:
+        return False
+
+    try:
+        await scope.locator(selector).first.click(timeout=2000)
+        await wait_for_hidden(scope, DRAFT_POPUP_SELECTOR)
+        logger.info("이어쓰기 팝업 닫음 (새 글로 시작)")
+        return True
+    except Exception as e:
+        logger.debug(f"이어쓰기 팝업 닫기 실패: {e}")
+        return False
+
+
+async def _take_warm_editor(page: Page, category_no: Optional[str]) -> bool:
+    """미리 열어 둔 에디터를 그대로 쓸 수 있으면 표시를 지우고 True를 반환합니다."""
+    if page not in _warm_editor_pages:
+        return False
+    _warm_editor_pages.discard(page)
+
+    # 카테고리가 지정되면 categoryNo가 붙은 URL로 다시 열어야 함
+    if category_no or page.is_closed() or not _is_write_page_url(page.url):
+        return False
+
+    try:
+        remember_editor_frame(page, await wait_for_editor_ready(page, timeout=2000))
+        return True
+    except PlaywrightTimeout:
+        return False
+
+
+def _with_category(url: str, category_no: Optional[str]) -> str:
+    """글쓰기 URL에 categoryNo 쿼리 파라미터를 붙입니다."""
+    if not category_no:
+        return url
+    parts = urlparse(url)
+    query = dict(parse_qsl(parts.query))
+    query["categoryNo"] = str(category_no)
+    return urlunparse(parts._replace(query=urlencode(query)))
+
+
+def _extract_blog_id(url: str) -> Optional[str]:
+    """글쓰기/블로그 URL에서 blog_id를 추출합니다."""
+    parts = urlparse(url)
+    query = dict(parse_qsl(parts.query))
+    if query.get("blogId"):
+        return query["blogId"]
+
+    # https://blog.naver.com/<blog_id>/postwrite, https://blog.naver.com/<blog_id>?Redirect=Write
+    segments = [segment for segment in parts.path.split("/") if segment]
+    if segments and "." not in segments[0] and segments[0].lower() != "postwrite":
+        return segments[0]
+    return None
+
+
+# 세션(BrowserContext)별로 찾아 둔 글쓰기 URL과 blog_id
+# 컨텍스트가 교체(재로그인)되면 자동으로 사라짐
+_write_url_cache: "weakref.WeakKeyDictionary[Any, Dict[str, Optional[str]]]" = (
+    weakref.WeakKeyDictionary()
+)
+
+
+def get_cached_write_target(context) -> Optional[Dict[str, Optional[str]]]:
+    """
+    세션에 캐시된 글쓰기 URL과 blog_id를 반환합니다.
+
+    Args:
+        context: BrowserContext 객체
+
+    Returns:
+        {"url": str, "blog_id": str 또는 None} 또는 None
+    """
+    return _write_url_cache.get(context)
+
+
+def invalidate_write_url_cache(context=None) -> None:
+    """
+    캐시된 글쓰기 URL을 삭제합니다.
+
+    Args:
+        context: 삭제할 세션의 BrowserContext (None이면 전체)
+    """
+    if context is None:
+        _write_url_cache.clear()
+    else:
+        _write_url_cache.pop(context, None)
+
+
+async def _discover_write_url(page: Page, timeout: int) -> str:
+    """블로그 메인에서 글쓰기 버튼을 찾아 글쓰기 URL을 알아냅니다."""
+    # 먼저 블로그 메인으로 이동
+    await page.goto("https://blog.naver.com", wait_until="load", timeout=timeout)
+
+    # 글쓰기 버튼 찾기 (여러 셀렉터 시도)
+    write_btn_selectors = [
+        "a[href*='postwrite']",
+        "a:has-text('글쓰기')",
+        "button:has-text('글쓰기')",
+    ]
+
+    # 고정 대기 대신 글쓰기 버튼이 붙을 때까지만 대기
+    try:
+        await page.wait_for_selector(
+            ", ".join(write_btn_selectors), state="attached", timeout=5000
+        )
+    except PlaywrightTimeout:
+        pass
+
+    async for selector in matching_selectors(page, write_btn_selectors, "write_btn"):
+        # href 가져오기
+        element = page.locator(selector).first
+        href = await element.get_attribute("href")
+        if href:
+            # 절대 URL로 변환
+            if href.startswith("/"):
+                url = f"https://blog.naver.com{href}"
+            elif href.startswith("http"):
+                url = href
+            else:
+                url = f"https://blog.naver.com/{href}"
+            print(f"   글쓰기 버튼 발견: {url}")
+            return url
+
+    # 기본 URL 사용
+    url = "https://blog.naver.com/postwrite"
+    print(f"   글쓰기 버튼을 찾지 못했습니다. 기본 URL 사용: {url}")
+    return url
+
+
+@traced("navigate")
 async def navigate_to_post_write_page(
-    page: Page, blog_id: Optional[str] = None, timeout: int = 30000
+    page: Page,
+    blog_id: Optional[str] = None,
+    timeout: int = 30000,
+    category_no: Optional[str] = None,
 ) -> None:
     """
     네이버 블로그 글쓰기 페이지로 이동합니다.
 
+    blog_id 없이 호출하면 처음 한 번만 블로그 메인에서 글쓰기 버튼을 찾고,
+    찾은 URL은 세션별로 캐시해 다음 글부터 바로 이동합니다. 캐시된 URL로
+    이동했는데 글쓰기 페이지가 아니면 캐시를 지우고 다시 찾습니다.
+
     Args:
         page: Playwright Page 객체
         blog_id: 블로그 ID (옵션, 없으면 자동으로 현재 로그인된 블로그 사용)
         timeout: 페이지 로딩 대기 시간 (ms)
+        category_no: 미리 선택할 카테고리 번호 (옵션)
 
     Raises:
         NaverBlogPostError: 페이지 이동 실패 시
     """
+    # 미리 열어 둔 에디터가 있으면 이동하지 않음
+    if await _take_warm_editor(page, category_no):
+        logger.info(f"미리 열어 둔 글쓰기 페이지 사용: {page.url}")
+        return
+
+    context = page.context
+    cached = None
+
     try:
         # 방법 1: blog_id가 주어진 경우
         if blog_id:
             url = f"https://blog.naver.com/{blog_id}/postwrite"
         else:
-            # 방법 2: 블로그 메인에서 글쓰기 버튼 찾아서 클릭
-            # 먼저 블로그 메인으로 이동
-            await page.goto("https://blog.naver.com", wait_until="load", timeout=timeout)
-            await asyncio.sleep(2)
-
-            # 글쓰기 버튼 찾기 (여러 셀렉터 시도)
-            write_btn_selectors = [
-                "a[href*='postwrite']",
-                "a:has-text('글쓰기')",
-                "button:has-text('글쓰기')",
-            ]
-
-            write_btn_found = False
-            for selector in write_btn_selectors:
-                count = await page.locator(selector).count()
-                if count > 0:
-                    # href 가져오기
-                    element = page.locator(selector).first
-                    href = await element.get_attribute("href")
-                    if href:
-                        # 절대 URL로 변환
-                        if href.startswith("/"):
-                            url = f"https://blog.naver.com{href}"
-                        elif href.startswith("http"):
-                            url = href
-                        else:
-                            url = f"https://blog.naver.com/{href}"
-                        write_btn_found = True
-                        print(f"   글쓰기 버튼 발견: {url}")
-                        break
-
-            if not write_btn_found:
-                # 기본 URL 사용
-                url = "https://blog.naver.com/postwrite"
-                print(f"   글쓰기 버튼을 찾지 못했습니다. 기본 URL 사용: {url}")
-
-        await page.goto(url, wait_until="load", timeout=timeout)
-        await asyncio.sleep(3)  # 에디터 로딩 충분히 대기
+            # 방법 2: 이 세션에서 이미 찾아 둔 글쓰기 URL
+            cached = _write_url_cache.get(context)
+            if cached:
+                url = cached["url"]
+                logger.debug(f"캐시된 글쓰기 URL 사용: {url}")
+            else:
+                # 방법 3: 블로그 메인에서 글쓰기 버튼 찾기
+                with span("navigate.discover"):
+                    url = await _discover_write_url(page, timeout)
+
+        with span("navigate.goto"):
+            await page.goto(_with_category(url, category_no), wait_until="load", timeout=timeout)
+
+        # 에디터 입력란이 나타날 때까지 대기
+        try:
+            with span("navigate.editor_ready"):
+                editor_frame = await wait_for_editor_ready(page, timeout=timeout)
+            # 이 글을 쓰는 동안 이미지 업로드/발행은 이 프레임부터 찾음
+            remember_editor_frame(page, editor_frame)
+            await dismiss_draft_popup(editor_frame)
+        except PlaywrightTimeout:
+            logger.warning("에디터 준비 대기 시간 초과, URL/셀렉터로 재확인합니다")
 
         # 글쓰기 페이지인지 확인
         current_url = page.url
         print(f"   현재 URL: {current_url}")
 
         # URL에 postwrite, PostWriteForm, Redirect=Write가 포함되어 있으면 성공으로 간주
-        if ("postwrite" in current_url.lower() or
-            "PostWriteForm" in current_url or
-            "Redirect=Write" in current_url):
-            logger.info(f"글쓰기 페이지로 이동: {current_url}")
-            return
+        landed = _is_write_page_url(current_url)
 
         # 제목 입력란 확인 (추가 검증)
-        title_input_exists = False
-        if isinstance(POST_WRITE_TITLE, list):
-            for selector in POST_WRITE_TITLE:
-                count = await page.locator(selector).count()
-                if count > 0:
-                    title_input_exists = True
-                    print(f"   제목 입력란 발견: {selector}")
-                    break
-        else:
-            count = await page.locator(POST_WRITE_TITLE).count()
-            title_input_exists = count > 0
+        if not landed:
+            selector = await race_selectors(page, POST_WRITE_TITLE, "title_input")
+            if selector:
+                landed = True
+                print(f"   제목 입력란 발견: {selector}")
 
-        if title_input_exists:
-            logger.info(f"글쓰기 페이지로 이동: {url}")
+        if landed:
+            logger.info(f"글쓰기 페이지로 이동: {current_url}")
+            if not blog_id and not cached:
+                _write_url_cache[context] = {
+                    "url": url,
+                    "blog_id": _extract_blog_id(current_url) or _extract_blog_id(url),
+                }
             return
 
+        if cached:
+            # 캐시된 URL이 더 이상 글쓰기 페이지로 가지 않음 → 다시 찾기
+            logger.warning(f"캐시된 글쓰기 URL이 예상과 다른 곳으로 이동: {current_url}")
+            invalidate_write_url_cache(context)
+            return await navigate_to_post_write_page(
+                page, blog_id=None, timeout=timeout, category_no=category_no
+            )
+
         raise NaverBlogPostError(f"글쓰기 페이지 로딩에 실패했습니다. 현재 URL: {current_url}")
 
     except PlaywrightTimeout as e:
+        if cached:
+            invalidate_write_url_cache(context)
         raise NaverBlogPostError(f"글쓰기 페이지 이동 시간 초과: {str(e)}")
+    except NaverBlogPostError:
+        raise
     except Exception as e:
+        if cached:
+            invalidate_write_url_cache(context)
         import traceback
         traceback.print_exc()
         raise NaverBlogPostError(f"글쓰기 페이지 이동 중 오류: {str(e)}")
 
 
+@traced("title")
 async def fill_post_title(page: Page, title: str) -> None:
     """
     블로그 글 제목을 입력합니다.
@@ -137,33 +380,29 @@ async def fill_post_title(page: Page, title: str) -> None:
         # 제목 입력란 찾기 (대체 셀렉터 시도)
         title_filled = False
 
-        # 방법 1: 일반적인 셀렉터 시도
-        if isinstance(POST_WRITE_TITLE, list):
-            for selector in POST_WRITE_TITLE:
-                try:
-                    element_count = await page.locator(selector).count()
-                    if element_count > 0:
-                        # contenteditable div는 fill 대신 type 사용
-                        element = page.locator(selector).first
-
-                        # contenteditable인지 확인
-                        is_contenteditable = await element.get_attribute("contenteditable")
-
-                        if is_contenteditable:
-                            # contenteditable div: 클릭 후 타이핑
-                            await element.click()
-                            await asyncio.sleep(0.3)
-                            await element.type(title, delay=50)
-                        else:
-                            # 일반 input: fill 사용
-                            await element.fill(title)
-
-                        title_filled = True
-                        logger.info(f"제목 입력 완료: {title} (selector: {selector})")
-                        break
-                except Exception as e:
-                    print(f"   셀렉터 {selector} 실패: {e}")
-                    continue
+        # 방법 1: 일반적인 셀렉터 시도 (요소가 있는 셀렉터만 차례로)
+        async for selector in matching_selectors(page, POST_WRITE_TITLE, "title_input"):
+            try:
+                # contenteditable div는 fill 대신 type 사용
+                element = page.locator(selector).first
+
+                # contenteditable인지 확인
+                is_contenteditable = await element.get_attribute("contenteditable")
+
+                if is_contenteditable:
+                    # contenteditable div: 클릭 후 타이핑
+                    await element.click()
+                    await element.type(title, delay=50)
+                else:
+                    # 일반 input: fill 사용
+                    await element.fill(title)
+
+                title_filled = True
+                logger.info(f"제목 입력 완료: {title} (selector: {selector})")
+                break
+            except Exception as e:
+                print(f"   셀렉터 {selector} 실패: {e}")
+                continue
 
         # 방법 2: 제목 영역을 직접 클릭 (좌표 기반)
         if not title_filled:
@@ -192,13 +431,17 @@ async def fill_post_title(page: Page, title: str) -> None:
         if not title_filled:
             raise NaverBlogPostError("제목 입력란을 찾을 수 없습니다.")
 
-        await asyncio.sleep(0.5)
-
     except Exception as e:
         raise NaverBlogPostError(f"제목 입력 중 오류: {str(e)}")
 
 
-async def fill_post_content(page: Page, content: str, use_html: bool = False) -> None:
+@traced("content")
+async def fill_post_content(
+    page: Page,
+    content: str,
+    use_html: bool = False,
+    input_mode: Optional[str] = None,
+) -> None:
     """
     블로그 글 본문을 입력합니다.
     스마트에디터 ONE은 iframe 없이 직접 contenteditable을 사용합니다.
@@ -207,10 +450,15 @@ async def fill_post_content(page: Page, content: str, use_html: bool = False) ->
         page: Playwright Page 객체
         content: 글 본문 내용
         use_html: HTML 모드로 입력할지 여부 (기본: False, 텍스트 모드)
+        input_mode: 본문 입력 방식 ("auto", "paste", "insert_text", "type").
+            None이면 config.CONTENT_INPUT_MODE 사용
 
     Raises:
         NaverBlogPostError: 본문 입력 실패 시
     """
+    if input_mode is None:
+        input_mode = config.CONTENT_INPUT_MODE
+
     try:
         # 팝업이 있으면 먼저 닫기
         try:
@@ -220,13 +468,11 @@ async def fill_post_content(page: Page, content: str, use_html: bool = False) ->
                 "button.se-popup-button-confirm",
                 ".se-popup-button-confirm",
             ]
-            for popup_selector in popup_selectors:
-                popup_count = await page.locator(popup_selector).count()
-                if popup_count > 0:
-                    await page.click(popup_selector, timeout=2000)
-                    print(f"   팝업 닫기: {popup_selector}")
-                    await asyncio.sleep(0.5)
-                    break
+            popup_selector = await race_selectors(page, popup_selectors, "popup")
+            if popup_selector:
+                await page.click(popup_selector, timeout=2000)
+                print(f"   팝업 닫기: {popup_selector}")
+                await wait_for_hidden(page, popup_selector)
         except Exception as e:
             print(f"   팝업 확인 실패 (무시): {e}")
 
@@ -235,54 +481,55 @@ async def fill_post_content(page: Page, content: str, use_html: bool = False) ->
         # 방법 1: iframe이 있는 경우 (구형 스마트에디터)
         iframe_selectors = POST_WRITE_CONTENT_FRAME if isinstance(POST_WRITE_CONTENT_FRAME, list) else [POST_WRITE_CONTENT_FRAME]
 
-        for iframe_selector in iframe_selectors:
+        async for iframe_selector in matching_selectors(page, iframe_selectors, "content_frame"):
             try:
-                iframe_count = await page.locator(iframe_selector).count()
-                if iframe_count > 0:
-                    print(f"   iframe 발견: {iframe_selector}")
-                    frame_element = await page.wait_for_selector(iframe_selector, timeout=5000)
-                    iframe_found = await frame_element.content_frame()
-
-                    if iframe_found:
-                        # iframe 내부 팝업 닫기
-                        try:
-                            iframe_popup_selectors = [
-                                "button:has-text('확인')",
-                                "button:has-text('닫기')",
-                                ".se-popup-button-confirm",
-                            ]
-                            for popup_sel in iframe_popup_selectors:
-                                popup_count = await iframe_found.locator(popup_sel).count()
-                                if popup_count > 0:
-                                    await iframe_found.locator(popup_sel).click(timeout=2000)
-                                    print(f"   iframe 내부 팝업 닫기: {popup_sel}")
-                                    await asyncio.sleep(0.5)
-                                    break
-                        except Exception as e:
-                            print(f"   iframe 팝업 닫기 실패 (무시): {e}")
-
-                        # iframe 내부에서 contenteditable 찾기
-                        body_selectors = POST_WRITE_CONTENT_BODY if isinstance(POST_WRITE_CONTENT_BODY, list) else [POST_WRITE_CONTENT_BODY]
+                print(f"   iframe 발견: {iframe_selector}")
+                frame_element = await page.wait_for_selector(iframe_selector, timeout=5000)
+                iframe_found = await frame_element.content_frame()
 
-                        for body_selector in body_selectors:
-                            try:
-                                content_body = await iframe_found.wait_for_selector(body_selector, timeout=3000)
-                                if content_body:
-                                    await content_body.click()
-                                    await asyncio.sleep(0.5)
-                                    await content_body.type(content, delay=10)
-                                    content_filled = True
-                                    logger.info(f"본문 입력 완료 (iframe 방식, selector: {body_selector})")
-                                    break
-                            except Exception as e:
-                                print(f"   iframe 내부 셀렉터 {body_selector} 실패: {e}")
-                                continue
+                if iframe_found:
+                    # iframe 내부 팝업 닫기
+                    try:
+                        iframe_popup_selectors = [
+                            "button:has-text('확인')",
+                            "button:has-text('닫기')",
+                            ".se-popup-button-confirm",
+                        ]
+                        popup_sel = await race_selectors(iframe_found, iframe_popup_selectors, "iframe_popup")
+                        if popup_sel:
+                            await iframe_found.locator(popup_sel).click(timeout=2000)
+                            print(f"   iframe 내부 팝업 닫기: {popup_sel}")
+                            await wait_for_hidden(iframe_found, popup_sel)
+                    except Exception as e:
+                        print(f"   iframe 팝업 닫기 실패 (무시): {e}")
+
+                    # iframe 내부에서 contenteditable 찾기
+                    body_selectors = POST_WRITE_CONTENT_BODY if isinstance(POST_WRITE_CONTENT_BODY, list) else [POST_WRITE_CONTENT_BODY]
+
+                    # 셀렉터마다 따로 기다리지 않고 어느 하나가 나타날 때까지 한 번만 대기
+                    try:
+                        await iframe_found.wait_for_selector(", ".join(body_selectors), timeout=3000)
+                    except PlaywrightTimeout:
+                        print("   iframe 내부 본문 영역 대기 시간 초과")
 
-                        if content_filled:
-                            # iframe에서 메인 페이지로 포커스 전환
-                            await page.evaluate("() => { window.focus(); }")
-                            await asyncio.sleep(0.5)
+                    async for body_selector in matching_selectors(iframe_found, body_selectors, "content_frame_body"):
+                        try:
+                            content_body = iframe_found.locator(body_selector).first
+                            await content_body.click()
+                            method = await insert_content(
+                                page, content_body, content, mode=input_mode
+                            )
+                            content_filled = True
+                            logger.info(f"본문 입력 완료 (iframe 방식, selector: {body_selector}, {method})")
                             break
+                        except Exception as e:
+                            print(f"   iframe 내부 셀렉터 {body_selector} 실패: {e}")
+                            continue
+
+                    if content_filled:
+                        # iframe에서 메인 페이지로 포커스 전환
+                        await page.evaluate("() => { window.focus(); }")
+                        break
             except:
                 continue
 
@@ -298,23 +545,21 @@ async def fill_post_content(page: Page, content: str, use_html: bool = False) ->
                 "div:has-text('글감과 함께')",  # 플레이스홀더 텍스트로 찾기
             ]
 
-            for selector in content_selectors:
+            async for selector in matching_selectors(page, content_selectors, "content_body"):
                 try:
-                    element_count = await page.locator(selector).count()
-                    if element_count > 0:
-                        element = page.locator(selector).first
-                        await element.click()
-                        await asyncio.sleep(0.5)
-
-                        # 기존 플레이스홀더 텍스트 제거
-                        await page.keyboard.press("Control+A")
-                        await asyncio.sleep(0.2)
-
-                        # 본문 입력
-                        await page.keyboard.type(content, delay=10)
-                        content_filled = True
-                        logger.info(f"본문 입력 완료 (직접 방식, selector: {selector})")
-                        break
+                    element = page.locator(selector).first
+                    await element.click()
+
+                    # 기존 플레이스홀더 텍스트 제거
+                    await page.keyboard.press("Control+A")
+
+                    # 본문 입력
+                    method = await insert_content(
+                        page, element, content, mode=input_mode
+                    )
+                    content_filled = True
+                    logger.info(f"본문 입력 완료 (직접 방식, selector: {selector}, {method})")
+                    break
                 except Exception as e:
                     print(f"   셀렉터 {selector} 실패: {e}")
                     continue
@@ -322,14 +567,50 @@ async def fill_post_content(page: Page, content: str, use_html: bool = False) ->
         if not content_filled:
             raise NaverBlogPostError("본문 입력 영역을 찾을 수 없습니다.")
 
-        await asyncio.sleep(1)
-
     except PlaywrightTimeout as e:
         raise NaverBlogPostError(f"본문 입력 시간 초과: {str(e)}")
     except Exception as e:
         raise NaverBlogPostError(f"본문 입력 중 오류: {str(e)}")
 
 
+# 발행 버튼을 누른 프레임만 기다리는 시간 (이후 전체 프레임 검사와 경쟁, 초)
+PUBLISH_DIALOG_HEAD_START = 0.25
+
+
+async def _wait_for_publish_dialog(page: Page, frame: Frame, timeout: int = 5000) -> Frame:
+    """
+    발행 대화상자가 나타난 프레임을 반환합니다.
+
+    발행 버튼을 누른 프레임을 먼저 기다리고, 잠시(PUBLISH_DIALOG_HEAD_START)
+    안에 나타나지 않으면 전체 프레임 검사를 함께 시작해 먼저 찾은 쪽을 씁니다.
+    대화상자가 다른 프레임에 떠도 기다리는 시간은 늘어나지 않습니다.
+
+    Raises:
+        PlaywrightTimeout: timeout 안에 어느 프레임에도 나타나지 않은 경우
+    """
+    own = asyncio.ensure_future(
+        frame.wait_for_selector(PUBLISH_DIALOG_SELECTOR, state="visible", timeout=timeout)
+    )
+    waiters = {own}
+    try:
+        await asyncio.wait(waiters, timeout=PUBLISH_DIALOG_HEAD_START)
+        if not own.done() or own.exception() is not None:
+            logger.debug("발행 버튼 프레임에 대화상자가 아직 없어 전체 프레임 검사와 경쟁")
+            remaining = max(1, timeout - int(PUBLISH_DIALOG_HEAD_START * 1000))
+            waiters.add(asyncio.ensure_future(wait_for_dialog(page, timeout=remaining)))
+
+        while waiters:
+            done, waiters = await asyncio.wait(waiters, return_when=asyncio.FIRST_COMPLETED)
+            for waiter in done:
+                if waiter.exception() is None:
+                    return frame if waiter is own else waiter.result()
+        raise PlaywrightTimeout(f"Timeout {timeout}ms exceeded waiting for the publish dialog")
+    finally:
+        for waiter in waiters:
+            waiter.cancel()
+
+
+@traced("publish")
 async def publish_post(
     page: Page, wait_for_completion: bool = True, timeout: int = 30000
 ) -> Dict[str, Any]:
@@ -357,7 +638,6 @@ async def publish_post(
         # 명시적으로 메인 페이지로 전환
         await page.bring_to_front()
         await page.evaluate("() => { if (window.parent) { window.parent.focus(); } window.focus(); }")
-        await asyncio.sleep(1)
 
         # 페이지가 실제로 로드되었는지 확인
         print(f"   현재 URL: {page.url}")
@@ -373,15 +653,13 @@ async def publish_post(
                 "button.se-popup-close",
                 ".se-popup-dim",  # 팝업 배경 클릭
             ]
-            for close_sel in popup_close_selectors:
-                popup_count = await page.locator(close_sel).count()
-                if popup_count > 0:
-                    try:
-                        await page.locator(close_sel).first.click(timeout=2000)
-                        print(f"   페이지 팝업 닫기: {close_sel}")
-                        await asyncio.sleep(0.5)
-                    except Exception:
-                        pass
+            async for close_sel in matching_selectors(page, popup_close_selectors, "page_popup"):
+                try:
+                    await page.locator(close_sel).first.click(timeout=2000)
+                    print(f"   페이지 팝업 닫기: {close_sel}")
+                    await wait_for_hidden(page, close_sel)
+                except Exception:
+                    pass
         except Exception:
             pass
 
@@ -412,9 +690,11 @@ async def publish_post(
         else:
             publish_selectors.insert(0, POST_WRITE_PUBLISH_BTN)
 
-        # 1. 모든 iframe에서 발행 버튼 찾기
-        all_frames = page.frames
-        for idx, frame in enumerate(all_frames):
+        # 1. 에디터 프레임부터 발행 버튼 찾기 (없을 때만 나머지 프레임)
+        publish_frame = None
+        probed = 0
+        for idx, frame in enumerate(frames_to_probe(page)):
+            probed += 1
             try:
                 # Frame 내부의 도움말 팝업 닫기
                 help_popup_selectors = [
@@ -422,56 +702,59 @@ async def publish_post(
                     "button:has-text('닫기')",
                     ".se-help-close",
                 ]
-                for help_sel in help_popup_selectors:
-                    help_count = await frame.locator(help_sel).count()
-                    if help_count > 0:
-                        await frame.locator(help_sel).first.click(timeout=2000)
-                        await asyncio.sleep(0.5)
-                        break
+                help_sel = await race_selectors(frame, help_popup_selectors, "help_popup")
+                if help_sel:
+                    await frame.locator(help_sel).first.click(timeout=2000)
+                    await wait_for_hidden(frame, help_sel)
 
                 # 발행 버튼 찾기 (우선순위: 발행 > 글쓰기)
                 search_texts = ["발행", "글쓰기"]
-                for search_text in search_texts:
-                    write_btn_count = await frame.locator(f"button:has-text('{search_text}'):visible").count()
-                    if write_btn_count > 0:
-                        element = frame.locator(f"button:has-text('{search_text}'):visible").first
-                        await element.click(timeout=5000)
-                        publish_clicked = True
-                        logger.info(f"발행 버튼 클릭 성공 (Frame {idx})")
-                        await asyncio.sleep(2)
-                        break
-
-                if publish_clicked:
+                button_sel = await race_selectors(
+                    frame,
+                    [f"button:has-text('{search_text}'):visible" for search_text in search_texts],
+                    "publish_btn",
+                )
+                if button_sel:
+                    await frame.locator(button_sel).first.click(timeout=5000)
+                    publish_clicked = True
+                    publish_frame = frame
+                    logger.info(f"발행 버튼 클릭 성공 (Frame {idx}: {frame.name or frame.url})")
                     break
             except Exception:
                 continue
+        count_probed_frames("publish_btn", probed)
 
         if not publish_clicked:
             await page.screenshot(path="playwright-state/error_publish_btn.png")
             raise NaverBlogPostError("발행 버튼을 찾을 수 없습니다.")
 
         # 2. 발행 설정 대화상자에서 최종 "발행" 버튼 클릭
+        dialog_frame = publish_frame
         if publish_clicked:
             try:
-                await asyncio.sleep(1)  # 대화상자 로딩 대기
+                # 대화상자가 나타날 때까지 대기하고, 나타난 프레임부터 시도
+                try:
+                    with span("publish.dialog"):
+                        dialog_frame = await _wait_for_publish_dialog(page, publish_frame)
+                except PlaywrightTimeout:
+                    logger.warning("발행 대화상자 대기 시간 초과")
 
                 # 대화상자 내 발행 버튼을 force=True로 클릭 시도
                 final_publish_clicked = False
-                for idx, frame in enumerate(page.frames):
+                probed = 0
+                for idx, frame in enumerate(frames_to_probe(page, preferred=dialog_frame)):
+                    probed += 1
                     try:
                         dialog_publish_selectors = [
                             ".layer_popup__i0QOY button[class*='confirm']:has-text('발행')",
                             ".layer_popup__i0QOY button:has-text('발행')",
                         ]
 
-                        for selector in dialog_publish_selectors:
+                        async for selector in matching_selectors(frame, dialog_publish_selectors, "dialog_publish_btn"):
                             try:
-                                btn_count = await frame.locator(selector).count()
-                                if btn_count > 0:
-                                    await frame.locator(selector).first.click(force=True, timeout=5000)
-                                    final_publish_clicked = True
-                                    await asyncio.sleep(2)
-                                    break
+                                await frame.locator(selector).first.click(force=True, timeout=5000)
+                                final_publish_clicked = True
+                                break
                             except Exception:
                                 continue
 
@@ -479,10 +762,12 @@ async def publish_post(
                             break
                     except Exception:
                         continue
+                count_probed_frames("publish_dialog", probed)
 
                 # JavaScript로 대화상자 내 발행 버튼 클릭 (fallback)
                 if not final_publish_clicked:
-                    for frame in page.frames:
+                    for frame in frames_to_probe(page, preferred=dialog_frame):
+                        count_probed_frames("publish_dialog_js")
                         try:
                             result = await frame.evaluate("""
                                 () => {
@@ -500,7 +785,6 @@ async def publish_post(
                                 }
                             """)
                             if 'Clicked' in result:
-                                await asyncio.sleep(3)
                                 break
                         except Exception:
                             continue
@@ -513,7 +797,8 @@ async def publish_post(
             try:
                 # 발행 후 글 보기 페이지로 리다이렉트되는지 확인
                 # URL 패턴: https://blog.naver.com/{blog_id}/{post_id}
-                await page.wait_for_url("**/blog.naver.com/*/**", timeout=timeout)
+                with span("publish.redirect"):
+                    await page.wait_for_url("**/blog.naver.com/*/**", timeout=timeout)
                 post_url = page.url
 
                 # PostView 페이지인지 확인 (본문 영역이 있는지)
@@ -532,6 +817,8 @@ async def publish_post(
             except PlaywrightTimeout:
                 raise NaverBlogPostError("발행 완료 대기 시간 초과")
         else:
+            # 대화상자가 닫혀 발행 요청이 전송될 때까지만 대기
+            await wait_for_hidden(dialog_frame, PUBLISH_DIALOG_SELECTOR, timeout=5000)
             return {
                 "success": True,
                 "message": "발행 요청을 전송했습니다.",
@@ -549,6 +836,7 @@ async def create_blog_post(
     blog_id: Optional[str] = None,
     use_html: bool = False,
     wait_for_completion: bool = True,
+    category_no: Optional[str] = None,
 ) -> Dict[str, Any]:
     """
     네이버 블로그에 새 글을 작성하고 발행하는 전체 프로세스.
@@ -560,6 +848,7 @@ async def create_blog_post(
         blog_id: 블로그 ID (옵션)
         use_html: HTML 모드로 본문 입력할지 여부
         wait_for_completion: 발행 완료를 기다릴지 여부
+        category_no: 글을 등록할 카테고리 번호 (옵션)
 
     Returns:
         발행 결과 딕셔너리
@@ -573,23 +862,32 @@ async def create_blog_post(
     Raises:
         NaverBlogPostError: 글 작성 실패 시
     """
-    try:
-        # 1. 글쓰기 페이지로 이동
-        await navigate_to_post_write_page(page, blog_id)
+    # 단계별 span은 각 함수가 기록 (Tool 호출에서 이미 기록 중이면 그쪽에 합쳐짐)
+    with recording("create_post"):
+        try:
+            # 1. 글쓰기 페이지로 이동
+            await navigate_to_post_write_page(page, blog_id, category_no=category_no)
 
-        # 2. 제목 입력
-        await fill_post_title(page, title)
+            # 2. 제목 입력
+            await fill_post_title(page, title)
 
-        # 3. 본문 입력
-        await fill_post_content(page, content, use_html)
+            # 3. 본문 입력
+            await fill_post_content(page, content, use_html)
 
-        # 4. 발행
-        result = await publish_post(page, wait_for_completion)
+            # 4. 발행
+            result = await publish_post(page, wait_for_completion)
 
-        result["title"] = title
-        return result
+            result["title"] = title
 
-    except NaverBlogPostError:
-        raise
-    except Exception as e:
-        raise NaverBlogPostError(f"글 작성 중 오류: {str(e)}")
+            # 페이지를 반납하면 이 탭에 다음 글쓰기 에디터를 다시 열어 둠
+            if config.RECYCLE_EDITOR and result.get("success"):
+                _recycle_pages.add(page)
+            return result
+
+        except NaverBlogPostError:
+            raise
+        except Exception as e:
+            raise NaverBlogPostError(f"글 작성 중 오류: {str(e)}")
+        finally:
+            # 에디터 프레임 캐시는 글 하나 동안만 사용
+            forget_editor_frame(page)
@@ -0,0 +1,208 @@
+"""페이지 준비 상태 대기 함수.
+
+고정된 `asyncio.sleep()` 대신 DOM/네트워크 신호를 기다려
+페이지가 실제로 필요한 만큼만 대기합니다.
+"""
+
+import asyncio
+import logging
+from typing import Union
+
+from playwright.async_api import Page, Frame, TimeoutError as PlaywrightTimeout
+
+from .selectors import LOGIN_ID_INPUT
+
+logger = logging.getLogger(__name__)
+
+
+# 에디터가 입력 가능한 상태임을 나타내는 요소 (스마트에디터 ONE / 구형 에디터)
+EDITOR_READY_SELECTOR = (
+    "div[contenteditable='true'][data-placeholder='제목'], "
+    ".se-content [contenteditable='true'], "
+    "input[placeholder*='제목'], "
+    "#title"
+)
+
+# 발행 설정 대화상자의 최종 발행 버튼
+PUBLISH_DIALOG_SELECTOR = ".layer_popup__i0QOY button:has-text('발행')"
+
+# 업로드 진행 중임을 나타내는 요소
+UPLOAD_PROGRESS_SELECTOR = ".se-image-loading, .se-loading, [class*='uploading']"
+
+_UPLOAD_SETTLED_SCRIPT = """
+({ selectors, expected, progressSelector }) => {
+    const count = Math.max(
+        ...selectors.map((selector) => document.querySelectorAll(selector).length)
+    );
+    return count >= expected && !document.querySelector(progressSelector);
+}
+"""
+
+
+async def wait_for_selector_in_frames(
+    page: Page,
+    selector: str,
+    timeout: int = 10000,
+    state: str = "visible",
+) -> Frame:
+    """
+    페이지의 모든 프레임 중 하나에서 셀렉터가 나타날 때까지 대기합니다.
+
+    대기 중에 새로 붙는 iframe(예: iframe#mainFrame)도 감시합니다.
+
+    Args:
+        page: Playwright Page 객체
+        selector: 대기할 셀렉터
+        timeout: 전체 타임아웃 (ms)
+        state: 요소 상태 ("visible", "attached")
+
+    Returns:
+        셀렉터가 나타난 Frame
+
+    Raises:
+        PlaywrightTimeout: 타임아웃 내에 나타나지 않은 경우
+    """
+    loop = asyncio.get_running_loop()
+    deadline = loop.time() + timeout / 1000
+    waiters: dict[Frame, asyncio.Future] = {}
+
+    try:
+        while True:
+            for frame in page.frames:
+                if frame not in waiters and not frame.is_detached():
+                    waiters[frame] = asyncio.ensure_future(
+                        frame.wait_for_selector(selector, state=state, timeout=timeout)
+                    )
+
+            remaining = deadline - loop.time()
+            if remaining <= 0:
+                raise PlaywrightTimeout(
+                    f"Timeout {timeout}ms exceeded waiting for '{selector}' in any frame"
+                )
+
+            pending = [w for w in waiters.values() if not w.done()]
+            if pending:
+                # 새 프레임 감시를 위해 짧게 끊어서 대기
+                await asyncio.wait(
+                    pending,
+                    timeout=min(remaining, 0.25),
+                    return_when=asyncio.FIRST_COMPLETED,
+                )
+            else:
+                await asyncio.sleep(min(remaining, 0.25))
+
+            for frame, waiter in waiters.items():
+                if waiter.done() and not waiter.cancelled():
+                    if waiter.exception() is None:
+                        return frame
+    finally:
+        for waiter in waiters.values():
+            if not waiter.done():
+                waiter.cancel()
+
+
+async def wait_for_editor_ready(page: Page, timeout: int = 15000) -> Frame:
+    """
+    글쓰기 에디터의 입력란이 나타날 때까지 대기합니다.
+
+    Args:
+        page: Playwright Page 객체
+        timeout: 타임아웃 (ms)
+
+    Returns:
+        에디터가 있는 Frame (메인 프레임 또는 iframe)
+
+    Raises:
+        PlaywrightTimeout: 에디터가 준비되지 않은 경우
+    """
+    frame = await wait_for_selector_in_frames(
+        page, EDITOR_READY_SELECTOR, timeout=timeout
+    )
+    logger.debug(f"Editor ready in frame: {frame.url}")
+    return frame
+
+
+async def wait_for_dialog(
+    page: Page,
+    selector: str = PUBLISH_DIALOG_SELECTOR,
+    timeout: int = 5000,
+) -> Frame:
+    """
+    대화상자(레이어 팝업)가 나타날 때까지 대기합니다.
+
+    Args:
+        page: Playwright Page 객체
+        selector: 대화상자 또는 대화상자 내부 버튼 셀렉터
+        timeout: 타임아웃 (ms)
+
+    Returns:
+        대화상자가 있는 Frame
+
+    Raises:
+        PlaywrightTimeout: 대화상자가 나타나지 않은 경우
+    """
+    return await wait_for_selector_in_frames(page, selector, timeout=timeout)
+
+
+async def wait_for_hidden(
+    scope: Union[Page, Frame],
+    selector: str,
+    timeout: int = 2000,
+) -> bool:
+    """
+    팝업 등이 사라질 때까지 대기합니다. 타임아웃은 무시합니다.
+
+    Args:
+        scope: Page 또는 Frame
+        selector: 사라지기를 기다릴 셀렉터
+        timeout: 타임아웃 (ms)
+
+    Returns:
+        타임아웃 내에 사라졌는지 여부
+    """
+    try:
+        await scope.locator(selector).first.wait_for(state="hidden", timeout=timeout)
+        return True
+    except PlaywrightTimeout:
+        return False
+
+
+async def wait_for_upload_settled(
+    frame: Frame,
+    selectors: Union[str, list[str]],
+    expected_count: int,
+    timeout: int = 10000,
+) -> None:
+    """
+    에디터에 이미지가 expected_count개 이상 삽입되고
+    업로드 진행 표시가 사라질 때까지 대기합니다.
+
+    Args:
+        frame: 에디터 Frame
+        selectors: 업로드된 이미지 셀렉터 (CSS, 여러 개면 가장 많이 잡힌 개수 사용)
+        expected_count: 기대하는 이미지 개수
+        timeout: 타임아웃 (ms)
+
+    Raises:
+        PlaywrightTimeout: 타임아웃 내에 업로드가 끝나지 않은 경우
+    """
+    await frame.wait_for_function(
+        _UPLOAD_SETTLED_SCRIPT,
+        arg={
+            "selectors": [selectors] if isinstance(selectors, str) else selectors,
+            "expected": expected_count,
+            "progressSelector": UPLOAD_PROGRESS_SELECTOR,
+        },
+        timeout=timeout,
+    )
+
+
+async def wait_for_login_form(page: Page, timeout: int = 10000) -> None:
+    """
+    로그인 폼의 아이디 입력란이 나타날 때까지 대기합니다.
+
+    Args:
+        page: Playwright Page 객체
+        timeout: 타임아웃 (ms)
+    """
+    await page.wait_for_selector(LOGIN_ID_INPUT, state="visible", timeout=timeout)
@@ -0,0 +1,200 @@
+"""에디터 본문 고속 입력 엔진.
+
+글자마다 키 이벤트를 보내는 `type()` 대신, 붙여넣기 이벤트나
+`Input.insertText`로 본문을 한 번에 넣습니다. 키 입력 방식은
+다른 방법이 모두 실패했을 때만 사용합니다.
+"""
+
+import logging
+import re
+from typing import Union
+
+from playwright.async_api import Page, Locator, ElementHandle
+
+logger = logging.getLogger(__name__)
+
+# 입력 방식 (auto는 paste → insert_text → type 순서로 시도)
+INPUT_MODES = ("auto", "paste", "insert_text", "type")
+
+# 키 입력 폴백 시 글자당 딜레이 (ms)
+TYPE_DELAY_MS = 10
+
+EditorTarget = Union[Locator, ElementHandle]
+
+# 스마트에디터 ONE은 paste 이벤트를 직접 처리(preventDefault)하므로
+# DataTransfer를 담은 합성 ClipboardEvent로 본문 전체를 넘길 수 있습니다.
+_PASTE_SCRIPT = """
+(el, items) => {
+    el.focus();
+    const data = new DataTransfer();
+    for (const [type, value] of Object.entries(items)) {
+        data.setData(type, value);
+    }
+    const event = new ClipboardEvent('paste', {
+        clipboardData: data,
+        bubbles: true,
+        cancelable: true,
+    });
+    el.dispatchEvent(event);
+    return event.defaultPrevented;
+}
+"""
+
+_TEXT_LENGTH_SCRIPT = "(el) => (el.innerText || el.textContent || '').length"
+
+_CONTAINS_SCRIPT = """
+(el, probes) => {
+    const text = (el.innerText || el.textContent || '').replace(/\\s+/g, '');
+    return probes.every((probe) => text.includes(probe));
+}
+"""
+
+
+def _build_probes(content: str, probe_length: int = 30) -> list[str]:
+    """입력 확인용으로 본문 앞/뒤 일부를 공백 없이 잘라냅니다."""
+    compact = re.sub(r"\s+", "", content)
+    if not compact:
+        return []
+    return [compact[:probe_length], compact[-probe_length:]]
+
+
+async def _text_length(target: EditorTarget) -> int:
+    try:
+        return await target.evaluate(_TEXT_LENGTH_SCRIPT)
+    except Exception:
+        return -1
+
+
+async def _contains_content(target: EditorTarget, content: str) -> bool:
+    probes = _build_probes(content)
+    if not probes:
+        return True
+    try:
+        return await target.evaluate(_CONTAINS_SCRIPT, probes)
+    except Exception:
+        return False
+
+
+async def paste_text(target: EditorTarget, content: str) -> bool:
+    """
+    합성 paste 이벤트로 본문을 넣습니다.
+
+    Args:
+        target: 포커스를 받을 contenteditable 요소
+        content: 입력할 텍스트
+
+    Returns:
+        에디터가 paste 이벤트를 처리했는지 여부
+    """
+    return await target.evaluate(_PASTE_SCRIPT, {"text/plain": content})
+
+
+async def paste_html(target: EditorTarget, html: str, text: str = "") -> bool:
+    """
+    합성 paste 이벤트로 HTML 조각을 넣습니다.
+
+    Args:
+        target: 포커스를 받을 contenteditable 요소
+        html: text/html로 전달할 HTML
+        text: 함께 전달할 text/plain 대체 텍스트
+
+    Returns:
+        에디터가 paste 이벤트를 처리했는지 여부
+    """
+    return await target.evaluate(_PASTE_SCRIPT, {"text/html": html, "text/plain": text})
+
+
+async def insert_text_lines(page: Page, content: str) -> None:
+    """
+    `Input.insertText`로 줄 단위 입력합니다.
+
+    줄바꿈은 Enter 키로 보내 에디터가 문단을 나누도록 합니다.
+    왕복 횟수는 글자 수가 아니라 줄 수에 비례합니다.
+
+    Args:
+        page: 포커스된 요소가 있는 Playwright Page 객체
+        content: 입력할 텍스트
+    """
+    lines = content.split("\n")
+    for idx, line in enumerate(lines):
+        if line:
+            await page.keyboard.insert_text(line)
+        if idx < len(lines) - 1:
+            await page.keyboard.press("Enter")
+
+
+async def type_text(page: Page, content: str, delay: int = TYPE_DELAY_MS) -> None:
+    """
+    글자 단위 키 입력 (폴백 경로).
+
+    Args:
+        page: 포커스된 요소가 있는 Playwright Page 객체
+        content: 입력할 텍스트
+        delay: 글자당 딜레이 (ms)
+    """
+    await page.keyboard.type(content, delay=delay)
+
+
+async def insert_content(
+    page: Page,
+    target: EditorTarget,
+    content: str,
+    mode: str = "auto",
+) -> str:
+    """
+    포커스된 에디터 요소에 본문을 입력합니다.
+
+    auto 모드에서는 paste → insert_text → type 순서로 시도하며,
+    입력 후 에디터 텍스트를 확인해 실제로 들어갔을 때만 성공으로 봅니다.
+    확인에 실패했더라도 에디터 내용이 바뀌었다면 중복 입력을 막기 위해
+    다음 방식으로 넘어가지 않습니다.
+
+    Args:
+        page: Playwright Page 객체 (키보드 입력용)
+        target: 본문 contenteditable 요소 (클릭/포커스된 상태)
+        content: 입력할 텍스트
+        mode: 입력 방식 ("auto", "paste", "insert_text", "type")
+
+    Returns:
+        실제로 사용된 입력 방식
+
+    Raises:
+        ValueError: 지원하지 않는 입력 방식
+    """
+    if mode not in INPUT_MODES:
+        raise ValueError(f"지원하지 않는 입력 방식: {mode} (가능: {INPUT_MODES})")
+
+    if mode == "type":
+        await type_text(page, content)
+        return "type"
+
+    methods = ["paste", "insert_text"] if mode == "auto" else [mode]
+
+    for method in methods:
+        before = await _text_length(target)
+        try:
+            if method == "paste":
+                await paste_text(target, content)
+            else:
+                await insert_text_lines(page, content)
+        except Exception as e:
+            logger.debug(f"Content input via {method} failed: {e}")
+            continue
+
+        if await _contains_content(target, content):
+            logger.info(f"본문 고속 입력 완료 ({method}, {len(content)}자)")
+            return method
+
+        after = await _text_length(target)
+        if after != before:
+            # 일부만 들어갔을 수 있지만, 다시 입력하면 중복되므로 여기서 멈춤
+            logger.warning(f"본문 입력 확인 실패 ({method}), 에디터 내용은 변경됨")
+            return method
+
+        logger.debug(f"Editor ignored {method} input, trying next method")
+
+    if mode != "auto":
+        logger.warning(f"{mode} 입력이 반영되지 않아 키 입력으로 대체합니다")
+
+    await type_text(page, content)
+    return "type"
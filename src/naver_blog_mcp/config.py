@@ -18,6 +18,9 @@ class Config:
     NAVER_BLOG_ID: str = os.getenv("NAVER_BLOG_ID", "")
     NAVER_BLOG_PASSWORD: str = os.getenv("NAVER_BLOG_PASSWORD", "")
 
+    # 추가 계정 ("아이디:비밀번호"를 쉼표로 구분, Tool 호출 시 account로 선택)
+    NAVER_BLOG_ACCOUNTS: str = os.getenv("NAVER_BLOG_ACCOUNTS", "")
+
     # Playwright 설정
     HEADLESS: bool = os.getenv("HEADLESS", "true").lower() == "true"
     SLOW_MO: int = int(os.getenv("SLOW_MO", "0"))
@@ -31,6 +34,93 @@ class Config:
     )
     SESSION_VALIDITY_HOURS: int = int(os.getenv("SESSION_VALIDITY_HOURS", "24"))
 
+    # 세션 유지 (백그라운드 검증/갱신 간격, 0이면 사용 안 함)
+    SESSION_KEEPALIVE_INTERVAL_SECONDS: int = int(
+        os.getenv("SESSION_KEEPALIVE_INTERVAL_SECONDS", "1800")
+    )
+    SESSION_KEEPALIVE_JITTER: float = float(os.getenv("SESSION_KEEPALIVE_JITTER", "0.2"))
+
+    # 페이지 풀 설정 (동시에 실행할 수 있는 Tool 호출 수)
+    PAGE_POOL_SIZE: int = int(os.getenv("PAGE_POOL_SIZE", "2"))
+
+    # 글 일괄 작성 (동시 작성 수는 PAGE_POOL_SIZE를 넘지 않음)
+    POST_BATCH_CONCURRENCY: int = int(os.getenv("POST_BATCH_CONCURRENCY", "2"))
+    POST_BATCH_MIN_INTERVAL_SECONDS: float = float(
+        os.getenv("POST_BATCH_MIN_INTERVAL_SECONDS", "5")
+    )
+    POST_BATCH_MAX_ITEMS: int = int(os.getenv("POST_BATCH_MAX_ITEMS", "50"))
+
+    # 서버 시작 후 글쓰기 에디터를 백그라운드에서 미리 열어 둘지 여부
+    WARMUP_EDITOR: bool = os.getenv("WARMUP_EDITOR", "false").lower() == "true"
+
+    # 글을 발행한 탭에 다음 글쓰기 에디터를 다시 열어 둠 (페이지 반납 시 백그라운드)
+    RECYCLE_EDITOR: bool = os.getenv("RECYCLE_EDITOR", "false").lower() == "true"
+
+    # 자동화에 필요 없는 요청 차단 (광고/통계/웹폰트, 컨텍스트를 만들 때 적용)
+    # route를 쓰면 HTTP 캐시가 꺼지므로 기본값은 사용 안 함
+    NETWORK_BLOCKING: bool = os.getenv("NETWORK_BLOCKING", "false").lower() == "true"
+    NETWORK_BLOCK_RESOURCE_TYPES: str = os.getenv(
+        "NETWORK_BLOCK_RESOURCE_TYPES", "font,media,ping"
+    )
+    NETWORK_ALLOWED_DOMAINS: str = os.getenv(
+        "NETWORK_ALLOWED_DOMAINS", "naver.com,naver.net,pstatic.net"
+    )
+    NETWORK_BLOCKED_HOSTS: str = os.getenv(
+        "NETWORK_BLOCKED_HOSTS", "lcs.naver.com,wcs.naver.net,veta.naver.com"
+    )
+
+    # 본문 입력 방식 (auto, paste, insert_text, type)
+    CONTENT_INPUT_MODE: str = os.getenv("CONTENT_INPUT_MODE", "auto").lower()
+
+    # 카테고리 캐시 설정
+    CATEGORY_CACHE_PATH: str = os.getenv(
+        "CATEGORY_CACHE_PATH", "playwright-state/categories.json"
+    )
+    CATEGORY_CACHE_TTL_SECONDS: int = int(
+        os.getenv("CATEGORY_CACHE_TTL_SECONDS", "3600")
+    )
+
+    # 이미지 업로드 설정
+    IMAGE_UPLOAD_BATCH: bool = os.getenv("IMAGE_UPLOAD_BATCH", "true").lower() == "true"
+    IMAGE_UPLOAD_BATCH_SIZE: int = int(os.getenv("IMAGE_UPLOAD_BATCH_SIZE", "10"))
+
+    # 이미지 전처리 설정 (리사이즈, 재압축, 메타데이터 제거)
+    IMAGE_PREPROCESS: bool = os.getenv("IMAGE_PREPROCESS", "false").lower() == "true"
+    IMAGE_MAX_EDGE: int = int(os.getenv("IMAGE_MAX_EDGE", "2048"))
+    IMAGE_QUALITY: int = int(os.getenv("IMAGE_QUALITY", "85"))
+    IMAGE_PREPROCESS_WORKERS: int = int(os.getenv("IMAGE_PREPROCESS_WORKERS", "0"))
+    IMAGE_PREPROCESS_DIR: str = os.getenv(
+        "IMAGE_PREPROCESS_DIR", "playwright-state/preprocessed"
+    )
+
+    # 업로드 이미지 캐시 (같은 이미지는 재업로드 없이 URL로 재삽입)
+    IMAGE_CACHE_ENABLED: bool = os.getenv("IMAGE_CACHE_ENABLED", "false").lower() == "true"
+    IMAGE_CACHE_PATH: str = os.getenv(
+        "IMAGE_CACHE_PATH", "playwright-state/image_cache.json"
+    )
+    IMAGE_CACHE_MAX_ENTRIES: int = int(os.getenv("IMAGE_CACHE_MAX_ENTRIES", "1000"))
+
+    # 대체 셀렉터 적중 통계 (연속으로 빗나가는 셀렉터는 목록 뒤로)
+    SELECTOR_STATS_ENABLED: bool = os.getenv("SELECTOR_STATS_ENABLED", "true").lower() == "true"
+    SELECTOR_STATS_PATH: str = os.getenv(
+        "SELECTOR_STATS_PATH", "playwright-state/selector_stats.json"
+    )
+    SELECTOR_DEMOTE_AFTER: int = int(os.getenv("SELECTOR_DEMOTE_AFTER", "3"))
+
+    # Playwright Trace 설정 (off, on_failure, sampled, full)
+    TRACE_MODE: str = os.getenv("TRACE_MODE", "on_failure").lower()
+    TRACE_SAMPLE_RATE: float = float(os.getenv("TRACE_SAMPLE_RATE", "0.1"))
+    TRACE_DIR: str = os.getenv("TRACE_DIR", "playwright-state/traces")
+    TRACE_MAX_DIR_MB: int = int(os.getenv("TRACE_MAX_DIR_MB", "500"))
+
+    # 단계별 소요 시간(span)을 Tool 결과에 포함할지 여부 (JSON 로그는 항상 기록)
+    DEBUG_TIMINGS: bool = os.getenv("DEBUG_TIMINGS", "false").lower() == "true"
+
+    # Prometheus 메트릭 HTTP 엔드포인트 (GET /metrics)
+    METRICS_ENABLED: bool = os.getenv("METRICS_ENABLED", "false").lower() == "true"
+    METRICS_HOST: str = os.getenv("METRICS_HOST", "127.0.0.1")
+    METRICS_PORT: int = int(os.getenv("METRICS_PORT", "9464"))
+
     # Playwright 브라우저 설정
     BROWSER_ARGS: list[str] = [
         "--disable-blink-features=AutomationControlled",
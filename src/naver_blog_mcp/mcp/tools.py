@@ -4,14 +4,18 @@
 """
 
 import logging
-from typing import Optional, Dict, Any
+from typing import Any, Awaitable, Callable, Dict, Optional
 
 from playwright.async_api import Page
 
 from ..automation.post_actions import create_blog_post, NaverBlogPostError
 from ..automation.image_upload import upload_images
 from ..automation.category_actions import get_categories
+from ..config import config
+from ..services.batch_queue import RateLimiter, run_batch
+from ..services.category_cache import category_cache
 from ..utils.retry import retry_on_error
+from ..utils.timing import span
 from ..utils.error_handler import handle_playwright_error
 from ..utils.exceptions import NaverBlogError, UploadError
 
@@ -51,10 +55,64 @@ TOOLS_METADATA = {
                     "description": "즉시 발행 여부 (기본: true, false면 임시저장)",
                     "default": True,
                 },
+                "account": {
+                    "type": "string",
+                    "description": "사용할 네이버 계정 아이디 (선택, 기본: NAVER_BLOG_ID)",
+                },
             },
             "required": ["title", "content"],
         },
     },
+    "naver_blog_create_posts_batch": {
+        "name": "naver_blog_create_posts_batch",
+        "description": (
+            "네이버 블로그에 여러 글을 한 번에 작성합니다. "
+            "글마다 성공/실패 결과를 돌려주며, 일부가 실패해도 나머지는 계속 작성합니다."
+        ),
+        "inputSchema": {
+            "type": "object",
+            "properties": {
+                "posts": {
+                    "type": "array",
+                    "description": "작성할 글 목록 (각 항목은 naver_blog_create_post 인자와 같음)",
+                    "items": {
+                        "type": "object",
+                        "properties": {
+                            "title": {"type": "string", "description": "글 제목"},
+                            "content": {"type": "string", "description": "글 본문 내용"},
+                            "category": {"type": "string", "description": "카테고리 이름 (선택)"},
+                            "tags": {
+                                "type": "array",
+                                "items": {"type": "string"},
+                                "description": "태그 목록 (선택)",
+                            },
+                            "images": {
+                                "type": "array",
+                                "items": {"type": "string"},
+                                "description": "첨부할 이미지 파일 경로 목록 (선택)",
+                            },
+                            "publish": {
+                                "type": "boolean",
+                                "description": "즉시 발행 여부 (기본: true)",
+                                "default": True,
+                            },
+                        },
+                        "required": ["title", "content"],
+                    },
+                },
+                "concurrency": {
+                    "type": "integer",
+                    "description": "동시에 작성할 글 수 (선택, 기본: POST_BATCH_CONCURRENCY, 최대 PAGE_POOL_SIZE)",
+                    "minimum": 1,
+                },
+                "account": {
+                    "type": "string",
+                    "description": "사용할 네이버 계정 아이디 (선택, 기본: NAVER_BLOG_ID)",
+                },
+            },
+            "required": ["posts"],
+        },
+    },
     # NOTE: 글 삭제 기능은 일단 비활성화 (필요시 추후 구현)
     # "naver_blog_delete_post": {
     #     "name": "naver_blog_delete_post",
@@ -75,7 +133,17 @@ TOOLS_METADATA = {
         "description": "네이버 블로그의 카테고리 목록을 가져옵니다.",
         "inputSchema": {
             "type": "object",
-            "properties": {},
+            "properties": {
+                "refresh": {
+                    "type": "boolean",
+                    "description": "캐시를 무시하고 블로그에서 다시 조회 (기본: false)",
+                    "default": False,
+                },
+                "account": {
+                    "type": "string",
+                    "description": "사용할 네이버 계정 아이디 (선택, 기본: NAVER_BLOG_ID)",
+                },
+            },
             "required": [],
         },
     },
@@ -96,6 +164,49 @@ def get_tools_list() -> list[dict]:
 # ============================================================================
 
 
+# 이보다 최근에 조회한 카테고리 목록은 이름이 없어도 다시 조회하지 않음 (초)
+CATEGORY_RECENT_FETCH_SECONDS = 60
+
+
+async def _resolve_category_no(
+    page: Page, blog_id: str, category: str
+) -> Optional[str]:
+    """카테고리 이름을 categoryNo로 변환합니다.
+
+    캐시에서 먼저 찾고, 캐시가 없거나 이름이 없을 때만 한 번 다시 조회합니다.
+    다시 조회해도 없는 이름은 캐시가 만료되거나 새로 조회될 때까지 기억해 두고
+    다시 조회하지 않습니다. 방금 조회한 목록에 없는 이름도 다시 조회하지 않습니다.
+
+    Args:
+        page: Playwright Page 객체 (로그인된 상태)
+        blog_id: 블로그 아이디
+        category: 카테고리 이름
+
+    Returns:
+        categoryNo (찾지 못하면 None)
+    """
+    category_no = category_cache.resolve_category_no(blog_id, category)
+    if category_no:
+        return category_no
+
+    if category_cache.is_missing(blog_id, category):
+        logger.info(f"최근 조회한 카테고리 목록에 없는 이름 (다시 조회 안 함): {category}")
+        return None
+
+    age = category_cache.age(blog_id)
+    if age is None or age >= CATEGORY_RECENT_FETCH_SECONDS:
+        result = await handle_list_categories(page, blog_id=blog_id, refresh=True)
+        if not result["success"]:
+            return None
+
+        category_no = category_cache.resolve_category_no(blog_id, category)
+        if category_no:
+            return category_no
+
+    category_cache.remember_missing(blog_id, category)
+    return None
+
+
 @retry_on_error
 async def handle_create_post(
     page: Page,
@@ -105,6 +216,7 @@ async def handle_create_post(
     tags: Optional[list[str]] = None,
     images: Optional[list[str]] = None,
     publish: bool = True,
+    blog_id: Optional[str] = None,
 ) -> Dict[str, Any]:
     """네이버 블로그에 새 글을 작성합니다.
 
@@ -116,12 +228,14 @@ async def handle_create_post(
         tags: 태그 목록 (선택)
         images: 첨부할 이미지 파일 경로 목록 (선택)
         publish: 즉시 발행 여부 (기본: True, False면 임시저장)
+        blog_id: page가 로그인된 계정의 블로그 아이디 (None이면 설정된 계정)
 
     Returns:
         작업 결과 딕셔너리
         {
             "success": bool,
             "message": str,
+            "error": str (실패 시 예외 클래스 이름),
             "post_url": str (발행 시),
             "title": str,
             "images_uploaded": int (업로드된 이미지 수)
@@ -135,6 +249,17 @@ async def handle_create_post(
         logger.info(f"글 작성 시작: {title}")
         images_uploaded = 0
 
+        # 0. 카테고리 이름 → categoryNo (캐시 사용)
+        blog_id = blog_id or config.NAVER_BLOG_ID
+        category_no = None
+        if category:
+            with span("resolve_category"):
+                category_no = await _resolve_category_no(page, blog_id, category)
+            if category_no:
+                logger.info(f"카테고리 선택: {category} (categoryNo={category_no})")
+            else:
+                logger.warning(f"카테고리를 찾을 수 없어 기본 카테고리로 작성합니다: {category}")
+
         # 1. 이미지 업로드 (본문 작성 전)
         if images:
             logger.info(f"이미지 업로드 시작: {len(images)}개")
@@ -152,6 +277,7 @@ async def handle_create_post(
                 return {
                     "success": False,
                     "message": f"이미지 업로드 실패: {str(e)}",
+                    "error": type(e).__name__,
                     "post_url": None,
                     "title": title,
                     "images_uploaded": 0,
@@ -165,6 +291,7 @@ async def handle_create_post(
             blog_id=None,  # 현재 로그인된 블로그 사용
             use_html=False,
             wait_for_completion=publish,
+            category_no=category_no,
         )
 
         # 결과에 이미지 정보 추가
@@ -178,6 +305,7 @@ async def handle_create_post(
         return {
             "success": False,
             "message": f"글 작성 중 오류가 발생했습니다: {str(e)}",
+            "error": type(e).__name__,
             "post_url": None,
             "title": title,
             "images_uploaded": images_uploaded,
@@ -194,11 +322,151 @@ async def handle_create_post(
         return {
             "success": False,
             "message": f"예상치 못한 오류: {str(custom_error)}",
+            "error": type(custom_error).__name__,
             "post_url": None,
             "title": title,
         }
 
 
+# 일괄 작성에서 글 항목으로 받는 handle_create_post 인자
+BATCH_POST_FIELDS = ("title", "content", "category", "tags", "images", "publish")
+
+
+def _validate_batch_post(post: Any) -> Optional[str]:
+    """글 항목이 올바르면 None, 아니면 에러 메시지를 반환합니다."""
+    if not isinstance(post, dict):
+        return "글 항목은 객체여야 합니다."
+    for field in ("title", "content"):
+        if not isinstance(post.get(field), str) or not post[field].strip():
+            return f"{field}가 비어 있습니다."
+    unknown = set(post) - set(BATCH_POST_FIELDS)
+    if unknown:
+        return f"알 수 없는 필드: {', '.join(sorted(unknown))}"
+    return None
+
+
+async def handle_create_posts_batch(
+    posts: list,
+    create_post: Callable[[int, Dict[str, Any]], Awaitable[Dict[str, Any]]],
+    concurrency: Optional[int] = None,
+    min_interval: Optional[float] = None,
+) -> Dict[str, Any]:
+    """여러 글을 작업 큐로 나눠 작성합니다.
+
+    글 하나는 create_post(글 번호, 글 인자)로 작성합니다. 서버는 이 콜백에서 페이지 풀의
+    페이지를 하나 빌려 handle_create_post를 호출하므로, 동시 작성 수는 빌릴 수 있는
+    페이지 수(PAGE_POOL_SIZE)를 넘지 않도록 제한합니다. 글 사이에는 최소 시작 간격을
+    두어 짧은 시간에 글이 몰리지 않게 합니다.
+
+    Args:
+        posts: 글 목록 (각 항목은 BATCH_POST_FIELDS 키를 갖는 dict)
+        create_post: 글 하나를 작성하고 handle_create_post 결과를 반환하는 코루틴 함수
+            (글 번호는 posts 안의 위치로, 글별 request id 등을 구분하는 데 사용)
+        concurrency: 동시에 작성할 글 수 (None이면 config.POST_BATCH_CONCURRENCY)
+        min_interval: 글 작성 시작 사이 최소 간격 (초, None이면
+            config.POST_BATCH_MIN_INTERVAL_SECONDS)
+
+    Returns:
+        작업 결과 딕셔너리
+        {
+            "success": bool (모든 글이 성공했는지),
+            "message": str,
+            "total": int,
+            "succeeded": int,
+            "failed": int,
+            "results": [
+                {"index": int, "title": str, "success": bool,
+                 "post_url": str | None, "message": str, "elapsed_ms": float,
+                 "error": str (실패 시 예외 클래스 이름)},
+                ...
+            ]
+        }
+    """
+    if not posts:
+        return {"success": False, "message": "작성할 글이 없습니다.", "results": []}
+    if len(posts) > config.POST_BATCH_MAX_ITEMS:
+        return {
+            "success": False,
+            "message": f"한 번에 최대 {config.POST_BATCH_MAX_ITEMS}개까지 작성할 수 있습니다 (요청: {len(posts)}개)",
+            "results": [],
+        }
+
+    if concurrency is None:
+        concurrency = config.POST_BATCH_CONCURRENCY
+    concurrency = max(1, min(concurrency, config.PAGE_POOL_SIZE))
+    if min_interval is None:
+        min_interval = config.POST_BATCH_MIN_INTERVAL_SECONDS
+
+    results: list[Optional[Dict[str, Any]]] = [None] * len(posts)
+    jobs = []
+    for index, post in enumerate(posts):
+        error = _validate_batch_post(post)
+        if error:
+            title = post.get("title") if isinstance(post, dict) else None
+            results[index] = {
+                "index": index,
+                "title": title,
+                "success": False,
+                "post_url": None,
+                "message": f"잘못된 글 항목: {error}",
+                "elapsed_ms": 0.0,
+            }
+        else:
+            jobs.append((index, post))
+
+    logger.info(
+        f"글 일괄 작성 시작: {len(jobs)}개 (동시 {concurrency}개, 간격 {min_interval}초)"
+    )
+
+    async def run_job(job: tuple) -> Dict[str, Any]:
+        index, post = job
+        return await create_post(index, post)
+
+    outcomes = await run_batch(
+        jobs,
+        run_job,
+        concurrency=concurrency,
+        rate_limiter=RateLimiter(min_interval),
+    )
+
+    for (index, post), outcome in zip(jobs, outcomes):
+        if outcome["ok"]:
+            result = outcome["result"]
+            success = bool(result.get("success"))
+            message = result.get("message", "")
+            post_url = result.get("post_url")
+            error = result.get("error")
+        else:
+            success = False
+            message = f"글 작성 중 오류가 발생했습니다: {outcome['error']}"
+            post_url = None
+            error = type(outcome["error"]).__name__
+        results[index] = {
+            "index": index,
+            "title": post["title"],
+            "success": success,
+            "post_url": post_url,
+            "message": message,
+            "elapsed_ms": outcome["elapsed_ms"],
+        }
+        if error:
+            results[index]["error"] = error
+
+    succeeded = sum(1 for result in results if result["success"])
+    failed = len(results) - succeeded
+    logger.info(f"글 일괄 작성 완료: 성공 {succeeded}개, 실패 {failed}개")
+
+    return {
+        "success": failed == 0,
+        "message": f"{len(results)}개 중 {succeeded}개 작성 완료"
+        + (f", {failed}개 실패" if failed else ""),
+        "total": len(results),
+        "succeeded": succeeded,
+        "failed": failed,
+        "results": results,
+    }
+
+
 # NOTE: 글 삭제 기능은 일단 비활성화 (필요시 추후 구현)
 # async def handle_delete_post(page: Page, post_url: str) -> Dict[str, Any]:
 #     """네이버 블로그의 글을 삭제합니다.
@@ -224,17 +492,26 @@ async def handle_create_post(
 #     }
 
 
-async def handle_list_categories(page: Page) -> Dict[str, Any]:
+async def handle_list_categories(
+    page: Page,
+    blog_id: Optional[str] = None,
+    refresh: bool = False,
+) -> Dict[str, Any]:
     """네이버 블로그의 카테고리 목록을 가져옵니다.
 
+    유효한 캐시가 있으면 블로그 페이지에 접속하지 않고 캐시를 반환합니다.
+
     Args:
         page: Playwright Page 객체 (로그인된 상태)
+        blog_id: 블로그 아이디 (None이면 설정된 계정의 블로그)
+        refresh: True면 캐시를 무시하고 다시 조회
 
     Returns:
         작업 결과 딕셔너리
         {
             "success": bool,
             "message": str,
+            "error": str (실패 시 예외 클래스 이름),
             "categories": [
                 {
                     "name": str,
@@ -242,16 +519,32 @@ async def handle_list_categories(page: Page) -> Dict[str, Any]:
                     "categoryNo": str
                 },
                 ...
-            ]
+            ],
+            "cached": bool
         }
     """
     logger.info("카테고리 목록 조회 시작")
+    blog_id = blog_id or config.NAVER_BLOG_ID
+
+    # refresh여도 기존 캐시는 새 목록을 받았을 때 교체 (조회에 실패하면 유지)
+    if not refresh:
+        cached = category_cache.get(blog_id)
+        if cached is not None:
+            logger.info(f"카테고리 캐시 사용: {len(cached)}개")
+            return {
+                "success": True,
+                "message": f"{len(cached)}개의 카테고리를 찾았습니다 (캐시)",
+                "categories": cached,
+                "cached": True,
+            }
 
     try:
-        result = await get_categories(page)
+        result = await get_categories(page, blog_id)
+        result["cached"] = False
 
         if result["success"]:
             logger.info(f"카테고리 조회 완료: {len(result['categories'])}개")
+            category_cache.set(blog_id, result["categories"])
         else:
             logger.error(f"카테고리 조회 실패: {result['message']}")
 
@@ -262,5 +555,7 @@ async def handle_list_categories(page: Page) -> Dict[str, Any]:
         return {
             "success": False,
             "message": f"카테고리 조회 실패: {str(e)}",
-            "categories": []
+            "error": type(e).__name__,
+            "categories": [],
+            "cached": False,
         }
@@ -7,7 +7,10 @@ MCP (Model Context Protocol) 서버를 제공합니다.
 import asyncio
 import logging
 import os
-from typing import Optional
+import random
+import time
+from pathlib import Path
+from typing import Awaitable, Callable, Iterable, Optional
 
 from mcp.server import Server
 from mcp.server.stdio import stdio_server
@@ -15,13 +18,22 @@ from mcp.types import Tool
 from playwright.async_api import async_playwright, Browser, BrowserContext, Page
 
 from .config import get_browser_config, config
+from .services.metrics_exporter import MetricsExporter
+from .services.request_blocker import request_blocker
 from .services.session_manager import SessionManager
+from .services.session_pool import SessionPool, parse_accounts
 from .mcp.tools import (
     TOOLS_METADATA,
     handle_create_post,
+    handle_create_posts_batch,
     # handle_delete_post,  # 비활성화
     handle_list_categories,
 )
+from .automation.post_actions import recycle_editor, warm_up_editor
+from .utils.image_processing import shutdown_preprocess_pool
+from .utils.metrics import TOOL_CALLS, TOOL_DURATION, TOOL_ERRORS
+from .utils.selector_stats import selector_stats
+from .utils.timing import StepTimer, recording
 from .utils.trace_manager import trace_manager
 
 # 로깅 설정
@@ -29,6 +41,18 @@ logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
 
+def _failure_errors(result: dict) -> list[str]:
+    """핸들러가 잡아서 success=False로 반환한 실패의 에러 클래스 이름 목록.
+
+    일괄 작성은 글 항목별 결과(results)의 에러도 모읍니다.
+    """
+    return [
+        item["error"]
+        for item in [result, *result.get("results", [])]
+        if not item.get("success", True) and item.get("error")
+    ]
+
+
 class NaverBlogMCPServer:
     """네이버 블로그 MCP 서버 클래스."""
 
@@ -37,16 +61,18 @@ class NaverBlogMCPServer:
         self.server = Server("naver-blog")
         self.playwright = None
         self.browser: Optional[Browser] = None
-        self.context: Optional[BrowserContext] = None
+        self.session_pool: Optional[SessionPool] = None
+        self.keepalive_task: Optional[asyncio.Task] = None
+        self.warmup_task: Optional[asyncio.Task] = None
+        self.metrics_exporter: Optional[MetricsExporter] = None
+        self.startup_timer = StepTimer("startup")
 
         # 설정 검증
         config.validate()
 
-        # 세션 관리자 초기화
-        self.session_manager = SessionManager(
-            user_id=config.NAVER_BLOG_ID,
-            password=config.NAVER_BLOG_PASSWORD
-        )
+        # 계정 목록 (기본 계정 + 추가 계정)
+        self.accounts = {config.NAVER_BLOG_ID: config.NAVER_BLOG_PASSWORD}
+        self.accounts.update(parse_accounts(config.NAVER_BLOG_ACCOUNTS))
 
         # Tool 등록
         self._register_tools()
@@ -60,33 +86,10 @@ class NaverBlogMCPServer:
         async def call_tool(name: str, arguments: dict) -> list[dict]:
             """Tool 호출 핸들러."""
             logger.info(f"Tool called: {name} with arguments: {arguments}")
+            started = time.perf_counter()
 
             try:
-                # Trace 시작
-                if self.context:
-                    await trace_manager.start_trace(self.context, name=name)
-
-                # 페이지 가져오기
-                page = await self.get_page()
-
-                # Tool별 핸들러 호출
-                if name == "naver_blog_create_post":
-                    result = await handle_create_post(
-                        page=page,
-                        title=arguments["title"],
-                        content=arguments["content"],
-                        category=arguments.get("category"),
-                        tags=arguments.get("tags"),
-                        images=arguments.get("images"),
-                        publish=arguments.get("publish", True),
-                    )
-                # elif name == "naver_blog_delete_post":
-                #     result = await handle_delete_post(
-                #         page=page, post_url=arguments["post_url"]
-                #     )
-                elif name == "naver_blog_list_categories":
-                    result = await handle_list_categories(page=page)
-                else:
+                if name not in TOOLS_METADATA:
                     return [
                         {
                             "type": "text",
@@ -94,9 +97,70 @@ class NaverBlogMCPServer:
                         }
                     ]
 
-                # Trace 저장 (성공)
-                if self.context:
-                    await trace_manager.stop_trace(self.context, success=True)
+                if not self.session_pool:
+                    raise RuntimeError(
+                        "Session pool not initialized. Call initialize() first."
+                    )
+
+                # 계정 선택 (처음 쓰는 계정이면 이때 세션 복원/로그인)
+                account = self.session_pool.resolve_account(arguments.get("account"))
+
+                # 호출 하나의 단계별 span 기록 (끝나면 JSON 로그 한 줄)
+                request_id = self._request_id()
+                with recording(name, request_id=request_id, account=account) as recorder:
+                    # Tool별 핸들러 호출
+                    if name == "naver_blog_create_post":
+                        result = await self._run_on_page(
+                            name,
+                            account,
+                            request_id,
+                            handle_create_post,
+                            title=arguments["title"],
+                            content=arguments["content"],
+                            category=arguments.get("category"),
+                            tags=arguments.get("tags"),
+                            images=arguments.get("images"),
+                            publish=arguments.get("publish", True),
+                            blog_id=account,
+                        )
+                    elif name == "naver_blog_create_posts_batch":
+                        # 글마다 페이지를 따로 빌려 동시에 작성
+                        # (Trace 스코프가 글별로 구분되도록 request id에 글 번호를 붙임)
+                        async def create_post(index: int, post: dict) -> dict:
+                            return await self._run_on_page(
+                                "naver_blog_create_post",
+                                account,
+                                f"{request_id}-{index}" if request_id else None,
+                                handle_create_post,
+                                blog_id=account,
+                                **post,
+                            )
+
+                        result = await handle_create_posts_batch(
+                            posts=arguments["posts"],
+                            create_post=create_post,
+                            concurrency=arguments.get("concurrency"),
+                        )
+                    # elif name == "naver_blog_delete_post":
+                    #     result = await self._run_on_page(
+                    #         name, account, request_id, handle_delete_post,
+                    #         post_url=arguments["post_url"],
+                    #     )
+                    elif name == "naver_blog_list_categories":
+                        result = await self._run_on_page(
+                            name,
+                            account,
+                            request_id,
+                            handle_list_categories,
+                            blog_id=account,
+                            refresh=arguments.get("refresh", False),
+                        )
+
+                if config.DEBUG_TIMINGS:
+                    result["timings"] = recorder.report()
+
+                status = "success" if result.get("success", True) else "failure"
+                self._record_tool_call(name, status, started, errors=_failure_errors(result))
 
                 # 결과를 MCP 형식으로 변환
                 import json
@@ -110,10 +174,7 @@ class NaverBlogMCPServer:
 
             except Exception as e:
                 logger.error(f"Tool execution error: {e}", exc_info=True)
-
-                # Trace 저장 (실패)
-                if self.context:
-                    await trace_manager.stop_trace(self.context, success=False)
+                self._record_tool_call(name, "error", started, errors=[type(e).__name__])
 
                 return [
                     {
@@ -138,31 +199,206 @@ class NaverBlogMCPServer:
 
         logger.info(f"Registered {len(TOOLS_METADATA)} tools")
 
+    async def _run_on_page(
+        self,
+        name: str,
+        account: str,
+        request_id: Optional[str],
+        handler: Callable[..., Awaitable[dict]],
+        **kwargs,
+    ) -> dict:
+        """계정의 풀에서 페이지를 빌려 Tool 핸들러를 실행합니다.
+
+        다른 호출과 탭을 공유하지 않으며, 세션 갱신으로 컨텍스트가 교체되어도
+        이 호출은 빌린 페이지의 컨텍스트를 계속 사용합니다.
+        """
+        async with self.session_pool.page(account) as page:
+            # 호출별 Trace 스코프 - 페이지를 반납하기 전에 닫아야
+            # 교체된 이전 컨텍스트가 닫히기 전에 기록됨
+            async with trace_manager.trace(
+                page.context, name=name, request_id=request_id
+            ) as trace_scope:
+                result = await handler(page=page, **kwargs)
+                # 핸들러가 success=False를 반환한 경우도 실패로 기록
+                trace_scope.success = bool(result.get("success", True))
+        return result
+
+    @staticmethod
+    def _record_tool_call(
+        name: str, status: str, started: float, errors: Iterable[str] = ()
+    ) -> None:
+        """Tool 호출 결과와 소요 시간, 에러 클래스 이름을 메트릭에 기록합니다."""
+        TOOL_CALLS.inc(tool=name, status=status)
+        TOOL_DURATION.observe(time.perf_counter() - started, tool=name)
+        for error in errors:
+            TOOL_ERRORS.inc(tool=name, error=error)
+
+    def _request_id(self) -> Optional[str]:
+        """현재 처리 중인 MCP 요청 id (없으면 None)."""
+        try:
+            return str(self.server.request_context.request_id)
+        except LookupError:
+            return None
+
     async def initialize(self):
         """브라우저 및 세션 초기화."""
         logger.info("Initializing Naver Blog MCP Server...")
 
-        # Playwright 시작
-        self.playwright = await async_playwright().start()
-
         # 브라우저 설정 가져오기
         browser_config = get_browser_config()
 
+        # Playwright 시작
+        with self.startup_timer.step("playwright"):
+            self.playwright = await async_playwright().start()
+
         # 브라우저 실행
-        self.browser = await self.playwright.chromium.launch(**browser_config)
+        with self.startup_timer.step("browser_launch"):
+            self.browser = await self.playwright.chromium.launch(**browser_config)
         logger.info(f"Browser launched (headless={browser_config.get('headless', True)})")
 
-        # 세션 복원 또는 새 컨텍스트 생성
-        self.context = await self.session_manager.get_or_create_session(self.browser)
-        logger.info("Browser context initialized")
+        # 계정별 세션 풀 (브라우저 하나를 공유, 계정마다 컨텍스트 하나)
+        self.session_pool = SessionPool(
+            self.browser,
+            default_account=config.NAVER_BLOG_ID,
+            storage_dir=str(Path(config.SESSION_STORAGE_PATH).parent),
+            page_pool_size=config.PAGE_POOL_SIZE,
+            session_validity_hours=config.SESSION_VALIDITY_HOURS,
+            headless=browser_config.get("headless", True),
+            # 글을 발행한 탭은 반납될 때 다음 글쓰기 에디터를 다시 열어 둠
+            on_page_release=recycle_editor if config.RECYCLE_EDITOR else None,
+            # 광고/통계/웹폰트 요청을 끊어 페이지 로딩 대기를 줄임
+            request_blocker=request_blocker if config.NETWORK_BLOCKING else None,
+        )
+        for user_id, password in self.accounts.items():
+            # 기본 계정은 기존 세션 파일 경로를 그대로 사용
+            storage_path = (
+                config.SESSION_STORAGE_PATH if user_id == config.NAVER_BLOG_ID else None
+            )
+            self.session_pool.add_account(user_id, password, storage_path=storage_path)
+
+        # 기본 계정만 미리 준비하고 나머지는 처음 사용할 때 복원/로그인
+        with self.startup_timer.step("session"):
+            await self.session_pool.get_context()
+        logger.info(
+            f"Session pool ready (accounts={len(self.session_pool.accounts)}, "
+            f"pages per account={config.PAGE_POOL_SIZE})"
+        )
+
+    @property
+    def context(self) -> Optional[BrowserContext]:
+        """기본 계정의 BrowserContext (초기화 전이면 None)."""
+        if not self.session_pool:
+            return None
+        return self.session_pool.active_context()
+
+    @property
+    def session_manager(self) -> SessionManager:
+        """기본 계정의 SessionManager."""
+        if not self.session_pool:
+            raise RuntimeError("Session pool not initialized. Call initialize() first.")
+        return self.session_pool.session_manager()
+
+    async def _warm_up(self):
+        """기본 계정의 풀 페이지 하나에 글쓰기 에디터를 미리 열어 둡니다.
+
+        첫 글쓰기 호출은 이 페이지를 받아 블로그 이동/에디터 로딩 없이
+        바로 입력을 시작합니다. 실패해도 Tool 호출에는 영향이 없습니다.
+        """
+        try:
+            with self.startup_timer.step("warmup_editor"):
+                async with self.session_pool.page() as page:
+                    await warm_up_editor(page)
+            logger.info("Editor warm-up done")
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            logger.warning(f"Editor warm-up failed (ignored): {e}")
+        finally:
+            self.startup_timer.log_report()
+
+    def start_warmup(self):
+        """에디터 예열을 백그라운드로 시작합니다 (설정에서 켠 경우)."""
+        if not config.WARMUP_EDITOR or self.warmup_task:
+            return
+        self.warmup_task = asyncio.create_task(self._warm_up())
+
+    def _next_keepalive_delay(self, failures: int) -> float:
+        """다음 세션 점검까지 기다릴 시간 (초).
+
+        평소에는 설정된 간격에 지터를 더하고, 실패가 이어지면 1분부터
+        두 배씩 늘려 재시도하되 설정된 간격을 넘지 않습니다.
+        """
+        interval = config.SESSION_KEEPALIVE_INTERVAL_SECONDS
+        if failures:
+            interval = min(interval, 60 * 2 ** (failures - 1))
+        jitter = config.SESSION_KEEPALIVE_JITTER
+        return interval * random.uniform(1 - jitter, 1 + jitter)
+
+    async def _keepalive_loop(self):
+        """주기적으로 세션을 검증/갱신하는 백그라운드 작업.
+
+        만료된 세션은 새 컨텍스트로 미리 재로그인해 교체하므로
+        Tool 호출이 재로그인 지연을 겪지 않습니다.
+        """
+        failures = 0
+        while True:
+            await asyncio.sleep(self._next_keepalive_delay(failures))
+            try:
+                swapped = await self.session_pool.refresh_all()
+                failures = 0
+                logger.info(f"Session keep-alive done (swapped={swapped})")
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                failures += 1
+                logger.warning(f"Session keep-alive failed ({failures} in a row): {e}")
+
+    def start_keepalive(self):
+        """세션 유지 백그라운드 작업을 시작합니다 (간격이 0이면 사용 안 함)."""
+        if config.SESSION_KEEPALIVE_INTERVAL_SECONDS <= 0 or self.keepalive_task:
+            return
+        self.keepalive_task = asyncio.create_task(self._keepalive_loop())
+        logger.info(
+            f"Session keep-alive started "
+            f"(every ~{config.SESSION_KEEPALIVE_INTERVAL_SECONDS}s)"
+        )
+
+    async def start_metrics(self):
+        """메트릭 HTTP 엔드포인트를 시작합니다 (설정에서 켠 경우).
+
+        포트를 열 수 없어도 MCP 서버는 계속 실행합니다.
+        """
+        if not config.METRICS_ENABLED or self.metrics_exporter:
+            return
+        exporter = MetricsExporter(host=config.METRICS_HOST, port=config.METRICS_PORT)
+        try:
+            await exporter.start()
+        except OSError as e:
+            logger.warning(f"Metrics endpoint failed to start (ignored): {e}")
+            return
+        self.metrics_exporter = exporter
 
     async def cleanup(self):
         """리소스 정리."""
         logger.info("Cleaning up resources...")
 
-        if self.context:
-            await self.context.close()
-            logger.info("Browser context closed")
+        if self.metrics_exporter:
+            await self.metrics_exporter.stop()
+            self.metrics_exporter = None
+
+        for task in (self.warmup_task, self.keepalive_task):
+            if task:
+                task.cancel()
+                try:
+                    await task
+                except asyncio.CancelledError:
+                    pass
+        self.warmup_task = None
+        self.keepalive_task = None
+
+        if self.session_pool:
+            await self.session_pool.close()
+            logger.info("Browser contexts closed")
 
         if self.browser:
             await self.browser.close()
@@ -172,34 +408,61 @@ class NaverBlogMCPServer:
             await self.playwright.stop()
             logger.info("Playwright stopped")
 
-    async def get_page(self) -> Page:
-        """새 페이지를 생성하거나 기존 페이지를 반환합니다.
+        shutdown_preprocess_pool()
+
+        # 셀렉터 통계 저장 및 죽은 셀렉터 보고
+        selector_stats.log_dead_selectors()
+        selector_stats.flush()
+
+    async def get_page(self, account: Optional[str] = None) -> Page:
+        """계정의 페이지 풀에서 페이지를 빌립니다.
+
+        사용이 끝나면 같은 account로 release_page()를 호출해 반납해야 합니다.
+
+        Args:
+            account: 계정 아이디 (None이면 기본 계정)
 
         Returns:
             Playwright Page 객체
 
         Raises:
-            RuntimeError: 브라우저 컨텍스트가 초기화되지 않은 경우
+            RuntimeError: 세션 풀이 초기화되지 않은 경우
         """
-        if not self.context:
+        if not self.session_pool:
             raise RuntimeError("Browser context not initialized. Call initialize() first.")
 
-        # 기존 페이지가 있으면 재사용, 없으면 새로 생성
-        pages = self.context.pages
-        if pages:
-            return pages[0]
-        else:
-            return await self.context.new_page()
+        page_pool = await self.session_pool.get_page_pool(account)
+        return await page_pool.acquire()
+
+    async def release_page(self, page: Page, account: Optional[str] = None) -> None:
+        """get_page()로 빌린 페이지를 풀에 반납합니다.
+
+        Args:
+            page: 반납할 Playwright Page 객체
+            account: get_page()에 넘겼던 계정 아이디
+        """
+        if self.session_pool:
+            page_pool = await self.session_pool.get_page_pool(account)
+            await page_pool.release(page)
 
     async def run(self):
         """MCP 서버 실행."""
         try:
             # 브라우저 초기화
+            await self.start_metrics()
             await self.initialize()
+            self.start_keepalive()
 
             # stdio를 통해 MCP 서버 실행
             async with stdio_server() as (read_stream, write_stream):
                 logger.info("MCP Server started successfully")
+
+                # 예열은 MCP 초기화 응답을 막지 않도록 백그라운드에서 진행
+                if config.WARMUP_EDITOR:
+                    self.start_warmup()
+                else:
+                    self.startup_timer.log_report()
+
                 await self.server.run(
                     read_stream,
                     write_stream,
@@ -0,0 +1,121 @@
+"""작업 여러 개를 제한된 동시성으로 처리하는 asyncio 작업 큐.
+
+글 일괄 작성처럼 같은 작업을 여러 번 실행할 때 워커 수(동시에 쓰는 페이지 수)와
+작업 시작 간격을 제한하고, 작업별 결과/에러를 입력 순서대로 돌려줍니다.
+한 작업이 실패해도 나머지 작업은 계속 진행합니다.
+"""
+
+import asyncio
+import logging
+import time
+from typing import Any, Awaitable, Callable, Optional, Sequence
+
+logger = logging.getLogger(__name__)
+
+
+class RateLimiter:
+    """작업 시작 사이에 최소 간격을 두는 제한기 (여러 워커가 공유)."""
+
+    def __init__(self, min_interval: float):
+        """
+        RateLimiter 초기화.
+
+        Args:
+            min_interval: 작업 시작 사이 최소 간격 (초, 0이면 제한 없음)
+        """
+        self.min_interval = max(0.0, min_interval)
+        self._next_start = 0.0
+        self._lock = asyncio.Lock()
+
+    async def wait(self) -> float:
+        """
+        다음 작업을 시작해도 될 때까지 기다립니다.
+
+        Returns:
+            기다린 시간 (초)
+        """
+        if self.min_interval <= 0:
+            return 0.0
+
+        async with self._lock:
+            loop = asyncio.get_running_loop()
+            delay = max(0.0, self._next_start - loop.time())
+            if delay:
+                await asyncio.sleep(delay)
+            self._next_start = loop.time() + self.min_interval
+            return delay
+
+
+async def run_batch(
+    items: Sequence[Any],
+    worker: Callable[[Any], Awaitable[Any]],
+    concurrency: int = 1,
+    rate_limiter: Optional[RateLimiter] = None,
+) -> list[dict]:
+    """
+    items를 concurrency개의 워커로 처리합니다.
+
+    큐 크기를 워커 수로 제한해 작업을 한꺼번에 만들어 두지 않고,
+    워커가 하나를 끝낼 때마다 다음 작업을 넣습니다.
+
+    Args:
+        items: 처리할 작업 입력 목록
+        worker: 작업 하나를 처리하는 코루틴 함수
+        concurrency: 동시에 실행할 워커 수
+        rate_limiter: 작업 시작 간격 제한기 (None이면 제한 없음)
+
+    Returns:
+        입력 순서대로의 작업 결과 목록
+        [
+            {
+                "index": int,
+                "ok": bool,               # 예외 없이 끝났는지 여부
+                "result": Any,            # worker 반환값 (ok일 때)
+                "error": Exception,       # 발생한 예외 (실패 시)
+                "elapsed_ms": float,      # 대기 제외 처리 시간
+            },
+            ...
+        ]
+    """
+    concurrency = max(1, min(concurrency, len(items) or 1))
+    queue: asyncio.Queue = asyncio.Queue(maxsize=concurrency)
+    outcomes: list[Optional[dict]] = [None] * len(items)
+
+    async def produce() -> None:
+        for index, item in enumerate(items):
+            await queue.put((index, item))
+        for _ in range(concurrency):
+            await queue.put(None)
+
+    async def consume(worker_id: int) -> None:
+        while True:
+            job = await queue.get()
+            if job is None:
+                return
+            index, item = job
+            if rate_limiter:
+                await rate_limiter.wait()
+
+            started = time.perf_counter()
+            outcome: dict = {"index": index}
+            try:
+                outcome["result"] = await worker(item)
+                outcome["ok"] = True
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.warning(f"Batch item {index} failed (worker {worker_id}): {e}")
+                outcome["error"] = e
+                outcome["ok"] = False
+            outcome["elapsed_ms"] = round((time.perf_counter() - started) * 1000, 1)
+            outcomes[index] = outcome
+
+    tasks = [asyncio.create_task(produce())]
+    tasks += [asyncio.create_task(consume(worker_id)) for worker_id in range(concurrency)]
+    try:
+        await asyncio.gather(*tasks)
+    finally:
+        for task in tasks:
+            task.cancel()
+
+    return outcomes
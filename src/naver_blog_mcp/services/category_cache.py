@@ -0,0 +1,202 @@
+"""블로그 카테고리 캐시.
+
+카테고리 목록은 자주 바뀌지 않으므로 blog_id별로 메모리와 디스크(JSON)에
+TTL과 함께 저장해 두고, 반복 조회 시 블로그 페이지를 다시 긁지 않습니다.
+다시 조회해도 없던 카테고리 이름도 같은 항목에 기억해 두어, 잘못된 이름으로
+글을 계속 써도 매번 다시 조회하지 않습니다 (TTL 만료나 새로 조회하면 잊음).
+"""
+
+import json
+import logging
+import time
+from pathlib import Path
+from typing import Optional
+
+from ..config import config
+
+logger = logging.getLogger(__name__)
+
+
+class CategoryCache:
+    """blog_id별 카테고리 목록 캐시 (메모리 + JSON 파일)."""
+
+    def __init__(
+        self,
+        cache_path: str = "playwright-state/categories.json",
+        ttl_seconds: int = 3600,
+    ):
+        """
+        CategoryCache 초기화.
+
+        Args:
+            cache_path: 캐시 JSON 파일 경로
+            ttl_seconds: 캐시 유효 시간 (초), 0 이하면 캐시 사용 안 함
+        """
+        self.cache_path = Path(cache_path)
+        self.ttl_seconds = ttl_seconds
+        self._entries: dict[str, dict] = {}
+        self._loaded = False
+
+    def _load(self) -> None:
+        """디스크 캐시를 최초 1회만 메모리로 읽어옵니다."""
+        if self._loaded:
+            return
+        self._loaded = True
+
+        if not self.cache_path.exists():
+            return
+
+        try:
+            data = json.loads(self.cache_path.read_text(encoding="utf-8"))
+            if isinstance(data, dict):
+                self._entries = data
+        except Exception as e:
+            logger.warning(f"카테고리 캐시 파일을 읽지 못했습니다: {e}")
+
+    def _save(self) -> None:
+        """메모리 캐시를 디스크에 기록합니다."""
+        try:
+            self.cache_path.parent.mkdir(parents=True, exist_ok=True)
+            self.cache_path.write_text(
+                json.dumps(self._entries, ensure_ascii=False, indent=2),
+                encoding="utf-8",
+            )
+        except Exception as e:
+            logger.warning(f"카테고리 캐시 파일을 저장하지 못했습니다: {e}")
+
+    def _is_fresh(self, entry: dict) -> bool:
+        if self.ttl_seconds <= 0:
+            return False
+        return time.time() - entry.get("fetched_at", 0) < self.ttl_seconds
+
+    @staticmethod
+    def _normalize(name: str) -> str:
+        """이름 비교용 (앞뒤 공백, 대소문자 무시)."""
+        return name.strip().casefold()
+
+    def _fresh_entry(self, blog_id: str) -> Optional[dict]:
+        self._load()
+        entry = self._entries.get(blog_id)
+        if entry is None or not self._is_fresh(entry):
+            return None
+        return entry
+
+    def get(self, blog_id: str) -> Optional[list[dict]]:
+        """
+        유효한 캐시 항목을 반환합니다.
+
+        Args:
+            blog_id: 블로그 아이디
+
+        Returns:
+            카테고리 리스트 (캐시가 없거나 만료되면 None)
+        """
+        entry = self._fresh_entry(blog_id)
+        return entry["categories"] if entry is not None else None
+
+    def age(self, blog_id: str) -> Optional[float]:
+        """
+        유효한 캐시 항목을 조회한 지 몇 초 지났는지 반환합니다.
+
+        Args:
+            blog_id: 블로그 아이디
+
+        Returns:
+            경과 시간 (초, 캐시가 없거나 만료되면 None)
+        """
+        entry = self._fresh_entry(blog_id)
+        return time.time() - entry["fetched_at"] if entry is not None else None
+
+    def set(self, blog_id: str, categories: list[dict]) -> None:
+        """
+        카테고리 목록을 캐시에 저장합니다 (기억해 둔 없는 이름은 지움).
+
+        Args:
+            blog_id: 블로그 아이디
+            categories: get_categories()가 반환한 카테고리 리스트
+        """
+        self._load()
+        self._entries[blog_id] = {
+            "fetched_at": time.time(),
+            "categories": categories,
+            "missing": [],
+        }
+        self._save()
+
+    def remember_missing(self, blog_id: str, name: str) -> None:
+        """
+        캐시된 목록에 없는 카테고리 이름을 기억합니다.
+
+        같은 항목이 만료되거나 새로 저장될 때까지 is_missing()이 True를 반환합니다.
+
+        Args:
+            blog_id: 블로그 아이디
+            name: 카테고리 이름
+        """
+        entry = self._fresh_entry(blog_id)
+        if entry is None:
+            return
+        missing = entry.setdefault("missing", [])
+        wanted = self._normalize(name)
+        if wanted not in missing:
+            missing.append(wanted)
+            self._save()
+
+    def is_missing(self, blog_id: str, name: str) -> bool:
+        """
+        최근 조회한 목록에 없다고 기억해 둔 이름인지 확인합니다.
+
+        Args:
+            blog_id: 블로그 아이디
+            name: 카테고리 이름
+
+        Returns:
+            기억해 둔 없는 이름이면 True
+        """
+        entry = self._fresh_entry(blog_id)
+        return entry is not None and self._normalize(name) in entry.get("missing", [])
+
+    def invalidate(self, blog_id: Optional[str] = None) -> None:
+        """
+        캐시를 무효화합니다.
+
+        Args:
+            blog_id: 무효화할 블로그 아이디 (None이면 전체)
+        """
+        self._load()
+        if blog_id is None:
+            self._entries.clear()
+        else:
+            self._entries.pop(blog_id, None)
+        self._save()
+        logger.info(f"카테고리 캐시 무효화: {blog_id or '전체'}")
+
+    def resolve_category_no(self, blog_id: str, name: str) -> Optional[str]:
+        """
+        캐시된 목록에서 카테고리 이름을 categoryNo로 변환합니다.
+
+        이름은 앞뒤 공백과 대소문자를 무시하고 비교합니다.
+
+        Args:
+            blog_id: 블로그 아이디
+            name: 카테고리 이름
+
+        Returns:
+            categoryNo (캐시가 없거나 이름이 없으면 None)
+        """
+        categories = self.get(blog_id)
+        if not categories:
+            return None
+
+        wanted = self._normalize(name)
+        for category in categories:
+            if self._normalize(category["name"]) == wanted:
+                return category["categoryNo"]
+        return None
+
+
+# 전역 CategoryCache 인스턴스
+category_cache = CategoryCache(
+    cache_path=config.CATEGORY_CACHE_PATH,
+    ttl_seconds=config.CATEGORY_CACHE_TTL_SECONDS,
+)
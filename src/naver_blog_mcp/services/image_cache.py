@@ -0,0 +1,161 @@
+"""업로드된 이미지 캐시 (내용 해시 기반).
+
+같은 이미지(배너, 푸터 등)를 여러 글에 반복해서 올릴 때, 이미지 바이트의
+SHA-256을 키로 이전에 업로드된 네이버 이미지 URL을 기억해 두고
+파일을 다시 전송하는 대신 URL로 재삽입합니다.
+"""
+
+import hashlib
+import json
+import logging
+import time
+from collections import OrderedDict
+from pathlib import Path
+from typing import Optional, Union
+
+from ..config import config
+
+logger = logging.getLogger(__name__)
+
+
+class ImageCache:
+    """SHA-256 → 업로드된 이미지 메타데이터 LRU 캐시 (JSON 파일에 저장)."""
+
+    def __init__(
+        self,
+        cache_path: str = "playwright-state/image_cache.json",
+        max_entries: int = 1000,
+    ):
+        """
+        ImageCache 초기화.
+
+        Args:
+            cache_path: 캐시 JSON 파일 경로
+            max_entries: 최대 항목 수 (넘으면 가장 오래 안 쓴 항목부터 제거)
+        """
+        self.cache_path = Path(cache_path)
+        self.max_entries = max(1, max_entries)
+        self._entries: OrderedDict[str, dict] = OrderedDict()
+        self._loaded = False
+
+        self.hits = 0
+        self.misses = 0
+        self.reinsert_failures = 0
+        self.evictions = 0
+
+    @staticmethod
+    def hash_file(path: Union[str, Path], chunk_size: int = 1024 * 1024) -> str:
+        """파일 내용의 SHA-256을 계산합니다."""
+        digest = hashlib.sha256()
+        with open(path, "rb") as f:
+            for chunk in iter(lambda: f.read(chunk_size), b""):
+                digest.update(chunk)
+        return digest.hexdigest()
+
+    @staticmethod
+    def hash_bytes(data: bytes) -> str:
+        """바이트의 SHA-256을 계산합니다."""
+        return hashlib.sha256(data).hexdigest()
+
+    def _load(self) -> None:
+        """디스크 캐시를 최초 1회만 메모리로 읽어옵니다."""
+        if self._loaded:
+            return
+        self._loaded = True
+
+        if not self.cache_path.exists():
+            return
+
+        try:
+            data = json.loads(self.cache_path.read_text(encoding="utf-8"))
+            # 파일에는 오래된 항목부터 저장되어 있음
+            self._entries = OrderedDict(data)
+        except Exception as e:
+            logger.warning(f"이미지 캐시 파일을 읽지 못했습니다: {e}")
+
+    def _save(self) -> None:
+        """메모리 캐시를 LRU 순서대로 디스크에 기록합니다."""
+        try:
+            self.cache_path.parent.mkdir(parents=True, exist_ok=True)
+            self.cache_path.write_text(
+                json.dumps(self._entries, ensure_ascii=False),
+                encoding="utf-8",
+            )
+        except Exception as e:
+            logger.warning(f"이미지 캐시 파일을 저장하지 못했습니다: {e}")
+
+    def get(self, digest: str) -> Optional[dict]:
+        """
+        캐시된 업로드 정보를 조회합니다. 조회 결과는 hit/miss 카운터에 반영됩니다.
+
+        Args:
+            digest: 이미지 SHA-256
+
+        Returns:
+            {"url": str, "width": int, "height": int, "uploaded_at": float} 또는 None
+        """
+        self._load()
+        entry = self._entries.get(digest)
+        if entry is None:
+            self.misses += 1
+            return None
+
+        # LRU 순서 갱신 (디스크에는 다음 put/discard 때 반영)
+        self._entries.move_to_end(digest)
+        self.hits += 1
+        return entry
+
+    def put(self, digest: str, url: str, width: int = 0, height: int = 0) -> None:
+        """
+        업로드된 이미지 URL을 캐시에 저장합니다.
+
+        Args:
+            digest: 이미지 SHA-256
+            url: 네이버에 업로드된 이미지 URL
+            width: 이미지 너비
+            height: 이미지 높이
+        """
+        self._load()
+        self._entries[digest] = {
+            "url": url,
+            "width": width,
+            "height": height,
+            "uploaded_at": time.time(),
+        }
+        self._entries.move_to_end(digest)
+
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+            self.evictions += 1
+
+        self._save()
+
+    def discard(self, digest: str) -> None:
+        """항목을 제거합니다 (재삽입이 더 이상 동작하지 않는 URL 등)."""
+        self._load()
+        if self._entries.pop(digest, None) is not None:
+            self._save()
+
+    def record_reinsert_failure(self) -> None:
+        """URL 재삽입 실패를 기록합니다."""
+        self.reinsert_failures += 1
+
+    def stats(self) -> dict:
+        """캐시 카운터를 반환합니다."""
+        self._load()
+        lookups = self.hits + self.misses
+        return {
+            "entries": len(self._entries),
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": round(self.hits / lookups, 3) if lookups else 0.0,
+            "reinsert_failures": self.reinsert_failures,
+            "evictions": self.evictions,
+        }
+
+
+# 전역 ImageCache 인스턴스
+image_cache = ImageCache(
+    cache_path=config.IMAGE_CACHE_PATH,
+    max_entries=config.IMAGE_CACHE_MAX_ENTRIES,
+)
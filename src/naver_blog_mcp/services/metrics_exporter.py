@@ -0,0 +1,105 @@
+"""로컬 HTTP 메트릭 엔드포인트.
+
+MCP 서버는 stdio로 통신하므로 메트릭은 별도의 작은 HTTP 서버로 내보냅니다.
+GET /metrics 요청에 레지스트리를 Prometheus 텍스트 형식으로 응답합니다.
+외부 라이브러리 없이 asyncio 서버로 구현해 MCP 이벤트 루프 안에서 함께 돕니다.
+"""
+
+import asyncio
+import logging
+from typing import Optional
+
+from ..utils.metrics import MetricsRegistry, registry as default_registry
+
+logger = logging.getLogger(__name__)
+
+CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+
+class MetricsExporter:
+    """GET /metrics로 메트릭을 내보내는 HTTP 서버."""
+
+    def __init__(
+        self,
+        registry: MetricsRegistry = default_registry,
+        host: str = "127.0.0.1",
+        port: int = 9464,
+        read_timeout: float = 5.0,
+    ):
+        """
+        MetricsExporter 초기화.
+
+        Args:
+            registry: 내보낼 메트릭 레지스트리
+            host: 바인드 주소 (기본: 로컬에서만 접근)
+            port: 포트 (0이면 빈 포트 자동 선택)
+            read_timeout: 요청 헤더를 기다릴 최대 시간 (초)
+        """
+        self.registry = registry
+        self.host = host
+        self.port = port
+        self.read_timeout = read_timeout
+        self._server: Optional[asyncio.AbstractServer] = None
+
+    @property
+    def bound_port(self) -> Optional[int]:
+        """실제로 바인드된 포트 (시작 전이면 None)."""
+        if not self._server or not self._server.sockets:
+            return None
+        return self._server.sockets[0].getsockname()[1]
+
+    async def start(self) -> None:
+        """HTTP 서버를 시작합니다."""
+        if self._server:
+            return
+        self._server = await asyncio.start_server(self._handle, self.host, self.port)
+        logger.info(f"Metrics endpoint: http://{self.host}:{self.bound_port}/metrics")
+
+    async def stop(self) -> None:
+        """HTTP 서버를 닫습니다."""
+        if not self._server:
+            return
+        self._server.close()
+        await self._server.wait_closed()
+        self._server = None
+
+    async def _handle(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        """요청 하나를 처리하고 연결을 닫습니다."""
+        try:
+            request_line = await asyncio.wait_for(reader.readline(), self.read_timeout)
+            # 헤더는 읽고 버림
+            while True:
+                line = await asyncio.wait_for(reader.readline(), self.read_timeout)
+                if line in (b"\r\n", b"\n", b""):
+                    break
+
+            parts = request_line.decode("latin-1").split()
+            method = parts[0] if parts else ""
+            path = parts[1].split("?", 1)[0] if len(parts) > 1 else ""
+
+            if method != "GET":
+                status, body = "405 Method Not Allowed", "method not allowed\n"
+            elif path in ("/metrics", "/"):
+                status, body = "200 OK", self.registry.render()
+            else:
+                status, body = "404 Not Found", "not found\n"
+
+            payload = body.encode("utf-8")
+            writer.write(
+                (
+                    f"HTTP/1.1 {status}\r\n"
+                    f"Content-Type: {CONTENT_TYPE}\r\n"
+                    f"Content-Length: {len(payload)}\r\n"
+                    "Connection: close\r\n\r\n"
+                ).encode("latin-1")
+                + payload
+            )
+            await writer.drain()
+        except (asyncio.TimeoutError, ConnectionError) as e:
+            logger.debug(f"Metrics request dropped: {e}")
+        finally:
+            writer.close()
+            try:
+                await writer.wait_closed()
+            except ConnectionError:
+                pass
@@ -0,0 +1,255 @@
+"""Playwright 페이지 풀 관리.
+
+하나의 로그인된 BrowserContext 위에서 여러 탭(Page)을 빌려주고 돌려받아
+Tool 호출을 동시에 실행할 수 있게 합니다.
+"""
+
+import asyncio
+import logging
+import weakref
+from contextlib import asynccontextmanager
+from typing import Any, AsyncIterator, Awaitable, Callable, Optional
+
+from playwright.async_api import BrowserContext, Page
+
+logger = logging.getLogger(__name__)
+
+
+class PagePool:
+    """BrowserContext 하나에 묶인 페이지 풀."""
+
+    def __init__(
+        self,
+        context: BrowserContext,
+        size: int = 2,
+        health_check_timeout: float = 3.0,
+        on_release: Optional[Callable[[Page], Awaitable[Any]]] = None,
+        release_timeout: float = 60.0,
+    ):
+        """
+        페이지 풀 초기화.
+
+        Args:
+            context: 페이지를 생성할 BrowserContext (로그인된 상태)
+            size: 동시에 빌려줄 수 있는 최대 페이지 수
+            health_check_timeout: 체크아웃 시 상태 확인 타임아웃 (초)
+            on_release: 반납된 페이지를 유휴 목록에 넣기 전에 백그라운드로 실행할
+                정리 함수 (예: 다음 글을 위한 에디터 재사용 준비)
+            release_timeout: on_release 최대 실행 시간 (초)
+        """
+        self.context = context
+        self.size = max(1, size)
+        self.health_check_timeout = health_check_timeout
+        self.on_release = on_release
+        self.release_timeout = release_timeout
+
+        self._idle: list[Page] = []
+        self._in_use: set[Page] = set()
+        self._crashed: set[Page] = set()
+        self._releasing: dict[asyncio.Task, Page] = {}
+        # 이미 자리를 반환한 페이지 (close()에 실패해 열려 있어도 다시 세지 않음)
+        self._discarded: "weakref.WeakSet[Page]" = weakref.WeakSet()
+        self._created = 0
+        self._replaced = 0
+        self._closed = False
+        self._condition = asyncio.Condition()
+
+    def _watch(self, page: Page) -> None:
+        """페이지 크래시/종료 이벤트를 등록합니다."""
+
+        def on_crash(crashed_page: Page) -> None:
+            logger.warning("Pooled page crashed, it will be replaced")
+            self._crashed.add(crashed_page)
+
+        page.on("crash", on_crash)
+
+    async def _is_healthy(self, page: Page) -> bool:
+        """페이지가 재사용 가능한 상태인지 확인합니다."""
+        if page.is_closed() or page in self._crashed:
+            return False
+
+        try:
+            await asyncio.wait_for(
+                page.evaluate("() => true"), timeout=self.health_check_timeout
+            )
+            return True
+        except Exception as e:
+            logger.warning(f"Pooled page health check failed: {e}")
+            return False
+
+    async def _discard(self, page: Page) -> None:
+        """고장난 페이지를 닫고 빈 자리를 반환합니다 (페이지당 한 번만)."""
+        if page in self._discarded:
+            return
+        self._discarded.add(page)
+        self._crashed.discard(page)
+        try:
+            if not page.is_closed():
+                await page.close()
+        except Exception as e:
+            logger.debug(f"Failed to close discarded page: {e}")
+
+        async with self._condition:
+            self._created -= 1
+            self._replaced += 1
+            self._condition.notify_all()
+
+    async def acquire(self) -> Page:
+        """
+        사용 가능한 페이지를 빌립니다.
+
+        유휴 페이지가 없고 풀이 가득 차 있으면 반납될 때까지 대기합니다.
+        상태 확인에 실패한 페이지는 닫고 새 페이지로 교체합니다.
+
+        Returns:
+            Playwright Page 객체
+
+        Raises:
+            RuntimeError: 풀이 이미 닫힌 경우
+        """
+        while True:
+            async with self._condition:
+                await self._condition.wait_for(
+                    lambda: self._closed
+                    or bool(self._idle)
+                    or self._created < self.size
+                )
+                if self._closed:
+                    raise RuntimeError("Page pool is closed")
+
+                if self._idle:
+                    page = self._idle.pop()
+                else:
+                    self._created += 1
+                    page = None
+
+            if page is None:
+                try:
+                    page = await self.context.new_page()
+                except Exception:
+                    async with self._condition:
+                        self._created -= 1
+                        self._condition.notify()
+                    raise
+                self._watch(page)
+                logger.info(f"Pooled page created ({self._created}/{self.size})")
+            elif not await self._is_healthy(page):
+                await self._discard(page)
+                continue
+
+            self._in_use.add(page)
+            return page
+
+    async def release(self, page: Page) -> None:
+        """
+        빌린 페이지를 풀에 반납합니다.
+
+        Args:
+            page: acquire()로 빌린 Page 객체
+        """
+        self._in_use.discard(page)
+
+        if self._closed or page.is_closed() or page in self._crashed:
+            await self._discard(page)
+            return
+
+        if self.on_release is not None:
+            # 정리가 끝날 때까지 다른 호출에 빌려주지 않음 (호출자는 기다리지 않음)
+            task = asyncio.create_task(self._run_on_release(page))
+            self._releasing[task] = page
+            task.add_done_callback(lambda done: self._releasing.pop(done, None))
+            return
+
+        await self._make_idle(page)
+
+    async def _make_idle(self, page: Page) -> None:
+        """페이지를 유휴 목록에 넣습니다."""
+        async with self._condition:
+            self._idle.append(page)
+            # acquire 대기자와 wait_until_unused 대기자를 모두 깨움
+            self._condition.notify_all()
+
+    async def _run_on_release(self, page: Page) -> None:
+        """반납된 페이지에 on_release를 실행한 뒤 유휴 목록에 넣습니다."""
+        try:
+            await asyncio.wait_for(self.on_release(page), timeout=self.release_timeout)
+        except asyncio.CancelledError:
+            await self._discard(page)
+            raise
+        except Exception as e:
+            # 정리에 실패해도 페이지는 계속 쓸 수 있음 (다음 호출이 다시 이동)
+            logger.warning(f"Page release hook failed (ignored): {e}")
+
+        if self._closed or page.is_closed() or page in self._crashed:
+            await self._discard(page)
+            return
+        await self._make_idle(page)
+
+    @asynccontextmanager
+    async def page(self) -> AsyncIterator[Page]:
+        """
+        페이지를 빌렸다가 블록이 끝나면 자동으로 반납합니다.
+
+        Example:
+            async with page_pool.page() as page:
+                await handle_list_categories(page)
+        """
+        page = await self.acquire()
+        try:
+            yield page
+        finally:
+            await self.release(page)
+
+    async def close(self) -> None:
+        """풀을 닫고 유휴 페이지를 정리합니다."""
+        async with self._condition:
+            self._closed = True
+            idle_pages = self._idle
+            self._idle = []
+            self._condition.notify_all()
+
+        releasing = dict(self._releasing)
+        for task in releasing:
+            task.cancel()
+        await asyncio.gather(*releasing, return_exceptions=True)
+        # 시작하기 전에 취소된 정리 작업의 페이지도 닫음 (이미 버린 페이지는 건너뜀)
+        for page in releasing.values():
+            await self._discard(page)
+
+        for page in idle_pages:
+            try:
+                if not page.is_closed():
+                    await page.close()
+            except Exception as e:
+                logger.debug(f"Failed to close pooled page: {e}")
+
+    async def wait_until_unused(self, timeout: Optional[float] = None) -> bool:
+        """
+        빌려준 페이지가 모두 반납될 때까지 기다립니다.
+
+        Args:
+            timeout: 최대 대기 시간 (초, None이면 무제한)
+
+        Returns:
+            시간 안에 모두 반납되었는지 여부
+        """
+        async def wait() -> None:
+            async with self._condition:
+                await self._condition.wait_for(lambda: not self._in_use)
+
+        try:
+            await asyncio.wait_for(wait(), timeout=timeout)
+            return True
+        except asyncio.TimeoutError:
+            return False
+
+    def stats(self) -> dict:
+        """풀 상태를 반환합니다."""
+        return {
+            "size": self.size,
+            "created": self._created,
+            "idle": len(self._idle),
+            "in_use": len(self._in_use),
+            "releasing": len(self._releasing),
+            "replaced": self._replaced,
+        }
@@ -0,0 +1,127 @@
+"""자동화에 필요 없는 네트워크 요청 차단.
+
+블로그/에디터 페이지는 광고, 통계 비콘, 웹폰트, 추적 픽셀을 함께 불러와
+wait_until="load" / networkidle 대기를 늦춥니다. BrowserContext.route()로
+리소스 유형(font, media 등)과 도메인 허용 목록에 맞지 않는 요청을 보내기 전에
+끊습니다. 최상위 페이지 이동(document)은 어떤 규칙에도 차단하지 않습니다.
+
+주의: route를 등록한 컨텍스트는 Playwright가 HTTP 캐시를 끄므로, 차단으로
+줄어드는 요청보다 캐시를 못 쓰는 손해가 크면 오히려 느려질 수 있습니다.
+그래서 기본값은 꺼져 있습니다 (NETWORK_BLOCKING).
+"""
+
+import logging
+from typing import Dict, Iterable, Optional
+from urllib.parse import urlparse
+
+from playwright.async_api import BrowserContext, Request, Route
+
+from ..config import config
+from ..utils.metrics import BLOCKED_REQUESTS
+
+logger = logging.getLogger(__name__)
+
+
+def _split(value: str) -> list[str]:
+    """쉼표로 구분한 설정값을 소문자 목록으로 바꿉니다."""
+    return [item.strip().lower() for item in value.split(",") if item.strip()]
+
+
+def _host_matches(host: str, domains: Iterable[str]) -> bool:
+    """host가 domains 중 하나이거나 그 하위 도메인인지 확인합니다."""
+    return any(host == domain or host.endswith("." + domain) for domain in domains)
+
+
+class RequestBlocker:
+    """리소스 유형/도메인 규칙으로 요청을 차단하는 route 핸들러."""
+
+    def __init__(
+        self,
+        resource_types: Iterable[str] = ("font", "media", "ping"),
+        allowed_domains: Iterable[str] = ("naver.com", "naver.net", "pstatic.net"),
+        blocked_hosts: Iterable[str] = (),
+    ):
+        """
+        RequestBlocker 초기화.
+
+        Args:
+            resource_types: 항상 차단할 Playwright 리소스 유형
+            allowed_domains: 요청을 허용할 도메인 (하위 도메인 포함, 비어 있으면 모두 허용)
+            blocked_hosts: 허용 도메인 안에서도 차단할 호스트 (광고/통계 수집 서버)
+        """
+        self.resource_types = frozenset(item.lower() for item in resource_types)
+        self.allowed_domains = tuple(item.lower() for item in allowed_domains)
+        self.blocked_hosts = tuple(item.lower() for item in blocked_hosts)
+        self._blocked: Dict[str, int] = {}
+
+    @classmethod
+    def from_config(cls) -> "RequestBlocker":
+        """설정(NETWORK_BLOCK_*)으로 RequestBlocker를 만듭니다."""
+        return cls(
+            resource_types=_split(config.NETWORK_BLOCK_RESOURCE_TYPES),
+            allowed_domains=_split(config.NETWORK_ALLOWED_DOMAINS),
+            blocked_hosts=_split(config.NETWORK_BLOCKED_HOSTS),
+        )
+
+    def block_reason(self, request: Request) -> Optional[str]:
+        """
+        요청을 차단할 이유를 반환합니다 (브라우저 왕복 없음).
+
+        Args:
+            request: Playwright Request 객체
+
+        Returns:
+            "resource_type" / "blocked_host" / "domain" (차단하지 않으면 None)
+        """
+        if request.resource_type == "document" and _is_top_level(request):
+            return None
+
+        if request.resource_type in self.resource_types:
+            return "resource_type"
+
+        host = (urlparse(request.url).hostname or "").lower()
+        if not host:
+            # data:, blob: 등은 네트워크를 쓰지 않음
+            return None
+        if _host_matches(host, self.blocked_hosts):
+            return "blocked_host"
+        if self.allowed_domains and not _host_matches(host, self.allowed_domains):
+            return "domain"
+        return None
+
+    async def handle(self, route: Route) -> None:
+        """route 핸들러: 차단 대상이면 끊고, 아니면 다음 핸들러(또는 네트워크)로 넘깁니다."""
+        request = route.request
+        reason = self.block_reason(request)
+        if reason is None:
+            await route.fallback()
+            return
+
+        self._blocked[request.resource_type] = self._blocked.get(request.resource_type, 0) + 1
+        BLOCKED_REQUESTS.inc(resource_type=request.resource_type, reason=reason)
+        logger.debug(f"Blocked {request.resource_type} ({reason}): {request.url}")
+        await route.abort("blockedbyclient")
+
+    async def install(self, context: BrowserContext) -> None:
+        """컨텍스트의 모든 요청에 차단 규칙을 적용합니다."""
+        await context.route("**/*", self.handle)
+
+    def stats(self) -> dict:
+        """리소스 유형별 차단 요청 수를 반환합니다."""
+        return {
+            "blocked_requests": sum(self._blocked.values()),
+            "by_resource_type": dict(self._blocked),
+        }
+
+
+def _is_top_level(request: Request) -> bool:
+    """최상위 프레임의 페이지 이동인지 확인합니다."""
+    try:
+        return request.frame.parent_frame is None
+    except Exception:
+        # 서비스 워커 요청 등은 프레임이 없음
+        return False
+
+
+# 전역 RequestBlocker 인스턴스 (NETWORK_BLOCKING일 때 SessionManager가 사용)
+request_blocker = RequestBlocker.from_config()
@@ -1,13 +1,25 @@
 """네이버 블로그 세션 관리자."""
 
+import logging
 import os
+import time
 from datetime import datetime, timedelta
 from pathlib import Path
 from typing import Optional
 
 from playwright.async_api import Browser, BrowserContext
 
-from ..automation.login import login_to_naver, verify_login_session, NaverLoginError
+from ..automation.login import (
+    login_to_naver,
+    verify_login_session,
+    check_auth_cookies,
+    probe_login_session,
+    NaverLoginError,
+)
+from ..utils.metrics import SESSION_LOGINS, SESSION_VALIDATIONS
+from .request_blocker import RequestBlocker
+
+logger = logging.getLogger(__name__)
 
 
 class SessionManager:
@@ -19,6 +31,7 @@ class SessionManager:
         password: str,
         storage_path: str = "playwright-state/auth.json",
         session_validity_hours: int = 24,
+        request_blocker: Optional[RequestBlocker] = None,
     ):
         """
         세션 매니저 초기화.
@@ -28,13 +41,22 @@ class SessionManager:
             password: 네이버 비밀번호
             storage_path: 세션 저장 경로
             session_validity_hours: 세션 유효 시간 (시간)
+            request_blocker: 새 컨텍스트에 적용할 요청 차단 규칙 (None이면 차단 안 함)
         """
         self.user_id = user_id
         self.password = password
         self.storage_path = storage_path
         self.session_validity_hours = session_validity_hours
+        self.request_blocker = request_blocker
         self.last_login_time: Optional[datetime] = None
 
+    async def _new_context(self, browser: Browser, **kwargs) -> BrowserContext:
+        """컨텍스트를 만들고 요청 차단 규칙을 적용합니다."""
+        context = await browser.new_context(**kwargs)
+        if self.request_blocker is not None:
+            await self.request_blocker.install(context)
+        return context
+
     def is_session_file_valid(self) -> bool:
         """
         세션 파일이 유효한지 확인합니다.
@@ -58,7 +80,12 @@ class SessionManager:
 
     async def is_session_valid(self, context: BrowserContext) -> bool:
         """
-        실제 네이버 페이지에 접속하여 세션 유효성을 검사합니다.
+        세션 유효성을 가장 싼 방법부터 단계적으로 검사합니다.
+
+        1. 세션 파일 나이
+        2. 인증 쿠키(NID_AUT/NID_SES) 존재 및 만료 시각 (로컬 확인)
+        3. 쿠키만으로 판단할 수 없으면 HTTP 요청 하나로 확인
+        4. 그래도 판단할 수 없으면 실제 페이지 접속
 
         Args:
             context: Playwright BrowserContext 객체
@@ -70,13 +97,33 @@ class SessionManager:
         if not self.is_session_file_valid():
             return False
 
-        # 2. 실제 페이지 접속 테스트
-        page = await context.new_page()
-        try:
-            is_valid = await verify_login_session(page)
-            return is_valid
-        finally:
-            await page.close()
+        started = time.perf_counter()
+
+        # 2. 쿠키 확인
+        is_valid = check_auth_cookies(await context.cookies())
+        method = "cookies"
+
+        # 3. HTTP 확인
+        if is_valid is None:
+            is_valid = await probe_login_session(context)
+            method = "http"
+
+        # 4. 실제 페이지 접속 테스트
+        if is_valid is None:
+            page = await context.new_page()
+            try:
+                is_valid = await verify_login_session(page)
+                method = "page"
+            finally:
+                await page.close()
+
+        elapsed_ms = (time.perf_counter() - started) * 1000
+        SESSION_VALIDATIONS.inc(method=method, result="valid" if is_valid else "invalid")
+        logger.info(
+            f"Session validation ({self.user_id}): "
+            f"{'valid' if is_valid else 'invalid'} via {method} ({elapsed_ms:.0f}ms)"
+        )
+        return is_valid
 
     async def get_or_create_session(
         self, browser: Browser, headless: bool = True
@@ -97,7 +144,7 @@ class SessionManager:
         # 1. 기존 세션 파일이 있고 유효하면 재사용
         if self.is_session_file_valid():
             try:
-                context = await browser.new_context(storage_state=self.storage_path)
+                context = await self._new_context(browser, storage_state=self.storage_path)
 
                 # 실제 로그인 상태 확인
                 if await self.is_session_valid(context):
@@ -110,7 +157,23 @@ class SessionManager:
                 print(f"세션 복원 실패: {e}. 재로그인합니다.")
 
         # 2. 새로 로그인
-        context = await browser.new_context()
+        return await self.login(browser, headless)
+
+    async def login(self, browser: Browser, headless: bool = True) -> BrowserContext:
+        """
+        새 컨텍스트에서 로그인하고 세션을 저장합니다.
+
+        Args:
+            browser: Playwright Browser 객체
+            headless: 헤드리스 모드 여부
+
+        Returns:
+            로그인된 BrowserContext 객체
+
+        Raises:
+            NaverLoginError: 로그인 실패 시
+        """
+        context = await self._new_context(browser)
         page = await context.new_page()
 
         try:
@@ -123,23 +186,42 @@ class SessionManager:
             )
 
             self.last_login_time = datetime.now()
+            SESSION_LOGINS.inc(result="success")
             print(f"{result['message']}")
             print(f"   세션 저장: {result['storage_state_path']}")
 
             return context
 
         except NaverLoginError as e:
+            SESSION_LOGINS.inc(result="failure")
             await context.close()
             raise e
         finally:
             await page.close()
 
+    async def save_session(self, context: BrowserContext) -> None:
+        """
+        컨텍스트의 현재 쿠키/스토리지를 세션 파일에 다시 저장합니다.
+
+        네이버가 갱신한 쿠키를 반영하고 파일 수정 시간도 갱신되므로
+        세션 파일 유효 시간이 연장됩니다.
+
+        Args:
+            context: 로그인된 BrowserContext 객체
+        """
+        Path(self.storage_path).parent.mkdir(parents=True, exist_ok=True)
+        await context.storage_state(path=self.storage_path)
+
     async def refresh_session_if_needed(
         self, browser: Browser, context: BrowserContext, headless: bool = True
     ) -> BrowserContext:
         """
         필요 시 세션을 갱신합니다.
 
+        세션이 유효하면 세션 파일을 다시 저장하고 기존 컨텍스트를 반환합니다.
+        만료되었으면 새 컨텍스트에서 로그인해 반환하며, 기존 컨텍스트는
+        진행 중인 작업이 있을 수 있으므로 닫지 않습니다 (호출자가 교체 후 닫음).
+
         Args:
             browser: Playwright Browser 객체
             context: 현재 BrowserContext 객체
@@ -148,14 +230,14 @@ class SessionManager:
         Returns:
             갱신된 또는 기존 BrowserContext 객체
         """
-        # 세션이 유효하면 그대로 반환
+        # 세션이 유효하면 최신 쿠키를 저장하고 그대로 반환
         if await self.is_session_valid(context):
+            await self.save_session(context)
             return context
 
-        # 세션이 만료되었으면 재로그인
-        print("세션이 만료되었습니다. 재로그인합니다.")
-        await context.close()
-        return await self.get_or_create_session(browser, headless)
+        # 세션이 만료되었으면 새 컨텍스트로 재로그인
+        logger.info(f"세션이 만료되었습니다. 재로그인합니다: {self.user_id}")
+        return await self.login(browser, headless)
 
     def clear_session(self) -> None:
         """저장된 세션 파일을 삭제합니다."""
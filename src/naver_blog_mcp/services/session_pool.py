@@ -0,0 +1,321 @@
+"""여러 네이버 계정의 세션 풀.
+
+브라우저 하나를 공유하고 계정마다 BrowserContext를 하나씩 둡니다.
+컨텍스트는 계정이 처음 사용될 때 계정별 storage state 파일에서
+복원하거나 새로 로그인해서 만듭니다.
+"""
+
+import asyncio
+import logging
+import re
+from contextlib import asynccontextmanager
+from pathlib import Path
+from typing import Any, AsyncIterator, Awaitable, Callable, Optional
+
+from playwright.async_api import Browser, BrowserContext, Page
+
+from .page_pool import PagePool
+from .request_blocker import RequestBlocker
+from .session_manager import SessionManager
+
+logger = logging.getLogger(__name__)
+
+
+def parse_accounts(value: str) -> dict[str, str]:
+    """
+    "아이디:비밀번호" 쌍을 쉼표로 구분한 문자열을 해석합니다.
+
+    비밀번호에는 ':'가 들어갈 수 있으므로 첫 번째 ':'에서만 자릅니다.
+
+    Args:
+        value: 예) "blog1:pw1,blog2:pw2"
+
+    Returns:
+        {아이디: 비밀번호}
+
+    Raises:
+        ValueError: 형식이 잘못된 항목이 있는 경우
+    """
+    accounts = {}
+    for item in value.split(","):
+        item = item.strip()
+        if not item:
+            continue
+        user_id, sep, password = item.partition(":")
+        if not sep or not user_id.strip() or not password:
+            raise ValueError(f"계정 형식이 잘못되었습니다 (아이디:비밀번호): {user_id}")
+        accounts[user_id.strip()] = password
+    return accounts
+
+
+class AccountSession:
+    """계정 하나의 세션 상태 (SessionManager + 컨텍스트 + 페이지 풀)."""
+
+    def __init__(self, manager: SessionManager):
+        self.manager = manager
+        self.context: Optional[BrowserContext] = None
+        self.page_pool: Optional[PagePool] = None
+        self.lock = asyncio.Lock()
+
+
+class SessionPool:
+    """공유 Browser 위에서 계정별 BrowserContext를 관리하는 풀."""
+
+    def __init__(
+        self,
+        browser: Browser,
+        default_account: str,
+        storage_dir: str = "playwright-state",
+        page_pool_size: int = 2,
+        session_validity_hours: int = 24,
+        headless: bool = True,
+        on_page_release: Optional[Callable[[Page], Awaitable[Any]]] = None,
+        request_blocker: Optional[RequestBlocker] = None,
+    ):
+        """
+        세션 풀 초기화.
+
+        Args:
+            browser: 모든 계정이 공유할 Playwright Browser
+            default_account: account를 지정하지 않은 호출이 사용할 계정
+            storage_dir: 계정별 storage state 파일 디렉토리
+            page_pool_size: 계정당 페이지 풀 크기
+            session_validity_hours: 세션 파일 유효 시간 (시간)
+            headless: 로그인 시 헤드리스 모드 여부
+            on_page_release: 반납된 페이지에 백그라운드로 실행할 정리 함수
+                (PagePool의 on_release)
+            request_blocker: 계정 컨텍스트에 적용할 요청 차단 규칙
+        """
+        self.browser = browser
+        self.default_account = default_account
+        self.storage_dir = Path(storage_dir)
+        self.page_pool_size = page_pool_size
+        self.session_validity_hours = session_validity_hours
+        self.headless = headless
+        self.on_page_release = on_page_release
+        self.request_blocker = request_blocker
+
+        self._accounts: dict[str, AccountSession] = {}
+        self._closed = False
+
+    def storage_path_for(self, account: str) -> str:
+        """계정별 storage state 파일 경로를 반환합니다."""
+        safe_name = re.sub(r"[^A-Za-z0-9_.-]", "_", account)
+        return str(self.storage_dir / f"auth-{safe_name}.json")
+
+    def add_account(
+        self, user_id: str, password: str, storage_path: Optional[str] = None
+    ) -> None:
+        """
+        계정을 등록합니다. 컨텍스트는 처음 사용할 때 만듭니다.
+
+        Args:
+            user_id: 네이버 아이디
+            password: 네이버 비밀번호
+            storage_path: storage state 파일 경로 (None이면 storage_dir/auth-<아이디>.json)
+        """
+        if user_id in self._accounts:
+            logger.warning(f"Account already registered: {user_id}")
+            return
+
+        manager = SessionManager(
+            user_id=user_id,
+            password=password,
+            storage_path=storage_path or self.storage_path_for(user_id),
+            session_validity_hours=self.session_validity_hours,
+            request_blocker=self.request_blocker,
+        )
+        self._accounts[user_id] = AccountSession(manager)
+
+    @property
+    def accounts(self) -> list[str]:
+        """등록된 계정 목록."""
+        return list(self._accounts)
+
+    def resolve_account(self, account: Optional[str] = None) -> str:
+        """
+        Tool 인자의 account를 등록된 계정 아이디로 바꿉니다.
+
+        Raises:
+            ValueError: 등록되지 않은 계정인 경우
+        """
+        account = account or self.default_account
+        if account not in self._accounts:
+            raise ValueError(
+                f"등록되지 않은 계정입니다: {account} (사용 가능: {', '.join(self.accounts)})"
+            )
+        return account
+
+    def session_manager(self, account: Optional[str] = None) -> SessionManager:
+        """계정의 SessionManager를 반환합니다."""
+        return self._accounts[self.resolve_account(account)].manager
+
+    async def _ensure_session(self, account: str) -> AccountSession:
+        """계정의 컨텍스트와 페이지 풀을 (필요하면 로그인해서) 준비합니다."""
+        session = self._accounts[account]
+        if session.context is not None:
+            return session
+
+        # 같은 계정에 대한 동시 호출이 로그인을 두 번 하지 않도록 잠금
+        async with session.lock:
+            if self._closed:
+                raise RuntimeError("Session pool is closed")
+            if session.context is None:
+                logger.info(f"Creating browser context for account: {account}")
+                context = await session.manager.get_or_create_session(
+                    self.browser, headless=self.headless
+                )
+                session.page_pool = PagePool(
+                    context, size=self.page_pool_size, on_release=self.on_page_release
+                )
+                session.context = context
+        return session
+
+    async def get_context(self, account: Optional[str] = None) -> BrowserContext:
+        """
+        계정의 로그인된 BrowserContext를 반환합니다.
+
+        Args:
+            account: 계정 아이디 (None이면 기본 계정)
+
+        Returns:
+            BrowserContext 객체
+
+        Raises:
+            ValueError: 등록되지 않은 계정인 경우
+            NaverLoginError: 로그인 실패 시
+        """
+        session = await self._ensure_session(self.resolve_account(account))
+        return session.context
+
+    def active_context(self, account: Optional[str] = None) -> Optional[BrowserContext]:
+        """이미 만들어진 컨텍스트를 반환합니다 (없으면 로그인하지 않고 None)."""
+        return self._accounts[self.resolve_account(account)].context
+
+    async def get_page_pool(self, account: Optional[str] = None) -> PagePool:
+        """계정의 페이지 풀을 반환합니다."""
+        session = await self._ensure_session(self.resolve_account(account))
+        return session.page_pool
+
+    @asynccontextmanager
+    async def page(self, account: Optional[str] = None) -> AsyncIterator[Page]:
+        """
+        계정의 페이지를 빌렸다가 블록이 끝나면 반납합니다.
+
+        Example:
+            async with session_pool.page("myblog") as page:
+                await handle_list_categories(page, blog_id="myblog")
+        """
+        page_pool = await self.get_page_pool(account)
+        async with page_pool.page() as page:
+            yield page
+
+    async def refresh_account(
+        self, account: Optional[str] = None, drain_timeout: float = 300.0
+    ) -> bool:
+        """
+        계정 세션을 검증하고, 만료되었으면 새로 로그인한 컨텍스트로 교체합니다.
+
+        새 컨텍스트를 먼저 만든 뒤 한 번에 바꿔 끼우므로 이후 Tool 호출은
+        바로 새 컨텍스트를 쓰고, 이미 진행 중인 호출은 이전 컨텍스트에서
+        끝까지 실행된 다음 이전 컨텍스트가 닫힙니다.
+
+        Args:
+            account: 계정 아이디 (None이면 기본 계정)
+            drain_timeout: 이전 컨텍스트의 진행 중인 호출을 기다릴 최대 시간 (초)
+
+        Returns:
+            컨텍스트를 교체했는지 여부 (아직 사용하지 않은 계정이면 False)
+        """
+        account = self.resolve_account(account)
+        session = self._accounts[account]
+        old_context = session.context
+        if old_context is None:
+            return False
+
+        new_context = await session.manager.refresh_session_if_needed(
+            self.browser, old_context, headless=self.headless
+        )
+        if new_context is old_context:
+            return False
+
+        async with session.lock:
+            if self._closed or session.context is not old_context:
+                # 교체 중에 풀이 닫혔거나 다른 곳에서 이미 바뀜
+                await new_context.close()
+                return False
+            old_pool = session.page_pool
+            session.page_pool = PagePool(
+                new_context, size=self.page_pool_size, on_release=self.on_page_release
+            )
+            session.context = new_context
+        logger.info(f"Session context swapped for account: {account}")
+
+        # 진행 중인 호출이 끝난 뒤 이전 컨텍스트 정리
+        if old_pool:
+            await old_pool.close()
+            if not await old_pool.wait_until_unused(timeout=drain_timeout):
+                logger.warning(f"Closing old context with pages still in use: {account}")
+        try:
+            await old_context.close()
+        except Exception as e:
+            logger.debug(f"Failed to close old context for {account}: {e}")
+        return True
+
+    async def refresh_all(self) -> dict[str, bool]:
+        """
+        사용 중인(컨텍스트가 있는) 모든 계정의 세션을 갱신합니다.
+
+        Returns:
+            {계정: 컨텍스트 교체 여부}
+
+        Raises:
+            Exception: 한 계정이라도 갱신에 실패한 경우 첫 번째 에러
+        """
+        results = {}
+        errors = []
+        for account, session in list(self._accounts.items()):
+            if session.context is None:
+                continue
+            try:
+                results[account] = await self.refresh_account(account)
+            except Exception as e:
+                logger.warning(f"Session refresh failed for {account}: {e}")
+                errors.append(e)
+        if errors:
+            raise errors[0]
+        return results
+
+    async def close_account(self, account: str) -> None:
+        """계정의 페이지 풀과 컨텍스트를 닫습니다 (계정 등록은 유지)."""
+        session = self._accounts.get(account)
+        if session is None:
+            return
+
+        async with session.lock:
+            if session.page_pool:
+                await session.page_pool.close()
+            if session.context:
+                try:
+                    await session.context.close()
+                except Exception as e:
+                    logger.debug(f"Failed to close context for {account}: {e}")
+            session.page_pool = None
+            session.context = None
+
+    async def close(self) -> None:
+        """모든 계정의 컨텍스트를 닫습니다."""
+        self._closed = True
+        for account in self.accounts:
+            await self.close_account(account)
+
+    def stats(self) -> dict:
+        """계정별 상태를 반환합니다."""
+        return {
+            account: {
+                "active": session.context is not None,
+                "storage_path": session.manager.storage_path,
+                "pages": session.page_pool.stats() if session.page_pool else None,
+            }
+            for account, session in self._accounts.items()
+        }
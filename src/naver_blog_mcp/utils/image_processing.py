@@ -0,0 +1,165 @@
+"""업로드 전 이미지 전처리 (리사이즈, 재압축, 메타데이터 제거).
+
+인코딩은 CPU를 많이 쓰므로 프로세스 풀에서 실행해
+asyncio 이벤트 루프를 막지 않도록 합니다.
+"""
+
+import asyncio
+import hashlib
+import logging
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+from typing import Optional, Union, List
+
+from PIL import Image, ImageOps
+
+logger = logging.getLogger(__name__)
+
+# Pillow 포맷 → (저장 포맷, 확장자)
+# BMP는 무압축이라 무손실 PNG로 바꿔 저장합니다.
+_OUTPUT_FORMATS = {
+    "JPEG": ("JPEG", ".jpg"),
+    "WEBP": ("WEBP", ".webp"),
+    "PNG": ("PNG", ".png"),
+    "BMP": ("PNG", ".png"),
+}
+
+_executor: Optional[ProcessPoolExecutor] = None
+
+
+def _output_path(
+    source: Path, output_dir: Path, max_edge: int, quality: int, extension: str
+) -> Path:
+    """원본 파일과 설정이 같으면 같은 경로가 나오도록 결과 파일명을 만듭니다."""
+    stat = source.stat()
+    key = f"{source.resolve()}:{stat.st_size}:{stat.st_mtime_ns}:{max_edge}:{quality}"
+    digest = hashlib.sha256(key.encode("utf-8")).hexdigest()[:12]
+    return output_dir / f"{source.stem}-{digest}{extension}"
+
+
+def preprocess_image(
+    source: Union[str, Path],
+    output_dir: Union[str, Path] = "playwright-state/preprocessed",
+    max_edge: int = 2048,
+    quality: int = 85,
+) -> str:
+    """
+    이미지를 긴 변 max_edge 이하로 줄이고, 재압축하고, EXIF 등 메타데이터를 제거합니다.
+
+    프로세스 풀에서 실행되므로 인자/반환값은 모두 pickle 가능한 값이어야 합니다.
+    처리할 수 없는 형식(애니메이션 GIF, HEIC 등)이거나 결과가 원본보다
+    크면 원본 경로를 그대로 반환합니다.
+
+    Args:
+        source: 원본 이미지 경로
+        output_dir: 결과 파일 저장 디렉토리
+        max_edge: 긴 변 최대 픽셀
+        quality: JPEG/WebP 품질 (1-95)
+
+    Returns:
+        업로드할 파일 경로 (전처리 결과 또는 원본)
+    """
+    source = Path(source)
+    output_dir = Path(output_dir)
+
+    with Image.open(source) as img:
+        if img.format not in _OUTPUT_FORMATS or getattr(img, "is_animated", False):
+            return str(source)
+
+        save_format, extension = _OUTPUT_FORMATS[img.format]
+        target = _output_path(source, output_dir, max_edge, quality, extension)
+        if target.exists():
+            return str(target)
+
+        # EXIF 회전 정보를 픽셀에 반영한 뒤 메타데이터를 버림
+        processed = ImageOps.exif_transpose(img)
+        resized = max(processed.size) > max_edge
+        if resized:
+            processed.thumbnail((max_edge, max_edge), Image.Resampling.LANCZOS)
+
+        # 색 재현에 필요한 ICC 프로파일만 유지
+        save_kwargs = {}
+        icc_profile = img.info.get("icc_profile")
+        if icc_profile:
+            save_kwargs["icc_profile"] = icc_profile
+
+        if save_format == "JPEG":
+            if processed.mode not in ("RGB", "L"):
+                processed = processed.convert("RGB")
+            save_kwargs.update(quality=quality, optimize=True, progressive=True)
+        elif save_format == "WEBP":
+            save_kwargs.update(quality=quality, method=4)
+        else:
+            save_kwargs.update(optimize=True)
+
+        output_dir.mkdir(parents=True, exist_ok=True)
+        processed.save(target, save_format, **save_kwargs)
+
+    # 줄이지도 않았는데 용량이 커졌으면 원본 사용
+    if not resized and target.stat().st_size >= source.stat().st_size:
+        target.unlink()
+        return str(source)
+
+    return str(target)
+
+
+def _get_executor(max_workers: Optional[int]) -> ProcessPoolExecutor:
+    global _executor
+    if _executor is None:
+        _executor = ProcessPoolExecutor(max_workers=max_workers or None)
+    return _executor
+
+
+async def preprocess_images(
+    image_paths: List[Union[str, Path]],
+    output_dir: Union[str, Path] = "playwright-state/preprocessed",
+    max_edge: int = 2048,
+    quality: int = 85,
+    max_workers: Optional[int] = None,
+) -> List[str]:
+    """
+    여러 이미지를 프로세스 풀에서 병렬로 전처리합니다.
+
+    실패한 파일은 원본 경로를 그대로 돌려주므로 결과 리스트는
+    항상 입력과 같은 순서/길이를 가집니다.
+
+    Args:
+        image_paths: 원본 이미지 경로 리스트
+        output_dir: 결과 파일 저장 디렉토리
+        max_edge: 긴 변 최대 픽셀
+        quality: JPEG/WebP 품질
+        max_workers: 프로세스 수 (None 또는 0이면 CPU 수)
+
+    Returns:
+        업로드할 파일 경로 리스트
+    """
+    loop = asyncio.get_running_loop()
+    executor = _get_executor(max_workers)
+
+    futures = [
+        loop.run_in_executor(
+            executor, preprocess_image, str(path), str(output_dir), max_edge, quality
+        )
+        for path in image_paths
+    ]
+    results = await asyncio.gather(*futures, return_exceptions=True)
+
+    processed = []
+    for path, result in zip(image_paths, results):
+        if isinstance(result, BaseException):
+            logger.warning(f"Image preprocessing failed, using original: {path} ({result})")
+            processed.append(str(path))
+        else:
+            if result != str(path):
+                logger.info(f"Image preprocessed: {Path(path).name} → {Path(result).name}")
+            processed.append(result)
+
+    return processed
+
+
+def shutdown_preprocess_pool() -> None:
+    """전처리 프로세스 풀을 종료합니다."""
+    global _executor
+    if _executor is not None:
+        _executor.shutdown(wait=False, cancel_futures=True)
+        _executor = None
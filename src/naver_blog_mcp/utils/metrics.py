@@ -0,0 +1,288 @@
+"""Prometheus 텍스트 형식으로 내보낼 수 있는 간단한 메트릭 레지스트리.
+
+외부 라이브러리 없이 카운터/히스토그램을 메모리에 누적하고,
+render()로 Prometheus exposition 형식 문자열을 만듭니다.
+"""
+
+import math
+from typing import Iterable, Optional, Sequence
+
+# 브라우저 자동화 단계 소요 시간(초)에 맞춘 기본 버킷
+DEFAULT_BUCKETS: tuple[float, ...] = (
+    0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0,
+)
+
+
+def _format_value(value: float) -> str:
+    """Prometheus 형식의 숫자 문자열."""
+    if value == math.inf:
+        return "+Inf"
+    if float(value).is_integer():
+        return str(int(value))
+    return repr(float(value))
+
+
+def _escape_label(value: str) -> str:
+    return value.replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _format_labels(pairs: Iterable[tuple[str, str]]) -> str:
+    body = ",".join(f'{name}="{_escape_label(str(value))}"' for name, value in pairs)
+    return f"{{{body}}}" if body else ""
+
+
+class _Metric:
+    """레이블 처리를 공유하는 메트릭 기본 클래스."""
+
+    kind = ""
+
+    def __init__(self, name: str, documentation: str, label_names: Sequence[str] = ()):
+        self.name = name
+        self.documentation = documentation
+        self.label_names = tuple(label_names)
+
+    def _label_values(self, labels: dict) -> tuple[str, ...]:
+        if set(labels) != set(self.label_names):
+            raise ValueError(
+                f"{self.name}: 레이블이 맞지 않습니다 "
+                f"(필요: {self.label_names}, 입력: {tuple(labels)})"
+            )
+        return tuple(str(labels[name]) for name in self.label_names)
+
+    def _header(self) -> list[str]:
+        return [
+            f"# HELP {self.name} {self.documentation}",
+            f"# TYPE {self.name} {self.kind}",
+        ]
+
+    def render(self) -> list[str]:
+        raise NotImplementedError
+
+
+class Counter(_Metric):
+    """레이블별로 증가만 하는 카운터."""
+
+    kind = "counter"
+
+    def __init__(self, name: str, documentation: str, label_names: Sequence[str] = ()):
+        """
+        Counter 초기화.
+
+        Args:
+            name: 메트릭 이름 (예: "naver_blog_tool_calls_total")
+            documentation: HELP 설명
+            label_names: 레이블 이름 목록
+        """
+        super().__init__(name, documentation, label_names)
+        self._values: dict[tuple[str, ...], float] = {}
+
+    def inc(self, amount: float = 1, **labels: str) -> None:
+        """카운터를 amount만큼 증가시킵니다."""
+        if amount < 0:
+            raise ValueError(f"{self.name}: 카운터는 감소할 수 없습니다")
+        key = self._label_values(labels)
+        self._values[key] = self._values.get(key, 0) + amount
+
+    def value(self, **labels: str) -> float:
+        """레이블 조합 하나의 현재 값."""
+        return self._values.get(self._label_values(labels), 0)
+
+    def render(self) -> list[str]:
+        """Prometheus exposition 형식 줄 목록."""
+        lines = self._header()
+        for key, value in sorted(self._values.items()):
+            labels = _format_labels(zip(self.label_names, key))
+            lines.append(f"{self.name}{labels} {_format_value(value)}")
+        return lines
+
+    def clear(self) -> None:
+        """누적값을 모두 지웁니다."""
+        self._values.clear()
+
+
+class Histogram(_Metric):
+    """레이블별 누적 히스토그램."""
+
+    kind = "histogram"
+
+    def __init__(
+        self,
+        name: str,
+        documentation: str,
+        label_names: Sequence[str] = (),
+        buckets: Sequence[float] = DEFAULT_BUCKETS,
+    ):
+        """
+        Histogram 초기화.
+
+        Args:
+            name: 메트릭 이름 (예: "naver_blog_step_duration_seconds")
+            documentation: HELP 설명
+            label_names: 레이블 이름 목록
+            buckets: 버킷 상한값 (오름차순, +Inf는 자동 추가)
+        """
+        super().__init__(name, documentation, label_names)
+        self.buckets = tuple(sorted(buckets))
+        # {레이블 값 튜플: [버킷별 개수, 합계, 전체 개수]}
+        self._series: dict[tuple[str, ...], list] = {}
+
+    def observe(self, value: float, **labels: str) -> None:
+        """관측값 하나를 기록합니다."""
+        key = self._label_values(labels)
+        series = self._series.get(key)
+        if series is None:
+            series = [[0] * len(self.buckets), 0.0, 0]
+            self._series[key] = series
+
+        counts = series[0]
+        for idx, upper in enumerate(self.buckets):
+            if value <= upper:
+                counts[idx] += 1
+        series[1] += value
+        series[2] += 1
+
+    def snapshot(self, **labels: str) -> Optional[dict]:
+        """레이블 조합 하나의 현재 값 (관측값이 없으면 None)."""
+        series = self._series.get(self._label_values(labels))
+        if series is None:
+            return None
+        counts, total, count = series
+        return {
+            "buckets": dict(zip(self.buckets, counts)),
+            "sum": total,
+            "count": count,
+        }
+
+    def render(self) -> list[str]:
+        """Prometheus exposition 형식 줄 목록."""
+        lines = self._header()
+        for key, (counts, total, count) in sorted(self._series.items()):
+            pairs = list(zip(self.label_names, key))
+            for upper, bucket_count in zip(self.buckets, counts):
+                labels = _format_labels(pairs + [("le", _format_value(upper))])
+                lines.append(f"{self.name}_bucket{labels} {bucket_count}")
+            labels = _format_labels(pairs + [("le", "+Inf")])
+            lines.append(f"{self.name}_bucket{labels} {count}")
+            lines.append(f"{self.name}_sum{_format_labels(pairs)} {_format_value(total)}")
+            lines.append(f"{self.name}_count{_format_labels(pairs)} {count}")
+        return lines
+
+    def clear(self) -> None:
+        """누적값을 모두 지웁니다."""
+        self._series.clear()
+
+
+class MetricsRegistry:
+    """이름으로 메트릭을 모아 두는 레지스트리."""
+
+    def __init__(self):
+        self._metrics: dict[str, _Metric] = {}
+
+    def _register(self, metric_type: type, name: str, *args) -> _Metric:
+        metric = self._metrics.get(name)
+        if metric is None:
+            metric = metric_type(name, *args)
+            self._metrics[name] = metric
+        elif not isinstance(metric, metric_type):
+            raise ValueError(f"{name}: 이미 다른 종류의 메트릭으로 등록되어 있습니다")
+        return metric
+
+    def counter(
+        self, name: str, documentation: str, label_names: Sequence[str] = ()
+    ) -> Counter:
+        """카운터를 반환합니다 (없으면 만들어 등록)."""
+        return self._register(Counter, name, documentation, label_names)
+
+    def histogram(
+        self,
+        name: str,
+        documentation: str,
+        label_names: Sequence[str] = (),
+        buckets: Sequence[float] = DEFAULT_BUCKETS,
+    ) -> Histogram:
+        """히스토그램을 반환합니다 (없으면 만들어 등록)."""
+        return self._register(Histogram, name, documentation, label_names, buckets)
+
+    def get(self, name: str) -> Optional[_Metric]:
+        """등록된 메트릭을 반환합니다."""
+        return self._metrics.get(name)
+
+    def render(self) -> str:
+        """등록된 모든 메트릭을 Prometheus 텍스트 형식으로 반환합니다."""
+        lines = []
+        for metric in self._metrics.values():
+            lines.extend(metric.render())
+        return "\n".join(lines) + "\n"
+
+
+# 전역 레지스트리
+registry = MetricsRegistry()
+
+# 글 작성 파이프라인 단계별 소요 시간
+STEP_DURATION = registry.histogram(
+    "naver_blog_step_duration_seconds",
+    "Duration of each create_post pipeline step",
+    label_names=("step", "status"),
+)
+
+# Tool 호출 (status: success, failure=핸들러가 success=False 반환, error=예외)
+TOOL_CALLS = registry.counter(
+    "naver_blog_tool_calls_total",
+    "MCP tool calls by result",
+    label_names=("tool", "status"),
+)
+TOOL_DURATION = registry.histogram(
+    "naver_blog_tool_duration_seconds",
+    "End-to-end duration of MCP tool calls",
+    label_names=("tool",),
+)
+TOOL_ERRORS = registry.counter(
+    "naver_blog_tool_errors_total",
+    "MCP tool call exceptions by exception class",
+    label_names=("tool", "error"),
+)
+
+# retry_on_error 계열 데코레이터의 재시도
+RETRIES = registry.counter(
+    "naver_blog_retries_total",
+    "Retries triggered by the retry decorators",
+    label_names=("function", "error"),
+)
+
+# 세션 검증/로그인
+SESSION_VALIDATIONS = registry.counter(
+    "naver_blog_session_validations_total",
+    "Session validity checks by method and result",
+    label_names=("method", "result"),
+)
+SESSION_LOGINS = registry.counter(
+    "naver_blog_session_logins_total",
+    "Fresh Naver logins (initial or re-login) by result",
+    label_names=("result",),
+)
+
+# 이미지 업로드
+UPLOAD_BYTES = registry.counter(
+    "naver_blog_upload_bytes_total",
+    "Image bytes handed to the editor file input",
+    label_names=("source",),
+)
+UPLOAD_IMAGES = registry.counter(
+    "naver_blog_upload_images_total",
+    "Images processed by upload_images by result",
+    label_names=("result",),
+)
+
+# 요소를 찾으려고 검사한 프레임 수 (편집기 프레임을 알면 단계당 1)
+FRAMES_PROBED = registry.counter(
+    "naver_blog_frames_probed_total",
+    "Frames probed while looking for editor elements, by step",
+    label_names=("step",),
+)
+
+# 네트워크 차단 프로필로 보내기 전에 끊은 요청 (NETWORK_BLOCKING)
+BLOCKED_REQUESTS = registry.counter(
+    "naver_blog_blocked_requests_total",
+    "Requests aborted by the network blocking profile, by resource type and reason",
+    label_names=("resource_type", "reason"),
+)
@@ -13,10 +13,28 @@ from tenacity import (
 )
 
 from .error_handler import is_retryable_error
+from .metrics import RETRIES
 
 logger = logging.getLogger(__name__)
 
 
+def _count_retry(retry_state) -> None:
+    """재시도 직전에 함수/에러별 재시도 횟수를 기록합니다."""
+    error = retry_state.outcome.exception() if retry_state.outcome else None
+    RETRIES.inc(
+        function=getattr(retry_state.fn, "__name__", "unknown"),
+        error=type(error).__name__ if error else "none",
+    )
+
+
+def _before_sleep(log_callback: Callable) -> Callable:
+    """재시도 로그와 메트릭 기록을 함께 하는 before_sleep 콜백."""
+    def callback(retry_state) -> None:
+        _count_retry(retry_state)
+        log_callback(retry_state)
+    return callback
+
+
 def create_retry_decorator(
     max_attempts: int = 3,
     min_wait: int = 2,
@@ -42,8 +60,8 @@ def create_retry_decorator(
         stop=stop_after_attempt(max_attempts),
         # 지수 백오프
         wait=wait_exponential(multiplier=multiplier, min=min_wait, max=max_wait),
-        # 재시도 전 로깅
-        before_sleep=before_sleep_log(logger, logging.WARNING),
+        # 재시도 전 로깅 + 재시도 횟수 기록
+        before_sleep=_before_sleep(before_sleep_log(logger, logging.WARNING)),
         # 완료 후 로깅
         after=after_log(logger, logging.INFO),
         # 재시도 시 에러 다시 발생
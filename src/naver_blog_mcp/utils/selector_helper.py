@@ -1,15 +1,217 @@
-"""셀렉터 헬퍼 유틸리티."""
+"""셀렉터 헬퍼 유틸리티.
 
+대체 셀렉터 목록은 한 번의 페이지 내 evaluate로 모두 검사합니다.
+`locator(...).count()`를 셀렉터마다 호출하면 셀렉터 수만큼 브라우저 왕복이
+생기므로, 앞쪽 셀렉터가 빗나갈수록 느려집니다.
+
+일괄 검사는 document.querySelectorAll을 쓰므로 Playwright CSS 엔진과 달리 열린
+shadow root 안의 요소는 보지 못합니다. 일괄 검사에서 0개로 나온 셀렉터는
+locator.count()로 다시 확인하지 않으므로, shadow DOM 안의 요소를 찾아야 하는
+곳은 find_element_with_alternatives(찾지 못하면 locator로 재확인)를 쓰세요.
+"""
+
+import asyncio
 import logging
-from typing import Optional, Union, List
+import re
+from typing import AsyncIterator, Optional, Union, List
 
-from playwright.async_api import Page, Locator, TimeoutError as PlaywrightTimeoutError
+from playwright.async_api import Page, Frame, Locator
 
+from ..config import config
 from .exceptions import ElementNotFoundError
+from .selector_stats import selector_stats
 
 logger = logging.getLogger(__name__)
 
 
+# 셀렉터 끝에 붙은 Playwright 전용 의사 클래스 (:visible, :has-text('...'))
+_TRAILING_VISIBLE = re.compile(r":visible$")
+_TRAILING_HAS_TEXT = re.compile(r""":has-text\((['"])([^'"]*)\1\)$""")
+
+# 페이지 안에서 해석할 수 없는 Playwright 셀렉터 문법
+_UNSUPPORTED_SYNTAX = (">>", ":has-text(", ":visible", ":text(", ":nth-match(", "text=", "xpath=", "//")
+
+# find_element_with_alternatives가 요소를 기다릴 때 다시 검사하는 간격 (초)
+_POLL_INTERVAL = 0.1
+
+# 셀렉터별 일치 개수 (해석할 수 없는 셀렉터는 null)
+# document.querySelectorAll이므로 열린 shadow root 안은 검사하지 않음
+_PROBE_SCRIPT = """
+(specs) => {
+    const normalize = (text) => (text || '').replace(/\\s+/g, ' ').trim().toLowerCase();
+    const isVisible = (el) => {
+        const rect = el.getBoundingClientRect();
+        return rect.width > 0 && rect.height > 0
+            && getComputedStyle(el).visibility !== 'hidden';
+    };
+    return specs.map((spec) => {
+        if (!spec) return null;
+        let elements;
+        try {
+            elements = Array.from(document.querySelectorAll(spec.css));
+        } catch (e) {
+            return null;
+        }
+        if (spec.text !== null) {
+            const text = normalize(spec.text);
+            elements = elements.filter((el) => normalize(el.textContent).includes(text));
+        }
+        if (spec.visible) {
+            elements = elements.filter(isVisible);
+        }
+        return elements.length;
+    });
+}
+"""
+
+
+def parse_selector(selector: str) -> Optional[dict]:
+    """
+    셀렉터를 페이지 안에서 검사할 수 있는 형태로 나눕니다.
+
+    CSS 셀렉터와, 끝에 붙은 `:has-text('...')` / `:visible`만 지원합니다.
+    그 밖의 Playwright 전용 문법이 있으면 None을 반환합니다.
+
+    Args:
+        selector: Playwright 셀렉터
+
+    Returns:
+        {"css": str, "text": str | None, "visible": bool} 또는 None
+    """
+    css = selector.strip()
+    text = None
+    visible = False
+
+    while True:
+        if _TRAILING_VISIBLE.search(css):
+            css = _TRAILING_VISIBLE.sub("", css)
+            visible = True
+            continue
+        match = _TRAILING_HAS_TEXT.search(css)
+        if match and text is None:
+            css = css[: match.start()]
+            text = match.group(2)
+            continue
+        break
+
+    if not css or any(syntax in css for syntax in _UNSUPPORTED_SYNTAX):
+        return None
+    return {"css": css, "text": text, "visible": visible}
+
+
+async def _probe_selectors(
+    scope: Union[Page, Frame], selectors: List[str]
+) -> List[Optional[int]]:
+    """셀렉터별 일치 개수를 한 번의 왕복으로 구합니다 (검사하지 못한 셀렉터는 None)."""
+    specs = [parse_selector(selector) for selector in selectors]
+    if not any(specs):
+        return [None] * len(selectors)
+    try:
+        return await scope.evaluate(_PROBE_SCRIPT, specs)
+    except Exception as e:
+        logger.debug(f"Selector probe failed, falling back to locator counts: {e}")
+        return [None] * len(selectors)
+
+
+async def _count(scope: Union[Page, Frame], selector: str) -> int:
+    """Playwright locator로 일치 개수를 셉니다 (실패하면 0)."""
+    try:
+        return await scope.locator(selector).count()
+    except Exception as e:
+        logger.debug(f"Selector count failed: {selector} - {e}")
+        return 0
+
+
+async def count_selectors(
+    scope: Union[Page, Frame], selectors: Union[str, List[str]]
+) -> List[int]:
+    """
+    셀렉터별 일치 개수를 반환합니다.
+
+    Args:
+        scope: Page 또는 Frame
+        selectors: 셀렉터 문자열 또는 대체 셀렉터 리스트
+
+    Returns:
+        셀렉터 순서대로의 일치 개수
+    """
+    if isinstance(selectors, str):
+        selectors = [selectors]
+    counts = await _probe_selectors(scope, selectors)
+    return [
+        count if count is not None else await _count(scope, selector)
+        for selector, count in zip(selectors, counts)
+    ]
+
+
+async def matching_selectors(
+    scope: Union[Page, Frame],
+    selectors: Union[str, List[str]],
+    context: str = "unknown",
+) -> AsyncIterator[str]:
+    """
+    요소가 있는 셀렉터를 우선순위(리스트 순서)대로 내놓습니다.
+
+    모든 셀렉터를 한 번에 검사하고, 페이지 안에서 해석할 수 없는 셀렉터만
+    그 차례가 되었을 때 locator.count()로 따로 확인합니다. 앞 셀렉터로 한
+    동작이 실패했을 때 다음 셀렉터를 이어서 시도하는 용도입니다.
+
+    context가 주어지면 셀렉터 통계의 키로 쓰여, 최근에 계속 빗나간 셀렉터는
+    뒤로 미루고 이번 검사 결과를 통계에 기록합니다.
+
+    Args:
+        scope: Page 또는 Frame
+        selectors: 셀렉터 문자열 또는 대체 셀렉터 리스트
+        context: 컨텍스트 (로깅용, 셀렉터 통계 키)
+
+    Yields:
+        요소가 하나 이상 있는 셀렉터
+    """
+    if isinstance(selectors, str):
+        selectors = [selectors]
+
+    track = config.SELECTOR_STATS_ENABLED and context != "unknown" and len(selectors) > 1
+    if track:
+        selectors = selector_stats.rank(context, selectors)
+
+    counts = await _probe_selectors(scope, selectors)
+    if track:
+        selector_stats.record(
+            context,
+            {selector: count for selector, count in zip(selectors, counts) if count is not None},
+        )
+
+    for idx, (selector, count) in enumerate(zip(selectors, counts)):
+        if count is None:
+            count = await _count(scope, selector)
+            if track:
+                selector_stats.record(context, {selector: count})
+        if count > 0:
+            logger.debug(f"Selector {idx + 1}/{len(selectors)} matched in {context}: {selector}")
+            yield selector
+
+
+async def race_selectors(
+    scope: Union[Page, Frame],
+    selectors: Union[str, List[str]],
+    context: str = "unknown",
+) -> Optional[str]:
+    """
+    요소가 있는 첫 번째 셀렉터를 반환합니다.
+
+    Args:
+        scope: Page 또는 Frame
+        selectors: 셀렉터 문자열 또는 대체 셀렉터 리스트
+        context: 컨텍스트 (로깅용, 셀렉터 통계 키)
+
+    Returns:
+        일치한 셀렉터 (없으면 None)
+    """
+    async for selector in matching_selectors(scope, selectors, context):
+        return selector
+    return None
+
+
 async def find_element_with_alternatives(
     page: Page,
     selectors: Union[str, List[str]],
@@ -19,10 +221,14 @@ async def find_element_with_alternatives(
     """
     여러 대체 셀렉터를 시도하여 요소를 찾습니다.
 
+    모든 대체 셀렉터를 한 번에 검사하고, 아무것도 없으면 timeout 동안
+    _POLL_INTERVAL마다 다시 검사합니다. 끝까지 없으면 일괄 검사가 보지 못하는
+    shadow DOM 안의 요소를 위해 셀렉터마다 locator.count()로 한 번 더 확인합니다.
+
     Args:
         page: Playwright Page 객체
         selectors: 셀렉터 문자열 또는 대체 셀렉터 리스트
-        timeout: 각 셀렉터의 타임아웃 (ms)
+        timeout: 요소가 나타나기를 기다릴 최대 시간 (ms, 0이면 한 번만 검사)
         context: 컨텍스트 (로깅용)
 
     Returns:
@@ -35,24 +241,23 @@ async def find_element_with_alternatives(
     if isinstance(selectors, str):
         selectors = [selectors]
 
-    for idx, selector in enumerate(selectors):
-        try:
-            logger.debug(f"Trying selector {idx + 1}/{len(selectors)} in {context}: {selector}")
-
-            # 요소가 존재하는지 확인
-            locator = page.locator(selector)
-            count = await locator.count()
-
-            if count > 0:
-                logger.info(f"Found element with selector {idx + 1} in {context}: {selector}")
-                return locator.first
-
-        except PlaywrightTimeoutError:
-            logger.debug(f"Selector {idx + 1} timed out in {context}: {selector}")
-            continue
-        except Exception as e:
-            logger.warning(f"Selector {idx + 1} failed in {context}: {selector} - {e}")
-            continue
+    # 모든 대체 셀렉터를 한 번에 검사 (없으면 timeout까지 다시 검사)
+    loop = asyncio.get_running_loop()
+    deadline = loop.time() + max(0, timeout) / 1000
+    while True:
+        selector = await race_selectors(page, selectors, context)
+        if selector is not None:
+            logger.info(f"Found element in {context}: {selector}")
+            return page.locator(selector).first
+        if loop.time() >= deadline:
+            break
+        await asyncio.sleep(min(_POLL_INTERVAL, max(0.0, deadline - loop.time())))
+
+    # 열린 shadow root 안은 Playwright 엔진으로만 보이므로 마지막으로 재확인
+    for selector in selectors:
+        if await _count(page, selector) > 0:
+            logger.info(f"Found element in {context} via locator: {selector}")
+            return page.locator(selector).first
 
     # 모든 셀렉터 실패
     raise ElementNotFoundError(
@@ -76,7 +281,7 @@ async def click_with_alternatives(
     Args:
         page: Playwright Page 객체
         selectors: 셀렉터 문자열 또는 대체 셀렉터 리스트
-        timeout: 각 셀렉터의 타임아웃 (ms)
+        timeout: 요소를 기다릴 최대 시간이자 클릭 타임아웃 (ms)
         context: 컨텍스트 (로깅용)
 
     Returns:
@@ -105,7 +310,7 @@ async def fill_with_alternatives(
         page: Playwright Page 객체
         selectors: 셀렉터 문자열 또는 대체 셀렉터 리스트
         value: 입력할 값
-        timeout: 각 셀렉터의 타임아웃 (ms)
+        timeout: 요소를 기다릴 최대 시간이자 입력 타임아웃 (ms)
         context: 컨텍스트 (로깅용)
 
     Returns:
@@ -0,0 +1,193 @@
+"""대체 셀렉터 적중 통계와 순위.
+
+셀렉터 키(예: "title_input")별로 각 대체 셀렉터의 적중/실패 횟수와 마지막
+성공 시각을 JSON 파일에 기록합니다. 같은 검사에서 다른 대체 셀렉터는 맞았는데
+자신은 연속으로 빗나간 셀렉터는 목록 뒤로 미뤄, 네이버 UI가 바뀌어도 지금
+동작하는 셀렉터가 맨 앞에 오도록 합니다. 밀려난 셀렉터도 계속 검사하므로
+다시 맞기 시작하면 원래 자리로 돌아옵니다.
+
+요소 자체가 없는 경우(팝업이 뜨지 않은 경우 등)는 어떤 셀렉터의 실패로도
+기록하지 않습니다.
+"""
+
+import json
+import logging
+import time
+from pathlib import Path
+from typing import Dict, List, Optional
+
+from ..config import config
+
+logger = logging.getLogger(__name__)
+
+
+def _new_entry() -> dict:
+    return {"hits": 0, "misses": 0, "consecutive_misses": 0, "last_success": None}
+
+
+class SelectorStats:
+    """셀렉터 키 → 대체 셀렉터별 적중 통계 (JSON 파일에 저장)."""
+
+    def __init__(
+        self,
+        stats_path: str = "playwright-state/selector_stats.json",
+        demote_after: int = 3,
+        save_interval: float = 30.0,
+    ):
+        """
+        SelectorStats 초기화.
+
+        Args:
+            stats_path: 통계 JSON 파일 경로
+            demote_after: 연속으로 이만큼 빗나가면 목록 뒤로 미루고 죽은 셀렉터로 보고
+            save_interval: 디스크 기록 최소 간격 (초, 남은 변경은 flush()에서 기록)
+        """
+        self.stats_path = Path(stats_path)
+        self.demote_after = max(1, demote_after)
+        self.save_interval = save_interval
+        self._stats: Dict[str, Dict[str, dict]] = {}
+        self._loaded = False
+        self._dirty = False
+        self._last_save: Optional[float] = None
+
+    def _load(self) -> None:
+        """디스크 통계를 최초 1회만 메모리로 읽어옵니다."""
+        if self._loaded:
+            return
+        self._loaded = True
+
+        if not self.stats_path.exists():
+            return
+
+        try:
+            self._stats = json.loads(self.stats_path.read_text(encoding="utf-8"))
+        except Exception as e:
+            logger.warning(f"셀렉터 통계 파일을 읽지 못했습니다: {e}")
+
+    def _save(self) -> None:
+        """메모리 통계를 디스크에 기록합니다."""
+        try:
+            self.stats_path.parent.mkdir(parents=True, exist_ok=True)
+            self.stats_path.write_text(
+                json.dumps(self._stats, ensure_ascii=False, indent=2),
+                encoding="utf-8",
+            )
+            self._dirty = False
+            self._last_save = time.monotonic()
+        except Exception as e:
+            logger.warning(f"셀렉터 통계 파일을 저장하지 못했습니다: {e}")
+
+    def record(self, key: str, counts: Dict[str, int]) -> None:
+        """
+        한 번의 검사 결과를 기록합니다.
+
+        하나라도 맞은 셀렉터가 있을 때만 기록합니다 (요소가 없으면 무시).
+
+        Args:
+            key: 셀렉터 키
+            counts: 셀렉터 → 일치한 요소 개수
+        """
+        if not any(counts.values()):
+            return
+
+        self._load()
+        entries = self._stats.setdefault(key, {})
+        now = time.time()
+        for selector, count in counts.items():
+            entry = entries.setdefault(selector, _new_entry())
+            if count > 0:
+                entry["hits"] += 1
+                entry["consecutive_misses"] = 0
+                entry["last_success"] = now
+            else:
+                entry["misses"] += 1
+                entry["consecutive_misses"] += 1
+
+        self._dirty = True
+        if (
+            self._last_save is None
+            or time.monotonic() - self._last_save >= self.save_interval
+        ):
+            self._save()
+
+    def _is_demoted(self, entry: dict) -> bool:
+        return entry["consecutive_misses"] >= self.demote_after
+
+    def rank(self, key: str, selectors: List[str]) -> List[str]:
+        """
+        대체 셀렉터를 최근 성공 기준으로 정렬합니다.
+
+        연속으로 빗나간 셀렉터만 뒤로 보내고, 나머지는 원래 우선순위를 유지합니다.
+        뒤로 보낸 셀렉터끼리는 최근에 성공한 것이 앞에 옵니다.
+
+        Args:
+            key: 셀렉터 키
+            selectors: 원래 우선순위의 대체 셀렉터 목록
+
+        Returns:
+            정렬된 셀렉터 목록
+        """
+        self._load()
+        entries = self._stats.get(key)
+        if not entries:
+            return list(selectors)
+
+        active, demoted = [], []
+        for selector in selectors:
+            entry = entries.get(selector)
+            if entry and self._is_demoted(entry):
+                demoted.append(selector)
+            else:
+                active.append(selector)
+        demoted.sort(key=lambda selector: -(entries[selector]["last_success"] or 0))
+        return active + demoted
+
+    def dead_selectors(self) -> Dict[str, List[dict]]:
+        """
+        연속으로 빗나가고 있는 셀렉터를 키별로 반환합니다.
+
+        Returns:
+            {key: [{"selector", "hits", "misses", "consecutive_misses",
+                    "last_success"}, ...]}
+        """
+        self._load()
+        dead = {}
+        for key, entries in self._stats.items():
+            selectors = [
+                {"selector": selector, **entry}
+                for selector, entry in entries.items()
+                if self._is_demoted(entry)
+            ]
+            if selectors:
+                dead[key] = selectors
+        return dead
+
+    def report(self) -> dict:
+        """키별 통계와 죽은 셀렉터 목록을 반환합니다."""
+        self._load()
+        return {
+            "keys": {key: dict(entries) for key, entries in self._stats.items()},
+            "dead": self.dead_selectors(),
+        }
+
+    def log_dead_selectors(self) -> None:
+        """죽은 셀렉터를 경고 로그로 남깁니다."""
+        for key, selectors in self.dead_selectors().items():
+            for item in selectors:
+                never = " (한 번도 맞지 않음)" if not item["hits"] else ""
+                logger.warning(
+                    f"Dead selector in {key}: {item['selector']} - "
+                    f"{item['consecutive_misses']} consecutive misses{never}"
+                )
+
+    def flush(self) -> None:
+        """아직 기록하지 않은 변경을 디스크에 기록합니다."""
+        if self._dirty:
+            self._save()
+
+
+# 전역 SelectorStats 인스턴스
+selector_stats = SelectorStats(
+    stats_path=config.SELECTOR_STATS_PATH,
+    demote_after=config.SELECTOR_DEMOTE_AFTER,
+)
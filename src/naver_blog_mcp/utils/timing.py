@@ -0,0 +1,216 @@
+"""단계별 소요 시간 측정 유틸리티."""
+
+import functools
+import json
+import logging
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Any, Awaitable, Callable, Iterator, Optional, TypeVar
+
+from .metrics import STEP_DURATION
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+
+class StepTimer:
+    """작업의 단계별 소요 시간을 기록합니다."""
+
+    def __init__(self, name: str):
+        """
+        StepTimer 초기화.
+
+        Args:
+            name: 측정 대상 작업 이름 (예: "create_post")
+        """
+        self.name = name
+        self.steps: list[tuple[str, float]] = []
+        self._started = time.perf_counter()
+
+    @contextmanager
+    def step(self, step_name: str) -> Iterator[None]:
+        """
+        블록 실행 시간을 step_name으로 기록합니다.
+
+        Example:
+            with timer.step("navigate"):
+                await navigate_to_post_write_page(page)
+        """
+        started = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.steps.append((step_name, time.perf_counter() - started))
+
+    def total(self) -> float:
+        """측정 시작 이후 전체 경과 시간 (초)."""
+        return time.perf_counter() - self._started
+
+    def report(self) -> dict:
+        """단계별 소요 시간 리포트를 반환합니다."""
+        return {
+            "name": self.name,
+            "total_ms": round(self.total() * 1000, 1),
+            "steps": [
+                {"step": step_name, "ms": round(elapsed * 1000, 1)}
+                for step_name, elapsed in self.steps
+            ],
+        }
+
+    def log_report(self) -> None:
+        """단계별 소요 시간을 로그로 출력합니다."""
+        summary = ", ".join(
+            f"{step_name}={elapsed * 1000:.0f}ms" for step_name, elapsed in self.steps
+        )
+        logger.info(f"[timing] {self.name} total={self.total() * 1000:.0f}ms ({summary})")
+
+
+class SpanRecorder:
+    """
+    한 작업(Tool 호출) 안에서 실행된 span을 모읍니다.
+
+    recording() 블록 안에서 실행되는 span()은 contextvar로 이 기록기를 찾으므로
+    단계 함수에 기록기를 인자로 넘길 필요가 없고, 동시에 실행되는
+    다른 Tool 호출(다른 asyncio Task)의 span과 섞이지 않습니다.
+    """
+
+    def __init__(self, name: str, **attributes: Any):
+        """
+        SpanRecorder 초기화.
+
+        Args:
+            name: 작업 이름 (예: "create_post")
+            **attributes: JSON 로그에 함께 남길 값 (예: request_id)
+        """
+        self.name = name
+        self.attributes = attributes
+        self.spans: list[dict] = []
+        self.counters: dict[str, int] = {}
+        self._starts: list[float] = []
+        self._started = time.perf_counter()
+
+    def elapsed(self) -> float:
+        """기록 시작 이후 경과 시간 (초)."""
+        return time.perf_counter() - self._started
+
+    def add(
+        self, name: str, parent: Optional[str], started: float, duration: float, status: str
+    ) -> None:
+        """끝난 span 하나를 추가합니다."""
+        self._starts.append(started)
+        self.spans.append({
+            "name": name,
+            "parent": parent,
+            "start_ms": round((started - self._started) * 1000, 1),
+            "duration_ms": round(duration * 1000, 1),
+            "status": status,
+        })
+
+    def incr(self, name: str, amount: int = 1) -> None:
+        """작업 단위 카운터를 증가시킵니다 (예: 검사한 프레임 수)."""
+        self.counters[name] = self.counters.get(name, 0) + amount
+
+    def report(self) -> dict:
+        """span 목록 리포트 (시작 순서대로, 카운터가 있으면 함께)."""
+        report = {
+            "name": self.name,
+            "total_ms": round(self.elapsed() * 1000, 1),
+            # span은 끝난 순서로 쌓이므로 시작 순서로 정렬 (부모가 자식보다 먼저)
+            "spans": [
+                span for _, span in sorted(
+                    zip(self._starts, self.spans), key=lambda pair: pair[0]
+                )
+            ],
+        }
+        if self.counters:
+            report["counters"] = dict(self.counters)
+        return report
+
+    def log_json(self) -> None:
+        """리포트를 한 줄짜리 JSON 로그로 남깁니다."""
+        record = {"event": "spans", **self.attributes, **self.report()}
+        logger.info(json.dumps(record, ensure_ascii=False, default=str))
+
+
+_current_recorder: ContextVar[Optional[SpanRecorder]] = ContextVar(
+    "span_recorder", default=None
+)
+_current_span: ContextVar[Optional[str]] = ContextVar("current_span", default=None)
+
+
+def current_recorder() -> Optional[SpanRecorder]:
+    """현재 실행 흐름의 SpanRecorder (없으면 None)."""
+    return _current_recorder.get()
+
+
+@contextmanager
+def recording(name: str, **attributes: Any) -> Iterator[SpanRecorder]:
+    """
+    블록 안의 span을 기록하고, 끝나면 JSON 로그로 남깁니다.
+
+    이미 기록 중이면 바깥 기록기를 그대로 사용합니다 (로그도 바깥에서 한 번).
+
+    Example:
+        with recording("create_post") as recorder:
+            await create_blog_post(page, title, content)
+        result["timings"] = recorder.report()
+    """
+    recorder = _current_recorder.get()
+    if recorder is not None:
+        yield recorder
+        return
+
+    recorder = SpanRecorder(name, **attributes)
+    token = _current_recorder.set(recorder)
+    try:
+        yield recorder
+    finally:
+        _current_recorder.reset(token)
+        recorder.log_json()
+
+
+@contextmanager
+def span(name: str) -> Iterator[None]:
+    """
+    블록 실행 시간을 span으로 기록합니다.
+
+    소요 시간은 항상 단계별 히스토그램에 누적하고, 기록 중인
+    SpanRecorder가 있으면 바깥 span을 부모로 해서 추가합니다.
+
+    Example:
+        with span("publish.confirm"):
+            await click_confirm(page)
+    """
+    parent = _current_span.get()
+    token = _current_span.set(name)
+    started = time.perf_counter()
+    status = "error"
+    try:
+        yield
+        status = "ok"
+    finally:
+        duration = time.perf_counter() - started
+        _current_span.reset(token)
+        STEP_DURATION.observe(duration, step=name, status=status)
+        recorder = _current_recorder.get()
+        if recorder is not None:
+            recorder.add(name, parent, started, duration, status)
+
+
+def traced(name: str) -> Callable[[Callable[..., Awaitable[T]]], Callable[..., Awaitable[T]]]:
+    """
+    async 함수 전체를 span으로 기록하는 데코레이터.
+
+    Example:
+        @traced("publish")
+        async def publish_post(page): ...
+    """
+    def decorator(func: Callable[..., Awaitable[T]]) -> Callable[..., Awaitable[T]]:
+        @functools.wraps(func)
+        async def wrapper(*args: Any, **kwargs: Any) -> T:
+            with span(name):
+                return await func(*args, **kwargs)
+        return wrapper
+    return decorator
@@ -1,147 +1,320 @@
-"""Playwright Trace 관리 유틸리티."""
+"""Playwright Trace 관리 유틸리티.
 
+녹화 모드:
+- off: 녹화하지 않음
+- on_failure: 매 호출을 메모리에만 녹화하고 실패한 호출만 파일로 저장
+- sampled: sample_rate 비율의 호출만 녹화해 저장
+- full: 모든 호출을 녹화해 저장
+
+Tool 호출마다 trace() 스코프를 열고, 컨텍스트당 tracing.start()는 한 번만
+한 뒤 호출 단위로 tracing chunk를 나눠 저장합니다. 같은 컨텍스트에서 호출이
+겹치면 Playwright는 chunk를 하나만 열 수 있으므로 겹친 호출들이 chunk를
+공유하고, 마지막 호출이 끝날 때 참여한 request id를 모두 이름에 담아 저장합니다.
+"""
+
+import asyncio
 import logging
+import random
+import time
+import uuid
+import weakref
+from contextlib import asynccontextmanager
+from dataclasses import dataclass, field
 from datetime import datetime
 from pathlib import Path
-from typing import Optional
+from typing import AsyncIterator, Optional
 
 from playwright.async_api import BrowserContext
 
+from ..config import config
+
 logger = logging.getLogger(__name__)
 
+TRACE_MODES = ("off", "on_failure", "sampled", "full")
+
+
+@dataclass
+class TraceScope:
+    """Tool 호출 하나의 Trace 스코프.
+
+    블록 안에서 예외 없이 실패한 경우(핸들러가 success=False 반환 등)에는
+    success를 False로 바꿔 실패로 기록되게 합니다. path는 chunk가 저장될 때
+    채워지며, 다른 호출과 chunk를 공유하면 마지막 호출이 끝난 뒤에 채워집니다.
+    """
+
+    name: str
+    request_id: str
+    traced: bool = False
+    success: bool = True
+    path: Optional[str] = None
+    overhead_ms: float = 0.0
+
+
+@dataclass
+class _ContextTraceState:
+    """컨텍스트 하나의 tracing 상태 (열린 chunk와 참여 중인 스코프)."""
+
+    started: bool = False
+    chunk_open: bool = False
+    # 참여 중인 스코프 수 (request_id가 같은 스코프도 따로 셈)
+    active: int = 0
+    participants: list = field(default_factory=list)
+    lock: asyncio.Lock = field(default_factory=asyncio.Lock)
+
 
 class TraceManager:
     """Playwright Trace 녹화 및 관리."""
 
-    def __init__(self, traces_dir: str = "playwright-state/traces"):
+    def __init__(
+        self,
+        traces_dir: str = "playwright-state/traces",
+        mode: str = "full",
+        sample_rate: float = 0.1,
+        max_dir_bytes: int = 0,
+    ):
         """
         TraceManager 초기화.
 
         Args:
             traces_dir: Trace 파일 저장 디렉토리
+            mode: 녹화 모드 ("off", "on_failure", "sampled", "full")
+            sample_rate: sampled 모드에서 녹화할 호출 비율 (0.0-1.0)
+            max_dir_bytes: Trace 디렉토리 최대 크기 (넘으면 오래된 파일부터 삭제, 0이면 제한 없음)
+
+        Raises:
+            ValueError: 지원하지 않는 녹화 모드
         """
+        if mode not in TRACE_MODES:
+            raise ValueError(f"지원하지 않는 Trace 모드: {mode} (가능: {TRACE_MODES})")
+
         self.traces_dir = Path(traces_dir)
         self.traces_dir.mkdir(parents=True, exist_ok=True)
-        self.is_tracing = False
-        self.current_trace_name: Optional[str] = None
+        self.mode = mode
+        self.sample_rate = sample_rate
+        self.max_dir_bytes = max_dir_bytes
+        self._states: "weakref.WeakKeyDictionary[BrowserContext, _ContextTraceState]" = (
+            weakref.WeakKeyDictionary()
+        )
 
-    async def start_trace(
-        self,
-        context: BrowserContext,
-        name: str = "trace",
-        screenshots: bool = True,
-        snapshots: bool = True,
-        sources: bool = True,
-    ) -> None:
+        # 오버헤드 지표
+        self.calls = 0
+        self.traced = 0
+        self.saved = 0
+        self.discarded = 0
+        self.pruned = 0
+        self.bytes_written = 0
+        self.overhead_seconds = 0.0
+        self.last_overhead_ms = 0.0
+
+    def _should_trace(self) -> bool:
+        """이번 호출을 녹화할지 결정합니다."""
+        if self.mode == "off":
+            return False
+        if self.mode == "sampled":
+            return random.random() < self.sample_rate
+        return True
+
+    def _should_save(self, success: bool) -> bool:
+        """녹화한 Trace를 파일로 남길지 결정합니다."""
+        return self.mode != "on_failure" or not success
+
+    def _record_overhead(self, scope: TraceScope, seconds: float) -> None:
+        self.overhead_seconds += seconds
+        scope.overhead_ms += seconds * 1000
+        self.last_overhead_ms = scope.overhead_ms
+
+    def prune(self) -> int:
         """
-        Trace 녹화를 시작합니다.
+        Trace 디렉토리가 max_dir_bytes를 넘으면 오래된 파일부터 삭제합니다.
 
-        Args:
-            context: BrowserContext 객체
-            name: Trace 이름
-            screenshots: 스크린샷 포함 여부
-            snapshots: DOM 스냅샷 포함 여부
-            sources: 소스 코드 포함 여부
+        Returns:
+            삭제한 파일 수
         """
-        if self.is_tracing:
-            logger.warning("Trace is already running")
-            return
+        if self.max_dir_bytes <= 0:
+            return 0
 
-        try:
-            await context.tracing.start(
-                screenshots=screenshots,
-                snapshots=snapshots,
-                sources=sources,
-            )
-            self.is_tracing = True
-            self.current_trace_name = name
-            logger.info(f"Started trace: {name}")
-        except Exception as e:
-            logger.error(f"Failed to start trace: {e}")
+        traces = sorted(self.traces_dir.glob("*.zip"), key=lambda p: p.stat().st_mtime)
+        total = sum(p.stat().st_size for p in traces)
+        removed = 0
+        # 방금 저장한 파일(가장 최신)은 남김
+        for trace in traces[:-1]:
+            if total <= self.max_dir_bytes:
+                break
+            size = trace.stat().st_size
+            try:
+                trace.unlink()
+            except OSError as e:
+                logger.debug(f"Failed to delete old trace {trace}: {e}")
+                continue
+            total -= size
+            removed += 1
+
+        if removed:
+            self.pruned += removed
+            logger.info(f"Pruned {removed} old traces (dir size {total / 1024 / 1024:.1f}MB)")
+        return removed
+
+    def stats(self) -> dict:
+        """Trace 녹화 지표를 반환합니다."""
+        return {
+            "mode": self.mode,
+            "calls": self.calls,
+            "traced": self.traced,
+            "saved": self.saved,
+            "discarded": self.discarded,
+            "pruned": self.pruned,
+            "bytes_written": self.bytes_written,
+            "overhead_ms_total": round(self.overhead_seconds * 1000, 1),
+            "overhead_ms_avg": (
+                round(self.overhead_seconds * 1000 / self.traced, 1) if self.traced else 0.0
+            ),
+            "last_overhead_ms": round(self.last_overhead_ms, 1),
+        }
 
-    async def stop_trace(
+    def active_scopes(self, context: BrowserContext) -> int:
+        """컨텍스트에서 녹화 중인 스코프 수를 반환합니다."""
+        state = self._states.get(context)
+        return state.active if state else 0
+
+    async def _enter(
         self,
         context: BrowserContext,
-        success: bool = True,
-    ) -> Optional[str]:
-        """
-        Trace 녹화를 중지하고 저장합니다.
+        scope: TraceScope,
+        screenshots: bool,
+        snapshots: bool,
+        sources: bool,
+    ) -> None:
+        """스코프를 열린 chunk에 참여시키고, 없으면 chunk를 엽니다."""
+        state = self._states.setdefault(context, _ContextTraceState())
+        async with state.lock:
+            try:
+                if not state.started:
+                    # tracing.start()는 첫 chunk도 함께 시작함
+                    await context.tracing.start(
+                        title=scope.name,
+                        screenshots=screenshots,
+                        snapshots=snapshots,
+                        sources=sources,
+                    )
+                    state.started = True
+                    state.chunk_open = True
+                elif not state.chunk_open:
+                    await context.tracing.start_chunk(title=scope.name)
+                    state.chunk_open = True
+            except Exception as e:
+                logger.error(f"Failed to start trace: {e}")
+                return
 
-        Args:
-            context: BrowserContext 객체
-            success: 작업 성공 여부 (실패 시 파일명에 'error' 추가)
+            scope.traced = True
+            state.active += 1
+            state.participants.append(scope)
+            self.traced += 1
+            logger.debug(
+                f"Trace scope opened: {scope.name} [{scope.request_id}] "
+                f"(mode={self.mode}, sharing={state.active - 1})"
+            )
 
-        Returns:
-            저장된 Trace 파일 경로
-        """
-        if not self.is_tracing:
-            logger.warning("No trace is running")
-            return None
+    async def _exit(self, context: BrowserContext, scope: TraceScope) -> None:
+        """스코프를 닫고, 마지막 스코프면 chunk를 저장하거나 버립니다."""
+        state = self._states.get(context)
+        if state is None:
+            return
 
-        try:
-            # 파일명 생성
-            timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-            status = "success" if success else "error"
-            filename = f"{self.current_trace_name}_{status}_{timestamp}.zip"
-            filepath = self.traces_dir / filename
-
-            # Trace 저장
-            await context.tracing.stop(path=str(filepath))
-            self.is_tracing = False
-            self.current_trace_name = None
-
-            logger.info(f"Trace saved: {filepath}")
-            logger.info(f"View trace: playwright show-trace {filepath}")
-
-            return str(filepath)
-        except Exception as e:
-            logger.error(f"Failed to stop trace: {e}")
-            self.is_tracing = False
-            return None
-
-    async def trace_action(
+        async with state.lock:
+            state.active -= 1
+            if state.active or not state.chunk_open:
+                return
+
+            participants = state.participants
+            state.participants = []
+            state.chunk_open = False
+
+            save = any(self._should_save(p.success) for p in participants)
+            try:
+                if not save:
+                    await context.tracing.stop_chunk()
+                    self.discarded += 1
+                    logger.debug(f"Trace discarded: {scope.name} [{scope.request_id}]")
+                    return
+
+                # 파일명 생성 (chunk를 공유한 호출의 request id를 모두 포함)
+                timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+                status = "success" if all(p.success for p in participants) else "error"
+                ids = "+".join(p.request_id for p in participants[:4])
+                filename = f"{participants[0].name}_{status}_{timestamp}_{ids}.zip"
+                filepath = self.traces_dir / filename
+
+                # Trace 저장
+                await context.tracing.stop_chunk(path=str(filepath))
+                self.saved += 1
+                if filepath.exists():
+                    self.bytes_written += filepath.stat().st_size
+                for participant in participants:
+                    participant.path = str(filepath)
+                self.prune()
+
+                logger.info(f"Trace saved: {filepath}")
+                logger.info(f"View trace: playwright show-trace {filepath}")
+            except Exception as e:
+                logger.error(f"Failed to stop trace: {e}")
+
+    @asynccontextmanager
+    async def trace(
         self,
         context: BrowserContext,
-        action_name: str,
-        action_func,
-        *args,
-        **kwargs,
-    ):
+        name: str = "trace",
+        request_id: Optional[str] = None,
+        screenshots: bool = True,
+        snapshots: bool = True,
+        sources: bool = True,
+    ) -> AsyncIterator[TraceScope]:
         """
-        특정 작업을 Trace와 함께 실행합니다.
+        블록 실행을 호출 단위 Trace 스코프로 녹화합니다.
+
+        동시에 실행되는 호출마다 스코프를 따로 가지므로 서로의 Trace를
+        덮어쓰거나 건너뛰지 않습니다. 블록에서 예외가 나면 실패로 기록됩니다.
 
         Args:
             context: BrowserContext 객체
-            action_name: 작업 이름
-            action_func: 실행할 비동기 함수
-            *args: 함수 인자
-            **kwargs: 함수 키워드 인자
+            name: Trace 이름 (보통 Tool 이름)
+            request_id: 호출 식별자 (None이면 자동 생성)
+            screenshots: 스크린샷 포함 여부
+            snapshots: DOM 스냅샷 포함 여부
+            sources: 소스 코드 포함 여부
 
-        Returns:
-            함수 실행 결과
+        Yields:
+            TraceScope (블록이 끝나면 저장된 경우 path가 채워짐)
 
         Example:
-            result = await trace_manager.trace_action(
-                context,
-                "create_post",
-                handle_create_post,
-                page,
-                title="테스트",
-                content="내용"
-            )
+            async with trace_manager.trace(context, "create_post") as scope:
+                result = await handle_create_post(page, title="테스트", content="내용")
+                scope.success = result["success"]
         """
-        await self.start_trace(context, action_name)
-        success = True
+        scope = TraceScope(name=name, request_id=request_id or uuid.uuid4().hex[:8])
+        self.calls += 1
+
+        if self._should_trace():
+            started = time.perf_counter()
+            await self._enter(context, scope, screenshots, snapshots, sources)
+            self._record_overhead(scope, time.perf_counter() - started)
 
         try:
-            result = await action_func(*args, **kwargs)
-            return result
-        except Exception as e:
-            success = False
-            raise e
+            yield scope
+        except BaseException:
+            scope.success = False
+            raise
         finally:
-            await self.stop_trace(context, success=success)
+            if scope.traced:
+                started = time.perf_counter()
+                await self._exit(context, scope)
+                self._record_overhead(scope, time.perf_counter() - started)
+                logger.debug(f"Trace overhead [{scope.request_id}]: {scope.overhead_ms:.0f}ms")
 
 
 # 전역 TraceManager 인스턴스
-trace_manager = TraceManager()
+trace_manager = TraceManager(
+    traces_dir=config.TRACE_DIR,
+    mode=config.TRACE_MODE,
+    sample_rate=config.TRACE_SAMPLE_RATE,
+    max_dir_bytes=config.TRACE_MAX_DIR_MB * 1024 * 1024,
+)
@@ -0,0 +1,85 @@
+"""Base64 이미지 디코딩 메모리 벤치마크 (브라우저 불필요).
+
+기존 방식(b64decode 전체 디코딩 → 임시 파일 기록)과 스트리밍 디코딩의
+최대 메모리 사용량(tracemalloc peak)을 9MB 이미지로 비교합니다.
+입력 문자열 자체는 측정 전에 만들어 두므로 peak에 포함되지 않습니다.
+
+실행:
+    uv run python tests/benchmark_base64_decode.py
+"""
+
+import base64
+import os
+import sys
+import tempfile
+import time
+import tracemalloc
+from pathlib import Path
+
+sys.path.insert(0, "src")
+
+from naver_blog_mcp.automation.image_upload import decode_base64_image
+
+IMAGE_SIZE = 9 * 1024 * 1024
+
+
+def legacy_decode_to_temp_file(base64_string: str) -> int:
+    """이전 구현: 전체 디코딩 후 임시 파일에 기록하고 읽어 업로드."""
+    header, encoded = base64_string.split(",", 1)
+    image_bytes = base64.b64decode(encoded)
+    with tempfile.NamedTemporaryFile(suffix=".jpg", delete=False) as temp_file:
+        temp_file.write(image_bytes)
+    path = Path(temp_file.name)
+    size = path.stat().st_size
+    path.unlink()
+    return size
+
+
+def measure(label: str, func, *args) -> None:
+    tracemalloc.start()
+    started = time.perf_counter()
+    func(*args)
+    elapsed = time.perf_counter() - started
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    print(f"⏱️ {label:<28} peak {peak / 1024 / 1024:6.1f}MB, {elapsed * 1000:6.1f}ms")
+
+
+def test_decode_matches_b64decode():
+    """청크 경계/줄바꿈이 있어도 결과가 b64decode와 같은지 테스트."""
+    print("=" * 60)
+    print("Base64 스트리밍 디코딩 테스트")
+    print("=" * 60)
+
+    raw = b"\xff\xd8\xff" + os.urandom(10_000)
+    encoded = base64.b64encode(raw).decode()
+
+    image, extension, mime_type = decode_base64_image(
+        "data:image/jpeg;base64," + encoded, chunk_size=1000
+    )
+    assert bytes(image) == raw and extension == ".jpg" and mime_type == "image/jpeg"
+    print("✅ data URI 디코딩")
+
+    # MIME 인코딩처럼 76자마다 줄바꿈된 입력
+    wrapped = "\n".join(encoded[i:i + 76] for i in range(0, len(encoded), 76))
+    image, _, _ = decode_base64_image(wrapped, chunk_size=1000)
+    assert bytes(image) == raw
+    print("✅ 줄바꿈 포함 입력, 헤더 없으면 시그니처로 형식 판별")
+    print()
+
+
+def benchmark_memory():
+    """9MB 이미지 디코딩 최대 메모리 비교."""
+    data_uri = "data:image/jpeg;base64," + base64.b64encode(
+        b"\xff\xd8\xff" + os.urandom(IMAGE_SIZE - 3)
+    ).decode()
+    print(f"입력: {len(data_uri) / 1024 / 1024:.1f}MB data URI ({IMAGE_SIZE / 1024 / 1024:.0f}MB 이미지)")
+
+    measure("b64decode + 임시 파일", legacy_decode_to_temp_file, data_uri)
+    measure("스트리밍 디코딩 (payload)", decode_base64_image, data_uri)
+
+
+if __name__ == "__main__":
+    test_decode_matches_b64decode()
+    benchmark_memory()
+    print("🎉 모든 테스트 통과!")
@@ -0,0 +1,113 @@
+"""본문 입력 방식별 속도 벤치마크.
+
+로컬 모의 에디터 페이지(스마트에디터 ONE처럼 paste 이벤트를 직접 처리하는
+contenteditable)에 본문을 입력하고 방식별 초당 입력 글자 수를 비교합니다.
+
+실행:
+    uv run python tests/benchmark_content_input.py
+"""
+
+import asyncio
+import sys
+import time
+
+sys.path.insert(0, "src")
+
+from playwright.async_api import async_playwright
+
+from naver_blog_mcp.automation.text_input import insert_content
+
+# 스마트에디터 ONE과 같이 paste를 가로채 문단으로 나누는 모의 에디터
+MOCK_EDITOR_HTML = """
+<!DOCTYPE html>
+<html>
+<body>
+  <div class="se-content">
+    <div contenteditable="true" role="textbox" class="se-text-paragraph"
+         style="min-height: 400px; border: 1px solid #ccc"></div>
+  </div>
+  <script>
+    const editor = document.querySelector("[role='textbox']");
+    editor.addEventListener("paste", (event) => {
+      event.preventDefault();
+      const text = event.clipboardData.getData("text/plain");
+      editor.innerHTML = "";
+      for (const line of text.split("\\n")) {
+        const p = document.createElement("p");
+        p.textContent = line;
+        editor.appendChild(p);
+      }
+    });
+  </script>
+</body>
+</html>
+"""
+
+# 방식별 본문 길이 (키 입력은 느리므로 짧게 측정)
+BENCHMARK_CASES = [
+    ("type", 2_000),
+    ("insert_text", 20_000),
+    ("paste", 20_000),
+]
+
+
+def make_content(length: int) -> str:
+    """한글/영문/줄바꿈이 섞인 테스트 본문을 만듭니다."""
+    line = "네이버 블로그 자동화 벤치마크 문장입니다. Playwright insert speed test.\n"
+    repeated = line * (length // len(line) + 1)
+    return repeated[:length]
+
+
+async def run_case(browser, mode: str, length: int) -> dict:
+    page = await browser.new_page()
+    try:
+        await page.set_content(MOCK_EDITOR_HTML)
+        editor = page.locator("[role='textbox']").first
+        await editor.click()
+
+        content = make_content(length)
+        started = time.perf_counter()
+        used = await insert_content(page, editor, content, mode=mode)
+        elapsed = time.perf_counter() - started
+
+        inserted = await editor.evaluate("(el) => el.innerText.length")
+        return {
+            "mode": mode,
+            "used": used,
+            "chars": length,
+            "inserted": inserted,
+            "seconds": elapsed,
+            "chars_per_second": length / elapsed if elapsed else float("inf"),
+        }
+    finally:
+        await page.close()
+
+
+async def main():
+    print("=" * 60)
+    print("본문 입력 방식별 벤치마크 (모의 에디터)")
+    print("=" * 60)
+
+    async with async_playwright() as p:
+        browser = await p.chromium.launch(headless=True)
+        try:
+            results = []
+            for mode, length in BENCHMARK_CASES:
+                result = await run_case(browser, mode, length)
+                results.append(result)
+                print(
+                    f"{result['mode']:<12} (used={result['used']:<11}) "
+                    f"{result['chars']:>6}자 {result['seconds']:>8.2f}s "
+                    f"{result['chars_per_second']:>12,.0f} chars/s"
+                )
+        finally:
+            await browser.close()
+
+    baseline = results[0]["chars_per_second"]
+    print()
+    for result in results[1:]:
+        print(f"{result['mode']}: 키 입력 대비 {result['chars_per_second'] / baseline:,.0f}배")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
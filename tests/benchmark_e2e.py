@@ -0,0 +1,335 @@
+"""모의 네이버 서버 대상 종단간 성능 벤치마크.
+
+create_blog_post(새 탭 / 에디터 재사용 탭) / upload_images / get_categories를 오프라인 모의 서버
+(tests/mock_naver.py)에 대해 반복 실행해 소요 시간을 재고, 결과를 JSONL
+이력 파일에 한 줄씩 추가해 직전 실행과 비교합니다. 실제 네이버에 접속하지
+않으므로 같은 머신에서는 결과를 재현할 수 있습니다.
+
+create_blog_post와 get_categories는 요청 차단 프로필(RequestBlocker)을 적용한
+컨텍스트에서 한 번 더 실행해(*_blocked) 로딩 시간과 받은 바이트를 비교합니다.
+
+실행:
+    uv run python tests/benchmark_e2e.py
+    uv run python tests/benchmark_e2e.py --runs 5 --latency-ms 50 --third-party-ms 300
+"""
+
+import argparse
+import asyncio
+import json
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from datetime import datetime
+from pathlib import Path
+
+sys.path.insert(0, "src")
+
+from PIL import Image
+from playwright.async_api import async_playwright
+
+from naver_blog_mcp.automation.category_actions import get_categories
+from naver_blog_mcp.automation.image_upload import upload_images
+from naver_blog_mcp.automation.post_actions import (
+    create_blog_post,
+    navigate_to_post_write_page,
+    recycle_editor,
+)
+from naver_blog_mcp.config import config
+from naver_blog_mcp.services.request_blocker import RequestBlocker
+from naver_blog_mcp.utils import selector_helper
+from naver_blog_mcp.utils.selector_stats import SelectorStats
+from naver_blog_mcp.utils.timing import recording
+
+from mock_naver import MockNaver
+
+DEFAULT_HISTORY = "playwright-state/benchmarks/e2e.jsonl"
+
+BLOG_ID = "myblog"
+POST_CONTENT = "모의 서버 벤치마크 본문입니다.\n" * 50
+# 에디터를 열 때마다 뜨는 이어쓰기 팝업의 임시 저장 글 (자동으로 취소되어야 함)
+DRAFT_TEXT = "이전에 작성하던 임시 저장 글"
+IMAGE_COUNT = 3
+
+
+def make_images(directory: Path, count: int) -> list[str]:
+    """업로드할 테스트 이미지를 만듭니다."""
+    paths = []
+    for idx in range(count):
+        path = directory / f"bench_{idx}.jpg"
+        Image.new("RGB", (1200, 800), (40 * idx, 120, 200)).save(path, quality=90)
+        paths.append(str(path))
+    return paths
+
+
+def summarize(samples: list[float], steps: list[dict]) -> dict:
+    """실행별 소요 시간(초)을 ms 단위 요약으로 만듭니다."""
+    summary = {
+        "samples_ms": [round(sample * 1000, 1) for sample in samples],
+        "median_ms": round(statistics.median(samples) * 1000, 1),
+        "min_ms": round(min(samples) * 1000, 1),
+        "max_ms": round(max(samples) * 1000, 1),
+    }
+    if steps:
+        names = {name for run in steps for name in run}
+        summary["steps_median_ms"] = {
+            name: round(statistics.median(run.get(name, 0) for run in steps), 1)
+            for name in sorted(names)
+        }
+    return summary
+
+
+def top_level_steps(report: dict) -> dict:
+    """span 리포트에서 최상위 단계별 소요 시간(ms)만 뽑습니다."""
+    return {
+        span["name"]: span["duration_ms"]
+        for span in report["spans"]
+        if span["parent"] is None
+    }
+
+
+async def bench_create_post(context, mock: MockNaver, runs: int) -> dict:
+    """글쓰기 페이지 이동부터 발행까지 (첫 실행은 글쓰기 URL 탐색 포함)."""
+    samples, steps = [], []
+    for run in range(runs):
+        page = await context.new_page()
+        title = f"벤치마크 {run + 1}"
+        try:
+            with recording("benchmark_create_post") as recorder:
+                started = time.perf_counter()
+                result = await create_blog_post(page, title, POST_CONTENT)
+                samples.append(time.perf_counter() - started)
+        finally:
+            await page.close()
+
+        assert result["success"], result
+        assert mock.published[-1]["title"] == title, mock.published[-1]
+        assert DRAFT_TEXT not in mock.published[-1]["content"], "이어쓰기 팝업이 닫히지 않음"
+        steps.append(top_level_steps(recorder.report()))
+    return summarize(samples, steps)
+
+
+async def bench_create_post_recycled(context, mock: MockNaver, runs: int) -> dict:
+    """한 탭에서 연속 발행, 글 사이에 에디터 재사용 (navigate 단계를 새 탭과 비교).
+
+    재사용 준비(recycle_editor)는 실제로는 페이지 반납 후 백그라운드에서 실행되므로
+    글 작성 시간에 넣지 않고 steps의 recycle_editor로 따로 보고합니다.
+    """
+    samples, steps = [], []
+    recycle_enabled = config.RECYCLE_EDITOR
+    config.RECYCLE_EDITOR = True
+    page = await context.new_page()
+    try:
+        # 첫 글은 새 탭과 같으므로 측정하지 않음
+        await create_blog_post(page, "재사용 준비", POST_CONTENT)
+        for run in range(runs):
+            started = time.perf_counter()
+            assert await recycle_editor(page), "에디터 재사용 준비 실패"
+            recycle_ms = round((time.perf_counter() - started) * 1000, 1)
+
+            title = f"재사용 벤치마크 {run + 1}"
+            with recording("benchmark_create_post_recycled") as recorder:
+                started = time.perf_counter()
+                result = await create_blog_post(page, title, POST_CONTENT)
+                samples.append(time.perf_counter() - started)
+
+            assert result["success"], result
+            assert mock.published[-1]["title"] == title, mock.published[-1]
+            steps.append({**top_level_steps(recorder.report()), "recycle_editor": recycle_ms})
+    finally:
+        config.RECYCLE_EDITOR = recycle_enabled
+        await page.close()
+    return summarize(samples, steps)
+
+
+async def bench_upload_images(context, image_paths: list[str], runs: int) -> dict:
+    """에디터가 열린 상태에서 이미지 여러 장 업로드 (캐시 사용 안 함)."""
+    samples = []
+    for _ in range(runs):
+        page = await context.new_page()
+        try:
+            await navigate_to_post_write_page(page)
+            started = time.perf_counter()
+            result = await upload_images(page, image_paths, use_cache=False)
+            samples.append(time.perf_counter() - started)
+        finally:
+            await page.close()
+
+        assert len(result["uploaded"]) == len(image_paths), result
+    return summarize(samples, [])
+
+
+async def bench_get_categories(context, runs: int) -> dict:
+    """블로그 메인 iframe에서 카테고리 목록 조회."""
+    samples = []
+    for _ in range(runs):
+        page = await context.new_page()
+        try:
+            started = time.perf_counter()
+            result = await get_categories(page, BLOG_ID)
+            samples.append(time.perf_counter() - started)
+        finally:
+            await page.close()
+
+        assert result["success"] and result["categories"], result
+    return summarize(samples, [])
+
+
+async def measure_network(mock: MockNaver, blocker, scenario) -> dict:
+    """시나리오 동안 모의 서버가 보낸 바이트와 차단한 요청 수를 요약에 더합니다."""
+    served = mock.served_bytes
+    blocked = blocker.stats()["blocked_requests"] if blocker else 0
+    summary = await scenario
+    summary["served_kb"] = round((mock.served_bytes - served) / 1024, 1)
+    if blocker:
+        summary["blocked_requests"] = blocker.stats()["blocked_requests"] - blocked
+    return summary
+
+
+def git_commit() -> str:
+    """현재 커밋 (git이 없으면 빈 문자열)."""
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"],
+            capture_output=True, text=True, check=True,
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return ""
+
+
+def load_previous(history: Path, latency_ms: int, third_party_ms: int) -> dict:
+    """같은 지연 설정으로 실행한 직전 결과 (없으면 빈 dict)."""
+    if not history.exists():
+        return {}
+    previous = {}
+    for line in history.read_text(encoding="utf-8").splitlines():
+        try:
+            record = json.loads(line)
+        except json.JSONDecodeError:
+            continue
+        if (
+            record.get("latency_ms") == latency_ms
+            and record.get("third_party_ms") == third_party_ms
+        ):
+            previous = record
+    return previous
+
+
+def print_report(results: dict, previous: dict) -> None:
+    print()
+    print(f"{'시나리오':<18} {'중앙값':>10} {'최소':>10} {'최대':>10} {'직전 대비':>12}")
+    for name, summary in results.items():
+        before = previous.get("results", {}).get(name, {}).get("median_ms")
+        change = (
+            f"{(summary['median_ms'] - before) / before * 100:+.1f}%" if before else "-"
+        )
+        print(
+            f"{name:<18} {summary['median_ms']:>8.0f}ms {summary['min_ms']:>8.0f}ms "
+            f"{summary['max_ms']:>8.0f}ms {change:>12}"
+        )
+        if "served_kb" in summary:
+            blocked = summary.get("blocked_requests")
+            print(
+                f"  └ 받은 응답 {summary['served_kb']:.0f}KB"
+                + (f", 차단 요청 {blocked}개" if blocked is not None else "")
+            )
+        for step, ms in summary.get("steps_median_ms", {}).items():
+            print(f"  └ {step:<14} {ms:>8.0f}ms")
+    if previous:
+        print(f"\n직전 실행: {previous.get('timestamp')} ({previous.get('commit') or 'unknown'})")
+
+
+async def main(args: argparse.Namespace) -> None:
+    print("=" * 60)
+    print(
+        f"종단간 벤치마크 (모의 서버, 지연 {args.latency_ms}ms, "
+        f"외부 리소스 지연 {args.third_party_ms}ms, {args.runs}회)"
+    )
+    print("=" * 60)
+
+    mock = MockNaver(
+        blog_id=BLOG_ID,
+        latency_ms=args.latency_ms,
+        draft_text=DRAFT_TEXT,
+        third_party_delay_ms=args.third_party_ms,
+    )
+
+    with tempfile.TemporaryDirectory() as tmp:
+        image_paths = make_images(Path(tmp), IMAGE_COUNT)
+        # 모의 서버 결과를 실제 셀렉터 통계 파일에 섞지 않음
+        selector_helper.selector_stats = SelectorStats(str(Path(tmp) / "selector_stats.json"))
+
+        async with async_playwright() as p:
+            browser = await p.chromium.launch(headless=True)
+            try:
+                context = await browser.new_context(
+                    viewport=config.VIEWPORT, user_agent=config.USER_AGENT
+                )
+                await mock.install(context)
+
+                results = {
+                    "create_blog_post": await measure_network(
+                        mock, None, bench_create_post(context, mock, args.runs)
+                    ),
+                    "create_post_reuse": await bench_create_post_recycled(context, mock, args.runs),
+                    "upload_images": await bench_upload_images(context, image_paths, args.runs),
+                    "get_categories": await measure_network(
+                        mock, None, bench_get_categories(context, args.runs)
+                    ),
+                }
+                await context.close()
+
+                # 같은 시나리오를 요청 차단 프로필로 (모의 서버보다 나중에 등록해 먼저 검사)
+                blocker = RequestBlocker.from_config()
+                context = await browser.new_context(
+                    viewport=config.VIEWPORT, user_agent=config.USER_AGENT
+                )
+                await mock.install(context)
+                await blocker.install(context)
+
+                results["create_post_blocked"] = await measure_network(
+                    mock, blocker, bench_create_post(context, mock, args.runs)
+                )
+                results["categories_blocked"] = await measure_network(
+                    mock, blocker, bench_get_categories(context, args.runs)
+                )
+            finally:
+                await browser.close()
+
+    assert not mock.blocked, f"모의 서버 밖으로 나간 요청: {mock.blocked}"
+
+    history = Path(args.history)
+    previous = load_previous(history, args.latency_ms, args.third_party_ms)
+    print_report(results, previous)
+
+    if not args.no_save:
+        record = {
+            "timestamp": datetime.now().isoformat(timespec="seconds"),
+            "commit": git_commit(),
+            "runs": args.runs,
+            "latency_ms": args.latency_ms,
+            "third_party_ms": args.third_party_ms,
+            "results": results,
+        }
+        history.parent.mkdir(parents=True, exist_ok=True)
+        with history.open("a", encoding="utf-8") as f:
+            f.write(json.dumps(record, ensure_ascii=False) + "\n")
+        print(f"결과 기록: {history}")
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="모의 네이버 서버 종단간 벤치마크")
+    parser.add_argument("--runs", type=int, default=3, help="시나리오별 반복 횟수")
+    parser.add_argument("--latency-ms", type=int, default=0, help="응답마다 더할 지연 (ms)")
+    parser.add_argument(
+        "--third-party-ms", type=int, default=200,
+        help="광고/통계/웹폰트 응답에 더할 지연 (ms)",
+    )
+    parser.add_argument("--history", default=DEFAULT_HISTORY, help="결과 이력 JSONL 경로")
+    parser.add_argument("--no-save", action="store_true", help="이력 파일에 기록하지 않음")
+    return parser.parse_args()
+
+
+if __name__ == "__main__":
+    asyncio.run(main(parse_args()))
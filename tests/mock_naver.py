@@ -0,0 +1,244 @@
+"""오프라인 네이버 블로그 모의 서버.
+
+BrowserContext.route()로 *.naver.com / *.pstatic.net 요청을 가로채
+tests/fixtures/mock_naver의 페이지로 응답합니다. 실제 코드는 URL을 바꾸지 않고
+그대로 https://blog.naver.com 등에 접속하며, 그 밖의 외부 요청은 모두 차단합니다.
+블로그/에디터 페이지는 실제처럼 광고 스크립트, 통계 스크립트, 광고 이미지,
+웹폰트(THIRD_PARTY_ASSETS)도 불러오며, 이 응답은 third_party_delay_ms만큼 늦습니다.
+
+흉내내는 구조:
+    - nid.naver.com/nidlogin.login: 로그인 폼 (#id, #pw, .btn_login), 인증 쿠키 발급
+    - blog.naver.com/: 글쓰기 버튼이 있는 블로그 홈
+    - blog.naver.com/{blog_id}: iframe#mainFrame 안에 카테고리 사이드바
+    - blog.naver.com/{blog_id}/postwrite: ?Redirect=Write로 302 이동 후
+      iframe#mainFrame 안에 스마트에디터 ONE (제목/본문 contenteditable,
+      사진 버튼과 #hidden-file, 발행 대화상자, 임시 저장 글 이어쓰기 팝업)
+    - 발행하면 blog.naver.com/{blog_id}/{logNo} 글 보기 페이지로 이동
+
+Example:
+    mock = MockNaver(blog_id="myblog", latency_ms=30)
+    await mock.install(context)
+    result = await create_blog_post(page, "제목", "본문")
+    assert mock.published[-1]["title"] == "제목"
+"""
+
+import asyncio
+import html
+import json
+import mimetypes
+import re
+from pathlib import Path
+from string import Template
+from typing import Optional
+from urllib.parse import parse_qs, quote, unquote, urlencode, urlparse
+
+FIXTURES_DIR = Path(__file__).parent / "fixtures"
+PAGES_DIR = FIXTURES_DIR / "mock_naver"
+
+MOCK_HOSTS = ("naver.com", "naver.net", "pstatic.net", "googlesyndication.com")
+BLOG_HOST = "https://blog.naver.com"
+IMAGE_HOST = "https://postfiles.pstatic.net"
+
+# 페이지마다 불러오는 자동화와 무관한 리소스: URL → (Content-Type, 크기)
+THIRD_PARTY_ASSETS = {
+    "https://wcs.naver.net/wcslog.js": ("application/javascript", 30_000),
+    "https://pagead2.googlesyndication.com/pagead/show_ads.js": ("application/javascript", 80_000),
+    "https://veta.naver.com/ad/banner.gif": ("image/gif", 40_000),
+    "https://ssl.pstatic.net/static/mock/nanum.woff2": ("font/woff2", 150_000),
+}
+THIRD_PARTY_TAGS = "\n".join([
+    '<link rel="preload" as="font" type="font/woff2" crossorigin '
+    'href="https://ssl.pstatic.net/static/mock/nanum.woff2">',
+    '<script async src="https://wcs.naver.net/wcslog.js"></script>',
+    '<script async src="https://pagead2.googlesyndication.com/pagead/show_ads.js"></script>',
+    '<img src="https://veta.naver.com/ad/banner.gif" alt="" width="1" height="1">',
+])
+
+# 글 번호는 실제 네이버처럼 12자리
+FIRST_LOG_NO = 223000000001
+
+
+class MockNaver:
+    """네이버 블로그를 흉내내는 route 핸들러 묶음."""
+
+    def __init__(
+        self,
+        blog_id: str = "myblog",
+        latency_ms: int = 0,
+        upload_delay_ms: int = 100,
+        publish_delay_ms: int = 100,
+        draft_text: Optional[str] = None,
+        third_party_delay_ms: int = 0,
+    ):
+        """
+        MockNaver 초기화.
+
+        Args:
+            blog_id: 모의 블로그 아이디 (카테고리 fixture는 myblog 기준)
+            latency_ms: 모든 응답에 더할 네트워크 지연 (ms)
+            upload_delay_ms: 이미지 한 장 업로드 처리 시간 (ms)
+            publish_delay_ms: 발행 요청 처리 시간 (ms)
+            draft_text: 임시 저장된 글 (있으면 에디터를 열 때마다 이어쓰기 팝업)
+            third_party_delay_ms: 광고/통계/웹폰트 응답에 더할 지연 (ms)
+        """
+        self.blog_id = blog_id
+        self.latency_ms = latency_ms
+        self.upload_delay_ms = upload_delay_ms
+        self.publish_delay_ms = publish_delay_ms
+        self.draft_text = draft_text
+        self.third_party_delay_ms = third_party_delay_ms
+
+        self.published: list[dict] = []
+        self.uploaded: dict[str, bytes] = {}
+        self.requests: list[str] = []
+        self.blocked: list[str] = []
+        self.served_bytes = 0
+
+    async def install(self, context) -> None:
+        """컨텍스트의 모든 요청을 이 모의 서버로 보냅니다."""
+        await context.route("**/*", self.handle)
+
+    def page(self, name: str, **values: str) -> str:
+        """fixture 페이지를 읽어 $변수를 채웁니다."""
+        text = (PAGES_DIR / name).read_text(encoding="utf-8")
+        return Template(text).safe_substitute(
+            blog_id=self.blog_id, third_party=THIRD_PARTY_TAGS, **values
+        )
+
+    async def handle(self, route) -> None:
+        """route 핸들러: URL별 fixture 응답, 모의 호스트가 아니면 차단."""
+        request = route.request
+        url = urlparse(request.url)
+        host = url.hostname or ""
+
+        if not host.endswith(MOCK_HOSTS):
+            self.blocked.append(request.url)
+            await route.abort("blockedbyclient")
+            return
+
+        self.requests.append(request.url)
+        if self.latency_ms:
+            await asyncio.sleep(self.latency_ms / 1000)
+
+        response = await self.respond(host, url.path, parse_qs(url.query), request)
+        body = response.get("body", b"")
+        self.served_bytes += len(body.encode() if isinstance(body, str) else body)
+        await route.fulfill(**response)
+
+    async def respond(self, host: str, path: str, query: dict, request) -> dict:
+        """요청에 대한 route.fulfill() 인자를 만듭니다."""
+        blog_id = self.blog_id
+
+        asset = THIRD_PARTY_ASSETS.get(f"https://{host}{path}")
+        if asset is not None:
+            await asyncio.sleep(self.third_party_delay_ms / 1000)
+            content_type, size = asset
+            return {"status": 200, "content_type": content_type, "body": b" " * size}
+
+        if host == "nid.naver.com" and path.startswith("/nidlogin.login"):
+            return self._html(self.page("login.html"))
+
+        if host == "www.naver.com":
+            return self._html(self.page("naver_main.html"))
+
+        if host == "postfiles.pstatic.net":
+            data = self.uploaded.get(unquote(path))
+            if data is None:
+                return self._not_found()
+            content_type = mimetypes.guess_type(path)[0] or "application/octet-stream"
+            return {"status": 200, "content_type": content_type, "body": data}
+
+        if host != "blog.naver.com":
+            return self._not_found()
+
+        if path in ("", "/"):
+            return self._html(self.page("blog_home.html"))
+
+        if path == f"/{blog_id}/postwrite":
+            query = {**_flatten(query), "Redirect": "Write"}
+            return self._redirect(f"{BLOG_HOST}/{blog_id}?{urlencode(query)}")
+
+        if path == f"/{blog_id}":
+            flat = _flatten(query)
+            if flat.get("Redirect") == "Write":
+                flat.pop("Redirect")
+                frame_src = f"/PostWriteForm.naver?{urlencode({'blogId': blog_id, **flat})}"
+            else:
+                frame_src = f"/PostList.naver?blogId={blog_id}&from=postList"
+            return self._html(self.page("blog_main.html", frame_src=frame_src))
+
+        if path == "/PostWriteForm.naver":
+            return self._html(
+                self.page(
+                    "editor.html",
+                    upload_delay_ms=str(self.upload_delay_ms),
+                    # <script> 안에 넣으므로 </를 이스케이프
+                    draft=json.dumps(self.draft_text, ensure_ascii=False).replace("</", "<\\/"),
+                )
+            )
+
+        if path == "/PostList.naver":
+            return self._html((FIXTURES_DIR / "category_sidebar.html").read_text(encoding="utf-8"))
+
+        if path == "/MyBlog.naver":
+            return self._redirect(f"{BLOG_HOST}/{blog_id}")
+
+        if path == "/mock-api/upload":
+            name = Path(_flatten(query).get("name") or "image.png").name
+            key = f"/mock/{len(self.uploaded) + 1}/{name}"
+            self.uploaded[key] = request.post_data_buffer or b""
+            return self._json({"url": IMAGE_HOST + quote(key)})
+
+        if path == "/mock-api/publish":
+            await asyncio.sleep(self.publish_delay_ms / 1000)
+            post = json.loads(request.post_data or "{}")
+            post["logNo"] = str(FIRST_LOG_NO + len(self.published))
+            self.published.append(post)
+            return self._json({"logNo": post["logNo"]})
+
+        match = re.fullmatch(rf"/{re.escape(blog_id)}/(\d+)", path)
+        if match:
+            post = self.find_post(match.group(1))
+            if post is None:
+                return self._not_found()
+            return self._html(
+                self.page(
+                    "post_view.html",
+                    title=html.escape(post["title"]),
+                    content=html.escape(post["content"]),
+                )
+            )
+
+        return self._not_found()
+
+    def find_post(self, log_no: str) -> Optional[dict]:
+        """발행된 글을 글 번호로 찾습니다."""
+        for post in self.published:
+            if post["logNo"] == log_no:
+                return post
+        return None
+
+    @staticmethod
+    def _html(body: str) -> dict:
+        return {"status": 200, "content_type": "text/html; charset=utf-8", "body": body}
+
+    @staticmethod
+    def _json(data: dict) -> dict:
+        return {
+            "status": 200,
+            "content_type": "application/json",
+            "body": json.dumps(data, ensure_ascii=False),
+        }
+
+    @staticmethod
+    def _redirect(location: str) -> dict:
+        return {"status": 302, "headers": {"location": location}, "body": ""}
+
+    @staticmethod
+    def _not_found() -> dict:
+        return {"status": 404, "content_type": "text/plain", "body": "not found"}
+
+
+def _flatten(query: dict) -> dict:
+    """parse_qs 결과에서 각 키의 첫 번째 값만 남깁니다."""
+    return {key: values[0] for key, values in query.items()}
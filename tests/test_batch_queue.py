@@ -0,0 +1,215 @@
+"""글 일괄 작성 큐 테스트 (브라우저 없이 가짜 작업으로 검증)."""
+
+import asyncio
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, "src")
+
+from naver_blog_mcp.config import config
+from naver_blog_mcp.mcp.tools import handle_create_posts_batch
+from naver_blog_mcp.services.batch_queue import RateLimiter, run_batch
+from naver_blog_mcp.utils.trace_manager import TraceManager
+
+
+async def test_run_batch():
+    """동시성 제한, 입력 순서 유지, 부분 실패 테스트."""
+    print("=" * 60)
+    print("run_batch 테스트")
+    print("=" * 60)
+
+    running = 0
+    peak = 0
+
+    async def worker(item):
+        nonlocal running, peak
+        running += 1
+        peak = max(peak, running)
+        try:
+            # 뒤쪽 작업이 먼저 끝나도 결과는 입력 순서대로
+            await asyncio.sleep(0.05 / item)
+            if item == 3:
+                raise ValueError("boom")
+            return item * 10
+        finally:
+            running -= 1
+
+    outcomes = await run_batch([1, 2, 3, 4, 5], worker, concurrency=2)
+
+    assert peak == 2, peak
+    print(f"✅ 동시 실행 최대 {peak}개")
+
+    assert [o["index"] for o in outcomes] == [0, 1, 2, 3, 4]
+    assert [o.get("result") for o in outcomes] == [10, 20, None, 40, 50]
+    print("✅ 결과는 입력 순서대로")
+
+    assert not outcomes[2]["ok"] and isinstance(outcomes[2]["error"], ValueError)
+    assert all(o["ok"] for i, o in enumerate(outcomes) if i != 2)
+    print("✅ 한 작업이 실패해도 나머지는 계속 진행")
+
+    assert await run_batch([], worker, concurrency=3) == []
+    print("✅ 빈 목록")
+    print()
+
+
+async def test_rate_limiter():
+    """작업 시작 간격 제한 테스트."""
+    print("=" * 60)
+    print("RateLimiter 테스트")
+    print("=" * 60)
+
+    starts = []
+
+    async def worker(item):
+        starts.append(time.perf_counter())
+
+    limiter = RateLimiter(0.05)
+    await run_batch(range(3), worker, concurrency=3, rate_limiter=limiter)
+
+    gaps = [b - a for a, b in zip(starts, starts[1:])]
+    assert all(gap >= 0.045 for gap in gaps), gaps
+    print(f"✅ 시작 간격: {[round(gap * 1000) for gap in gaps]}ms")
+
+    assert await RateLimiter(0).wait() == 0.0
+    print("✅ 간격 0이면 기다리지 않음")
+    print()
+
+
+async def test_handle_create_posts_batch():
+    """일괄 작성 Tool 핸들러 테스트."""
+    print("=" * 60)
+    print("handle_create_posts_batch 테스트")
+    print("=" * 60)
+
+    calls = []
+    running = 0
+    peak = 0
+
+    async def create_post(index, post):
+        nonlocal running, peak
+        running += 1
+        peak = max(peak, running)
+        try:
+            calls.append(post)
+            assert posts[index] is post
+            await asyncio.sleep(0.01)
+            if post["title"] == "예외":
+                raise RuntimeError("page crashed")
+            if post["title"] == "실패":
+                return {"success": False, "message": "발행 실패", "error": "NaverBlogPostError"}
+            return {
+                "success": True,
+                "post_url": f"https://blog.naver.com/myblog/{len(calls)}",
+                "message": "글이 성공적으로 발행되었습니다.",
+            }
+        finally:
+            running -= 1
+
+    posts = [
+        {"title": "첫 글", "content": "본문"},
+        {"title": "실패", "content": "본문"},
+        {"title": "", "content": "본문"},
+        {"title": "예외", "content": "본문"},
+        {"title": "마지막", "content": "본문", "tags": ["a"]},
+    ]
+    result = await handle_create_posts_batch(
+        posts, create_post, concurrency=100, min_interval=0
+    )
+
+    assert result["total"] == 5 and result["succeeded"] == 2 and result["failed"] == 3
+    assert not result["success"]
+    print(f"✅ {result['message']}")
+
+    statuses = [item["success"] for item in result["results"]]
+    assert statuses == [True, False, False, False, True]
+    assert result["results"][0]["post_url"].startswith("https://blog.naver.com/")
+    assert "page crashed" in result["results"][3]["message"]
+    print("✅ 글별 결과를 입력 순서대로 반환")
+
+    errors = [item.get("error") for item in result["results"]]
+    assert errors == [None, "NaverBlogPostError", None, "RuntimeError", None]
+    print("✅ 실패한 글에 에러 클래스 이름 기록 (메트릭용)")
+
+    assert len(calls) == 4 and all(post["title"] for post in calls)
+    assert calls[-1]["tags"] == ["a"]
+    print("✅ 잘못된 글은 실행하지 않음")
+
+    assert peak <= config.PAGE_POOL_SIZE, peak
+    print(f"✅ 동시성은 페이지 풀 크기({config.PAGE_POOL_SIZE}) 이하")
+
+    empty = await handle_create_posts_batch([], create_post)
+    assert not empty["success"]
+    too_many = await handle_create_posts_batch(
+        [{"title": "t", "content": "c"}] * (config.POST_BATCH_MAX_ITEMS + 1), create_post
+    )
+    assert not too_many["success"] and len(calls) == 4
+    print("✅ 빈 목록과 최대 개수 초과는 거부")
+    print()
+
+
+
+class FakeTracing:
+    """chunk 열림 여부만 기록하는 가짜 tracing."""
+
+    def __init__(self):
+        self.chunk_open = False
+        self.saved = []
+
+    async def start(self, **kwargs):
+        self.chunk_open = True
+
+    async def start_chunk(self, **kwargs):
+        self.chunk_open = True
+
+    async def stop_chunk(self, path=None):
+        self.chunk_open = False
+        if path:
+            self.saved.append(path)
+
+
+class FakeContext:
+    def __init__(self):
+        self.tracing = FakeTracing()
+
+
+async def test_batch_items_share_trace_chunk():
+    """한 컨텍스트에서 겹친 일괄 작성 글들이 끝날 때까지 Trace chunk가 열려 있는지 테스트."""
+    print("=" * 60)
+    print("일괄 작성 Trace 스코프 테스트")
+    print("=" * 60)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        manager = TraceManager(traces_dir=tmp, mode="on_failure")
+        context = FakeContext()
+        request_ids = []
+
+        # 서버처럼 MCP request id에 글 번호를 붙여 글별 스코프를 엶 (뒤 글이 늦게 끝남)
+        async def create_post(index, post):
+            request_id = f"req-{index}"
+            request_ids.append(request_id)
+            async with manager.trace(context, "naver_blog_create_post", request_id) as scope:
+                await asyncio.sleep(0.05 if index else 0.01)
+                assert context.tracing.chunk_open, "chunk closed while a batch item is running"
+                scope.success = post["title"] != "실패"
+            return {"success": scope.success, "message": ""}
+
+        posts = [
+            {"title": "빠른 글", "content": "본문"},
+            {"title": "실패", "content": "본문"},
+        ]
+        result = await handle_create_posts_batch(posts, create_post, concurrency=2, min_interval=0)
+
+        assert [item["success"] for item in result["results"]] == [True, False]
+        assert sorted(request_ids) == ["req-0", "req-1"]
+        assert len(context.tracing.saved) == 1 and "req-0+req-1" in context.tracing.saved[0]
+        print("✅ 마지막 글이 끝날 때까지 chunk 유지, 늦게 실패한 글도 Trace 저장")
+    print()
+
+
+if __name__ == "__main__":
+    asyncio.run(test_run_batch())
+    asyncio.run(test_rate_limiter())
+    asyncio.run(test_handle_create_posts_batch())
+    asyncio.run(test_batch_items_share_trace_chunk())
+    print("🎉 모든 테스트 통과!")
@@ -0,0 +1,160 @@
+"""카테고리 캐시 테스트 (브라우저 없이 실행)."""
+
+import asyncio
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+sys.path.insert(0, "src")
+
+from naver_blog_mcp.mcp import tools
+from naver_blog_mcp.services.category_cache import CategoryCache
+
+SAMPLE_CATEGORIES = [
+    {"name": "일상", "url": "https://blog.naver.com/PostList.naver?categoryNo=1", "categoryNo": "1"},
+    {"name": "Python", "url": "https://blog.naver.com/PostList.naver?categoryNo=7", "categoryNo": "7"},
+]
+
+
+def test_memory_and_disk_cache():
+    """메모리 캐시와 디스크 캐시 동작 테스트."""
+    print("=" * 60)
+    print("카테고리 캐시 저장/복원 테스트")
+    print("=" * 60)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        cache_path = Path(tmp) / "categories.json"
+
+        cache = CategoryCache(cache_path=str(cache_path), ttl_seconds=60)
+        assert cache.get("myblog") is None
+        cache.set("myblog", SAMPLE_CATEGORIES)
+        assert cache.get("myblog") == SAMPLE_CATEGORIES
+        assert cache_path.exists()
+        print("✅ 메모리 캐시 저장/조회")
+
+        # 새 인스턴스는 디스크에서 복원
+        restored = CategoryCache(cache_path=str(cache_path), ttl_seconds=60)
+        assert restored.get("myblog") == SAMPLE_CATEGORIES
+        assert restored.get("otherblog") is None
+        print("✅ 디스크 캐시 복원 (blog_id별 분리)")
+
+        restored.invalidate("myblog")
+        assert restored.get("myblog") is None
+        assert CategoryCache(cache_path=str(cache_path)).get("myblog") is None
+        print("✅ 명시적 무효화")
+    print()
+
+
+def test_ttl_and_resolve():
+    """TTL 만료 및 카테고리 이름 → categoryNo 변환 테스트."""
+    print("=" * 60)
+    print("TTL / 이름 변환 테스트")
+    print("=" * 60)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        cache = CategoryCache(cache_path=str(Path(tmp) / "c.json"), ttl_seconds=60)
+        cache.set("myblog", SAMPLE_CATEGORIES)
+
+        assert cache.resolve_category_no("myblog", " python ") == "7"
+        assert cache.resolve_category_no("myblog", "없는 카테고리") is None
+        print("✅ 이름 → categoryNo 변환")
+
+        # fetched_at을 과거로 돌려 만료시키기
+        cache._entries["myblog"]["fetched_at"] = time.time() - 120
+        assert cache.get("myblog") is None
+        assert cache.resolve_category_no("myblog", "일상") is None
+        print("✅ TTL 만료")
+
+        disabled = CategoryCache(cache_path=str(Path(tmp) / "d.json"), ttl_seconds=0)
+        disabled.set("myblog", SAMPLE_CATEGORIES)
+        assert disabled.get("myblog") is None
+        print("✅ TTL 0이면 캐시 비활성화")
+    print()
+
+
+
+def test_missing_names():
+    """목록에 없는 이름을 만료/새 조회 전까지 기억하는지 테스트."""
+    print("=" * 60)
+    print("없는 카테고리 이름 기억 테스트")
+    print("=" * 60)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        cache_path = str(Path(tmp) / "c.json")
+        cache = CategoryCache(cache_path=cache_path, ttl_seconds=60)
+
+        cache.remember_missing("myblog", "오타")
+        assert not cache.is_missing("myblog", "오타")
+        print("✅ 캐시된 목록이 없으면 기억하지 않음")
+
+        cache.set("myblog", SAMPLE_CATEGORIES)
+        cache.remember_missing("myblog", " 오타 ")
+        assert cache.is_missing("myblog", "오타")
+        assert CategoryCache(cache_path=cache_path, ttl_seconds=60).is_missing("myblog", "오타")
+        assert not cache.is_missing("otherblog", "오타")
+        print("✅ 없는 이름 기억 (디스크에도 저장, blog_id별)")
+
+        cache.set("myblog", SAMPLE_CATEGORIES)
+        assert not cache.is_missing("myblog", "오타")
+        cache.remember_missing("myblog", "오타")
+        cache._entries["myblog"]["fetched_at"] = time.time() - 120
+        assert not cache.is_missing("myblog", "오타") and cache.age("myblog") is None
+        print("✅ 새로 조회하거나 TTL이 지나면 잊음")
+    print()
+
+
+async def test_resolve_does_not_rescrape():
+    """없는 카테고리 이름으로 글을 계속 써도 매번 다시 조회하지 않는지 테스트."""
+    print("=" * 60)
+    print("카테고리 재조회 횟수 테스트")
+    print("=" * 60)
+
+    scrapes = []
+
+    async def fake_get_categories(page, blog_id):
+        scrapes.append(blog_id)
+        return {"success": True, "message": "", "categories": SAMPLE_CATEGORIES}
+
+    original_cache, original_get = tools.category_cache, tools.get_categories
+    with tempfile.TemporaryDirectory() as tmp:
+        cache = CategoryCache(cache_path=str(Path(tmp) / "c.json"), ttl_seconds=3600)
+        tools.category_cache, tools.get_categories = cache, fake_get_categories
+        try:
+            # 캐시가 없으면 한 번 조회
+            assert await tools._resolve_category_no(None, "myblog", "Python") == "7"
+            assert len(scrapes) == 1
+
+            # 방금 조회한 목록에 없으면 다시 조회하지 않고 기억
+            for _ in range(3):
+                assert await tools._resolve_category_no(None, "myblog", "오타") is None
+            assert len(scrapes) == 1 and cache.is_missing("myblog", "오타")
+            print("✅ 방금 조회한 목록에 없는 이름은 다시 조회하지 않음")
+
+            # 오래된 목록에 없으면 한 번만 다시 조회 (새로 만든 카테고리일 수 있음)
+            cache.set("myblog", SAMPLE_CATEGORIES)
+            cache._entries["myblog"]["fetched_at"] -= tools.CATEGORY_RECENT_FETCH_SECONDS
+            for _ in range(3):
+                assert await tools._resolve_category_no(None, "myblog", "삭제된 카테고리") is None
+            assert len(scrapes) == 2
+            print("✅ 오래된 목록은 한 번만 다시 조회하고, 그래도 없으면 기억")
+
+            async def failing_get_categories(page, blog_id):
+                scrapes.append(blog_id)
+                return {"success": False, "message": "timeout", "categories": []}
+
+            tools.get_categories = failing_get_categories
+            result = await tools.handle_list_categories(None, blog_id="myblog", refresh=True)
+            assert not result["success"] and cache.get("myblog") == SAMPLE_CATEGORIES
+            print("✅ refresh 조회에 실패해도 기존 캐시 유지")
+        finally:
+            tools.category_cache, tools.get_categories = original_cache, original_get
+    print()
+
+
+if __name__ == "__main__":
+    test_memory_and_disk_cache()
+    test_ttl_and_resolve()
+    test_missing_names()
+    asyncio.run(test_resolve_does_not_rescrape())
+    print("🎉 모든 테스트 통과!")
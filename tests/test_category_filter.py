@@ -0,0 +1,102 @@
+"""카테고리 링크 필터링 테스트 및 벤치마크 (저장된 HTML 사용, 브라우저 불필요).
+
+실행:
+    uv run python tests/test_category_filter.py
+"""
+
+import re
+import sys
+import time
+from html.parser import HTMLParser
+from pathlib import Path
+
+sys.path.insert(0, "src")
+
+from naver_blog_mcp.automation.category_actions import filter_category_links
+
+FIXTURE = Path(__file__).parent / "fixtures" / "category_sidebar.html"
+
+
+class PostListLinkParser(HTMLParser):
+    """CATEGORY_LINKS_SCRIPT와 같은 형식으로 PostList 링크를 추출합니다."""
+
+    def __init__(self):
+        super().__init__()
+        self.links = []
+        self._list_depth = 0
+        self._current = None
+
+    def handle_starttag(self, tag, attrs):
+        if tag in ("ul", "ol"):
+            self._list_depth += 1
+        elif tag == "a":
+            href = dict(attrs).get("href") or ""
+            if "PostList" in href:
+                self._current = ["", href, self._param(href, "categoryNo"),
+                                 self._param(href, "parentCategoryNo"), self._list_depth]
+
+    def handle_endtag(self, tag):
+        if tag in ("ul", "ol"):
+            self._list_depth -= 1
+        elif tag == "a" and self._current is not None:
+            self.links.append(self._current)
+            self._current = None
+
+    def handle_data(self, data):
+        if self._current is not None:
+            self._current[0] += data
+
+    @staticmethod
+    def _param(href, key):
+        match = re.search(rf"[?&]{key}=([0-9]+)", href)
+        return match.group(1) if match else None
+
+
+def load_fixture_links() -> list:
+    parser = PostListLinkParser()
+    parser.feed(FIXTURE.read_text(encoding="utf-8"))
+    return parser.links
+
+
+def test_filter_category_links():
+    """저장된 사이드바 HTML에서 카테고리만 골라내는지 테스트."""
+    print("=" * 60)
+    print("카테고리 링크 필터링 테스트")
+    print("=" * 60)
+
+    categories = filter_category_links(load_fixture_links(), blog_id="myblog")
+    names = [c["name"] for c in categories]
+
+    assert names == ["개발", "Python", "JavaScript", "일상", "여행 기록"], names
+    print(f"✅ 카테고리 추출: {names}")
+
+    by_name = {c["name"]: c for c in categories}
+    assert by_name["개발"]["parentCategoryNo"] is None
+    assert by_name["개발"]["depth"] == 0
+    assert by_name["Python"]["parentCategoryNo"] == "12"
+    assert by_name["Python"]["depth"] == 1
+    assert by_name["일상"]["depth"] == 0
+    print("✅ parentCategoryNo / depth")
+
+    assert by_name["일상"]["url"].startswith("https://blog.naver.com/PostList.naver")
+    print("✅ 절대 URL 변환")
+    print()
+
+
+def benchmark_filter_category_links(repeat: int = 200):
+    """200개 링크 규모의 필터링 시간을 측정합니다."""
+    links = load_fixture_links()
+    links = (links * (200 // len(links) + 1))[:200]
+
+    started = time.perf_counter()
+    for _ in range(repeat):
+        filter_category_links(links, blog_id="myblog")
+    elapsed = (time.perf_counter() - started) / repeat
+
+    print(f"⏱️ 링크 {len(links)}개 필터링: {elapsed * 1_000_000:.1f}µs/회")
+
+
+if __name__ == "__main__":
+    test_filter_category_links()
+    benchmark_filter_category_links()
+    print("🎉 모든 테스트 통과!")
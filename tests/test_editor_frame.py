@@ -0,0 +1,178 @@
+"""에디터 프레임 확인/캐시 테스트 (브라우저 없이 가짜 Page로 검증)."""
+
+import asyncio
+import sys
+
+sys.path.insert(0, "src")
+
+from playwright.async_api import TimeoutError as PlaywrightTimeout
+
+from naver_blog_mcp.automation.editor_frame import (
+    count_probed_frames,
+    find_editor_frame,
+    forget_editor_frame,
+    frames_to_probe,
+    remember_editor_frame,
+)
+from naver_blog_mcp.automation.post_actions import _wait_for_publish_dialog
+from naver_blog_mcp.utils.metrics import FRAMES_PROBED
+from naver_blog_mcp.utils.timing import recording
+
+
+class FakeFrame:
+    def __init__(self, name="", url="about:blank", dialog_after=None):
+        self.name = name
+        self.url = url
+        self.detached = False
+        # 대화상자가 이 프레임에 나타나기까지 걸리는 시간 (초, None이면 나타나지 않음)
+        self.dialog_after = dialog_after
+        self.waits = 0
+
+    def is_detached(self):
+        return self.detached
+
+    async def wait_for_selector(self, selector, state="visible", timeout=30000):
+        self.waits += 1
+        if self.dialog_after is not None and self.dialog_after * 1000 <= timeout:
+            await asyncio.sleep(self.dialog_after)
+            return object()
+        await asyncio.sleep(timeout / 1000)
+        raise PlaywrightTimeout(f"Timeout {timeout}ms exceeded")
+
+
+class FakePage:
+    def __init__(self, frames):
+        self.frames = frames
+        self.main_frame = frames[0]
+
+
+def make_write_page():
+    main = FakeFrame(url="https://blog.naver.com/myblog?Redirect=Write")
+    ads = [FakeFrame(url=f"https://ad.example.com/{idx}") for idx in range(5)]
+    editor = FakeFrame(
+        name="mainFrame",
+        url="https://blog.naver.com/PostWriteForm.naver?blogId=myblog",
+    )
+    return FakePage([main, *ads, editor]), editor
+
+
+def test_find_editor_frame():
+    """name/URL로 에디터 프레임을 찾고 기억하는지 테스트."""
+    print("=" * 60)
+    print("에디터 프레임 확인 테스트")
+    print("=" * 60)
+
+    page, editor = make_write_page()
+    assert find_editor_frame(page) is editor
+    print("✅ 광고 iframe 사이에서 에디터 iframe 확인 (메인 프레임 제외)")
+
+    # 프레임 목록이 바뀌어도 기억한 프레임을 그대로 사용
+    page.frames = page.frames[:1]
+    assert find_editor_frame(page) is editor
+    print("✅ 한 번 확인한 프레임은 다시 찾지 않음")
+
+    editor.detached = True
+    assert find_editor_frame(page) is None
+    print("✅ 떨어져 나간 프레임은 버리고 다시 찾음")
+
+    page, editor = make_write_page()
+    editor.name = ""
+    assert find_editor_frame(page) is editor
+    forget_editor_frame(page)
+    page.frames = page.frames[:-1]
+    assert find_editor_frame(page) is None
+    print("✅ name이 없어도 PostWriteForm URL로 확인 / forget 후 캐시 없음")
+    print()
+
+
+def test_frames_to_probe():
+    """에디터 프레임을 먼저 검사하는 순서 테스트."""
+    print("=" * 60)
+    print("프레임 검사 순서 테스트")
+    print("=" * 60)
+
+    page, editor = make_write_page()
+    frames = frames_to_probe(page)
+    assert frames[0] is editor and len(frames) == len(page.frames)
+    print("✅ 에디터 프레임이 맨 앞, 나머지는 대체용")
+
+    dialog = page.frames[2]
+    assert frames_to_probe(page, preferred=dialog)[0] is dialog
+    print("✅ 지정한 프레임(발행 버튼을 누른 프레임)이 맨 앞")
+
+    main_only = FakePage([FakeFrame(url="https://blog.naver.com/postwrite")])
+    remember_editor_frame(main_only, main_only.main_frame)
+    assert frames_to_probe(main_only) == [main_only.main_frame]
+
+    no_editor = FakePage([FakeFrame(), FakeFrame(url="https://ad.example.com")])
+    assert frames_to_probe(no_editor) == no_editor.frames
+    print("✅ 에디터 프레임을 모르면 전체 프레임 (기존 순서)")
+    print()
+
+
+def test_count_probed_frames():
+    """검사한 프레임 수 기록 테스트."""
+    print("=" * 60)
+    print("검사 프레임 수 기록 테스트")
+    print("=" * 60)
+
+    before = FRAMES_PROBED.value(step="publish_btn")
+    with recording("test") as recorder:
+        count_probed_frames("publish_btn")
+        count_probed_frames("publish_btn", 2)
+        count_probed_frames("publish_dialog")
+
+    assert FRAMES_PROBED.value(step="publish_btn") == before + 3
+    assert recorder.report()["counters"] == {
+        "frames_probed.publish_btn": 3,
+        "frames_probed.publish_dialog": 1,
+    }
+    print("✅ 메트릭과 span 리포트에 단계별 프레임 수")
+
+    with recording("empty") as recorder:
+        pass
+    assert "counters" not in recorder.report()
+    print("✅ 카운터가 없으면 리포트에 포함하지 않음")
+    print()
+
+
+
+async def test_wait_for_publish_dialog():
+    """발행 대화상자가 다른 프레임에 떠도 기다리는 시간이 늘지 않는지 테스트."""
+    print("=" * 60)
+    print("발행 대화상자 대기 테스트")
+    print("=" * 60)
+
+    loop = asyncio.get_running_loop()
+
+    page, editor = make_write_page()
+    editor.dialog_after = 0.05
+    assert await _wait_for_publish_dialog(page, editor, timeout=2000) is editor
+    assert sum(frame.waits for frame in page.frames) == 1
+    print("✅ 누른 프레임에 바로 뜨면 그 프레임만 검사")
+
+    page, editor = make_write_page()
+    page.main_frame.dialog_after = 0.4
+    started = loop.time()
+    assert await _wait_for_publish_dialog(page, editor, timeout=2000) is page.main_frame
+    assert loop.time() - started < 0.7
+    print("✅ 다른 프레임에 뜨면 전체 프레임 검사가 바로 찾음 (누른 프레임 timeout을 기다리지 않음)")
+
+    page, editor = make_write_page()
+    started = loop.time()
+    try:
+        await _wait_for_publish_dialog(page, editor, timeout=500)
+        raise AssertionError("PlaywrightTimeout expected")
+    except PlaywrightTimeout:
+        pass
+    assert loop.time() - started < 1.0
+    print("✅ 어디에도 없으면 timeout 안에 실패")
+    print()
+
+
+if __name__ == "__main__":
+    test_find_editor_frame()
+    test_frames_to_probe()
+    test_count_probed_frames()
+    asyncio.run(test_wait_for_publish_dialog())
+    print("🎉 모든 테스트 통과!")
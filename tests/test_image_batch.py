@@ -0,0 +1,86 @@
+"""배치 이미지 업로드 부분 성공 처리 테스트 (브라우저 없이 업로드 함수를 바꿔 검증)."""
+
+import asyncio
+import sys
+import tempfile
+from pathlib import Path
+
+sys.path.insert(0, "src")
+
+from naver_blog_mcp.automation import image_upload
+from naver_blog_mcp.automation.image_upload import match_inserted_images
+
+
+def image(name):
+    return {"url": f"https://postfiles.pstatic.net/mock/1/{name}?type=w966", "width": 10, "height": 10}
+
+
+def test_match_inserted_images():
+    """URL 파일명으로 올라간 파일을 찾는지 테스트."""
+    print("=" * 60)
+    print("부분 배치 파일 식별 테스트")
+    print("=" * 60)
+
+    paths = [Path("/tmp/a.png"), Path("/tmp/b.png"), Path("/tmp/c d.png")]
+    assert match_inserted_images(paths, [image("a.png"), image("c%20d.png")]) == [0, 2]
+    assert match_inserted_images(paths, []) == []
+    print("✅ URL 파일명(퍼센트 인코딩 포함)으로 인덱스 식별")
+
+    assert match_inserted_images(paths, [{"url": "blob:https://blog.naver.com/1234"}]) is None
+    assert match_inserted_images(paths, [image("a.png"), image("a.png")]) is None
+    assert match_inserted_images([Path("/x/a.png"), Path("/y/a.png")], [image("a.png")]) is None
+    print("✅ 파일명을 모르거나 겹치면 None")
+    print()
+
+
+async def run_partial_batch(images):
+    """세 장 중 images만 올라간 배치를 흉내 내고 upload_images 결과와 재업로드 목록을 반환."""
+    retried = []
+
+    async def fake_batch(page, paths):
+        return len(images), images
+
+    async def fake_upload(page, path, wait_for_complete=True):
+        retried.append(Path(path).name)
+        return {"success": True, "image": None}
+
+    original_batch, original_upload = image_upload.upload_image_batch, image_upload.upload_image
+    image_upload.upload_image_batch, image_upload.upload_image = fake_batch, fake_upload
+    try:
+        with tempfile.TemporaryDirectory() as tmp:
+            paths = []
+            for name in ["a.png", "b.png", "c.png"]:
+                path = Path(tmp) / name
+                path.write_bytes(b"png")
+                paths.append(str(path))
+            result = await image_upload.upload_images(
+                None, paths, batch=True, batch_size=3, preprocess=False, use_cache=False
+            )
+    finally:
+        image_upload.upload_image_batch, image_upload.upload_image = original_batch, original_upload
+
+    return [Path(p).name for p in result["uploaded"]], result["failed"], retried
+
+
+async def test_partial_batch_retry():
+    """부분 성공 시 빠진 파일만, 식별 실패 시 묶음 전체를 한 장씩 다시 올리는지 테스트."""
+    print("=" * 60)
+    print("부분 배치 재업로드 테스트")
+    print("=" * 60)
+
+    uploaded, failed, retried = await run_partial_batch([image("a.png"), image("c.png")])
+    assert retried == ["b.png"]
+    assert uploaded == ["a.png", "c.png", "b.png"] and failed == []
+    print("✅ 식별된 파일은 성공, 빠진 파일만 한 장씩 재업로드")
+
+    uploaded, failed, retried = await run_partial_batch([{"url": "blob:1", "width": 0, "height": 0}])
+    assert retried == ["a.png", "b.png", "c.png"]
+    assert uploaded == ["a.png", "b.png", "c.png"] and failed == []
+    print("✅ 식별할 수 없으면 묶음 전체를 한 장씩 재업로드")
+    print()
+
+
+if __name__ == "__main__":
+    test_match_inserted_images()
+    asyncio.run(test_partial_batch_retry())
+    print("🎉 모든 테스트 통과!")
@@ -0,0 +1,72 @@
+"""업로드 이미지 캐시 테스트 (브라우저 불필요)."""
+
+import sys
+import tempfile
+from pathlib import Path
+
+sys.path.insert(0, "src")
+
+from naver_blog_mcp.services.image_cache import ImageCache
+
+
+def test_hash_and_counters():
+    """내용 해시 키와 hit/miss 카운터 테스트."""
+    print("=" * 60)
+    print("이미지 캐시 hit/miss 테스트")
+    print("=" * 60)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        a = Path(tmp) / "banner.png"
+        b = Path(tmp) / "banner-copy.png"
+        a.write_bytes(b"same-bytes")
+        b.write_bytes(b"same-bytes")
+
+        # 파일 이름이 달라도 내용이 같으면 같은 키
+        assert ImageCache.hash_file(a) == ImageCache.hash_file(b)
+        assert ImageCache.hash_file(a) == ImageCache.hash_bytes(b"same-bytes")
+        print("✅ 내용 기준 SHA-256")
+
+        cache = ImageCache(cache_path=Path(tmp) / "cache.json")
+        digest = ImageCache.hash_file(a)
+        assert cache.get(digest) is None
+        cache.put(digest, "https://postfiles.pstatic.net/banner.png", 800, 200)
+        assert cache.get(digest)["url"].endswith("banner.png")
+
+        stats = cache.stats()
+        assert stats["hits"] == 1 and stats["misses"] == 1
+        assert stats["hit_rate"] == 0.5
+        print(f"✅ 카운터: {stats}")
+    print()
+
+
+def test_lru_and_persistence():
+    """LRU 제거와 디스크 저장 테스트."""
+    print("=" * 60)
+    print("이미지 캐시 LRU/저장 테스트")
+    print("=" * 60)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        path = Path(tmp) / "cache.json"
+        cache = ImageCache(cache_path=path, max_entries=2)
+        cache.put("a", "https://example.com/a.png")
+        cache.put("b", "https://example.com/b.png")
+        cache.get("a")  # a를 최근 사용으로 갱신
+        cache.put("c", "https://example.com/c.png")
+
+        assert cache.get("b") is None
+        assert cache.get("a") is not None
+        assert cache.stats()["evictions"] == 1
+        print("✅ 가장 오래 안 쓴 항목 제거")
+
+        reloaded = ImageCache(cache_path=path, max_entries=2)
+        assert reloaded.get("c")["url"] == "https://example.com/c.png"
+        reloaded.discard("c")
+        assert ImageCache(cache_path=path).get("c") is None
+        print("✅ 디스크 저장/삭제 반영")
+    print()
+
+
+if __name__ == "__main__":
+    test_hash_and_counters()
+    test_lru_and_persistence()
+    print("🎉 모든 테스트 통과!")
@@ -0,0 +1,104 @@
+"""이미지 전처리 테스트 (브라우저 불필요)."""
+
+import asyncio
+import sys
+import tempfile
+from pathlib import Path
+
+from PIL import Image
+
+sys.path.insert(0, "src")
+
+from naver_blog_mcp.utils.image_processing import (
+    preprocess_image,
+    preprocess_images,
+    shutdown_preprocess_pool,
+)
+
+
+def make_photo(path: Path, size=(4000, 3000)) -> Path:
+    """EXIF(카메라 모델, 회전 정보)가 들어간 큰 JPEG를 만듭니다."""
+    img = Image.effect_noise(size, 64).convert("RGB")
+    exif = Image.Exif()
+    exif[0x0110] = "Test Camera"  # Model
+    exif[0x0112] = 6  # Orientation: 90도 회전
+    img.save(path, "JPEG", quality=95, exif=exif.tobytes())
+    return path
+
+
+def test_resize_and_strip_exif():
+    """긴 변 축소, 회전 반영, EXIF 제거 테스트."""
+    print("=" * 60)
+    print("이미지 전처리 테스트")
+    print("=" * 60)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        source = make_photo(Path(tmp) / "photo.jpg")
+        output_dir = Path(tmp) / "out"
+
+        result = Path(preprocess_image(source, output_dir, max_edge=1024, quality=80))
+        assert result != source
+        assert result.stat().st_size < source.stat().st_size
+
+        with Image.open(result) as img:
+            # Orientation 6 → 세로 사진으로 회전된 뒤 축소
+            assert img.size == (768, 1024), img.size
+            assert len(img.getexif()) == 0
+        print(f"✅ {source.stat().st_size:,}B → {result.stat().st_size:,}B, EXIF 제거")
+
+        # 같은 설정으로 다시 처리하면 같은 결과 파일 재사용
+        again = Path(preprocess_image(source, output_dir, max_edge=1024, quality=80))
+        assert again == result
+        print("✅ 결과 파일 재사용")
+    print()
+
+
+def test_passthrough():
+    """처리 대상이 아닌 파일은 원본을 그대로 사용하는지 테스트."""
+    print("=" * 60)
+    print("원본 유지 테스트")
+    print("=" * 60)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        # 이미 작은 PNG: 재압축해도 이득이 없으면 원본 사용
+        small = Path(tmp) / "small.png"
+        Image.new("RGB", (10, 10), color="red").save(small, optimize=True)
+        assert preprocess_image(small, Path(tmp) / "out") == str(small)
+        print("✅ 이득 없는 파일은 원본 사용")
+
+        # 애니메이션 GIF는 건드리지 않음
+        gif = Path(tmp) / "anim.gif"
+        frames = [Image.new("P", (50, 50), color=i) for i in range(3)]
+        frames[0].save(gif, save_all=True, append_images=frames[1:])
+        assert preprocess_image(gif, Path(tmp) / "out") == str(gif)
+        print("✅ 애니메이션 GIF 원본 사용")
+    print()
+
+
+async def test_process_pool():
+    """프로세스 풀 병렬 처리 및 실패 시 원본 유지 테스트."""
+    print("=" * 60)
+    print("프로세스 풀 전처리 테스트")
+    print("=" * 60)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        photos = [make_photo(Path(tmp) / f"p{i}.jpg", size=(3000, 2000)) for i in range(3)]
+        missing = Path(tmp) / "missing.jpg"
+
+        results = await preprocess_images(
+            photos + [missing], output_dir=Path(tmp) / "out", max_edge=800, max_workers=2
+        )
+        assert len(results) == 4
+        assert all(Path(r).parent.name == "out" for r in results[:3])
+        assert results[3] == str(missing)
+        print("✅ 병렬 전처리 및 순서 유지, 실패 시 원본 경로")
+
+    shutdown_preprocess_pool()
+    print()
+
+
+if __name__ == "__main__":
+    test_resize_and_strip_exif()
+    test_passthrough()
+    asyncio.run(test_process_pool())
+    print("🎉 모든 테스트 통과!")
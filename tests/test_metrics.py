@@ -0,0 +1,100 @@
+"""메트릭 카운터와 HTTP 엔드포인트 테스트 (브라우저 불필요)."""
+
+import asyncio
+import sys
+
+sys.path.insert(0, "src")
+
+from naver_blog_mcp.services.metrics_exporter import MetricsExporter
+from naver_blog_mcp.utils.metrics import RETRIES, MetricsRegistry
+from naver_blog_mcp.utils.retry import create_retry_decorator
+
+
+def test_counter_render():
+    """카운터 누적과 텍스트 형식 테스트."""
+    print("=" * 60)
+    print("카운터 테스트")
+    print("=" * 60)
+
+    registry = MetricsRegistry()
+    calls = registry.counter("calls_total", "Calls", label_names=("tool", "status"))
+    calls.inc(tool="create", status="success")
+    calls.inc(2, tool="create", status="error")
+
+    text = registry.render()
+    assert "# TYPE calls_total counter" in text
+    assert 'calls_total{tool="create",status="error"} 2' in text
+    assert calls.value(tool="create", status="success") == 1
+    assert registry.counter("calls_total", "Calls", ("tool", "status")) is calls
+    print("✅ 레이블별 누적, 같은 이름은 같은 카운터")
+
+    try:
+        registry.histogram("calls_total", "Calls")
+        raise AssertionError("ValueError expected")
+    except ValueError:
+        pass
+    print("✅ 다른 종류로 중복 등록 거부")
+    print()
+
+
+async def test_retry_counted():
+    """재시도 데코레이터가 재시도 횟수를 기록하는지 테스트."""
+    print("=" * 60)
+    print("재시도 카운터 테스트")
+    print("=" * 60)
+
+    attempts = []
+
+    @create_retry_decorator(max_attempts=3, min_wait=0, max_wait=0, multiplier=0)
+    async def flaky_step():
+        attempts.append(1)
+        if len(attempts) < 3:
+            raise TimeoutError("timeout")
+        return "ok"
+
+    before = RETRIES.value(function="flaky_step", error="TimeoutError")
+    assert await flaky_step() == "ok"
+    assert RETRIES.value(function="flaky_step", error="TimeoutError") == before + 2
+    print("✅ 함수/에러별 재시도 2회 기록")
+    print()
+
+
+async def test_exporter_http():
+    """GET /metrics가 텍스트 형식을 반환하는지 테스트."""
+    print("=" * 60)
+    print("메트릭 엔드포인트 테스트")
+    print("=" * 60)
+
+    registry = MetricsRegistry()
+    registry.counter("up_total", "Up").inc()
+    exporter = MetricsExporter(registry, port=0)
+    await exporter.start()
+
+    async def get(path: str) -> str:
+        reader, writer = await asyncio.open_connection("127.0.0.1", exporter.bound_port)
+        writer.write(f"GET {path} HTTP/1.1\r\nHost: localhost\r\n\r\n".encode())
+        await writer.drain()
+        response = (await reader.read()).decode()
+        writer.close()
+        return response
+
+    try:
+        response = await get("/metrics")
+        assert response.startswith("HTTP/1.1 200 OK")
+        assert "text/plain; version=0.0.4" in response
+        assert response.endswith("up_total 1\n")
+        print("✅ /metrics 200, Prometheus 텍스트 형식")
+
+        assert (await get("/other")).startswith("HTTP/1.1 404")
+        print("✅ 다른 경로 404")
+    finally:
+        await exporter.stop()
+    assert exporter.bound_port is None
+    print()
+
+
+if __name__ == "__main__":
+    test_counter_render()
+    asyncio.run(test_retry_counted())
+    asyncio.run(test_exporter_http())
+    print("🎉 모든 테스트 통과!")
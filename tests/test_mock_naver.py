@@ -0,0 +1,122 @@
+"""모의 네이버 서버 라우팅 테스트 (브라우저 없이 가짜 route로 검증)."""
+
+import asyncio
+import json
+import sys
+
+sys.path.insert(0, "src")
+
+from mock_naver import MockNaver
+
+
+class FakeRequest:
+    def __init__(self, url, post_data=None):
+        self.url = url
+        self.post_data = post_data
+        self.post_data_buffer = post_data.encode() if post_data else None
+
+
+class FakeRoute:
+    def __init__(self, url, post_data=None):
+        self.request = FakeRequest(url, post_data)
+        self.response = None
+        self.aborted = None
+
+    async def fulfill(self, **response):
+        self.response = response
+
+    async def abort(self, error_code="failed"):
+        self.aborted = error_code
+
+
+async def fetch(mock, url, post_data=None) -> FakeRoute:
+    route = FakeRoute(url, post_data)
+    await mock.handle(route)
+    return route
+
+
+async def test_write_flow_routes():
+    """글쓰기 진입 경로가 실제 네이버와 같은 구조인지 테스트."""
+    print("=" * 60)
+    print("모의 서버 글쓰기 경로 테스트")
+    print("=" * 60)
+
+    mock = MockNaver(blog_id="myblog", publish_delay_ms=0)
+
+    home = (await fetch(mock, "https://blog.naver.com/")).response
+    assert 'href="/myblog/postwrite"' in home["body"]
+    print("✅ 블로그 홈에 글쓰기 버튼")
+
+    redirect = (await fetch(mock, "https://blog.naver.com/myblog/postwrite?categoryNo=13")).response
+    location = redirect["headers"]["location"]
+    assert redirect["status"] == 302
+    assert location.startswith("https://blog.naver.com/myblog?") and "Redirect=Write" in location
+    assert "categoryNo=13" in location
+
+    frame = (await fetch(mock, location)).response["body"]
+    assert 'id="mainFrame"' in frame
+    assert "PostWriteForm.naver?blogId=myblog&categoryNo=13" in frame
+    print("✅ postwrite → Redirect=Write → iframe#mainFrame 에디터")
+
+    editor = (await fetch(mock, "https://blog.naver.com/PostWriteForm.naver?blogId=myblog")).response["body"]
+    assert "$" not in editor.replace("$$", "")
+    for marker in ('data-placeholder="제목"', 'id="hidden-file"', "layer_popup__i0QOY"):
+        assert marker in editor
+    assert "const DRAFT = null;" in editor
+    print("✅ 에디터: 제목/본문, 사진 input, 발행 대화상자")
+
+    drafted = MockNaver(draft_text="이전 글</script>")
+    editor = (await fetch(drafted, "https://blog.naver.com/PostWriteForm.naver?blogId=myblog")).response["body"]
+    assert 'const DRAFT = "이전 글<\\/script>";' in editor
+    assert "se-popup-alert-confirm" in editor
+    print("✅ 임시 저장 글이 있으면 이어쓰기 팝업")
+
+    post = {"title": "제목", "content": "본문", "images": [], "categoryNo": None}
+    published = json.loads(
+        (await fetch(mock, "https://blog.naver.com/mock-api/publish", json.dumps(post))).response["body"]
+    )
+    assert mock.published[0]["title"] == "제목"
+    view = (await fetch(mock, f"https://blog.naver.com/myblog/{published['logNo']}")).response
+    assert view["status"] == 200 and "제목" in view["body"]
+    print("✅ 발행 기록 후 글 보기 페이지")
+    print()
+
+
+async def test_uploads_and_offline():
+    """업로드 이미지 제공과 외부 요청 차단 테스트."""
+    print("=" * 60)
+    print("모의 서버 업로드/차단 테스트")
+    print("=" * 60)
+
+    mock = MockNaver()
+
+    uploaded = json.loads(
+        (await fetch(mock, "https://blog.naver.com/mock-api/upload?name=%EC%82%AC%EC%A7%84.png", "PNGDATA")).response["body"]
+    )
+    image = (await fetch(mock, uploaded["url"])).response
+    assert uploaded["url"].startswith("https://postfiles.pstatic.net/")
+    assert image["status"] == 200 and image["body"] == b"PNGDATA"
+    assert image["content_type"] == "image/png"
+    print("✅ 업로드한 이미지를 http URL로 제공")
+
+    categories = (await fetch(mock, "https://blog.naver.com/myblog")).response["body"]
+    assert "PostList.naver?blogId=myblog" in categories
+    print("✅ 블로그 메인 iframe은 카테고리 사이드바")
+
+    assert "https://veta.naver.com/ad/banner.gif" in categories
+    served = mock.served_bytes
+    font = (await fetch(mock, "https://ssl.pstatic.net/static/mock/nanum.woff2")).response
+    assert font["content_type"] == "font/woff2"
+    assert mock.served_bytes - served == len(font["body"]) == 150_000
+    print("✅ 광고/통계/웹폰트 리소스 제공 (응답 바이트 집계)")
+
+    route = await fetch(mock, "https://www.google-analytics.com/collect")
+    assert route.aborted and mock.blocked == ["https://www.google-analytics.com/collect"]
+    print("✅ 모의 호스트가 아닌 요청 차단")
+    print()
+
+
+if __name__ == "__main__":
+    asyncio.run(test_write_flow_routes())
+    asyncio.run(test_uploads_and_offline())
+    print("🎉 모든 테스트 통과!")
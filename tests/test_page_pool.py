@@ -0,0 +1,170 @@
+"""페이지 풀 테스트 (브라우저 없이 가짜 페이지로 검증)."""
+
+import asyncio
+import sys
+
+sys.path.insert(0, "src")
+
+from naver_blog_mcp.services.page_pool import PagePool
+
+
+class FakePage:
+    """health check와 crash 이벤트만 흉내내는 가짜 페이지."""
+
+    def __init__(self):
+        self.closed = False
+        self.broken = False
+        self.close_fails = False
+        self.handlers = {}
+
+    def on(self, event, handler):
+        self.handlers[event] = handler
+
+    def is_closed(self):
+        return self.closed
+
+    async def evaluate(self, expression):
+        if self.broken:
+            raise RuntimeError("Target crashed")
+        return True
+
+    async def close(self):
+        if self.close_fails:
+            raise RuntimeError("Target closed")
+        self.closed = True
+
+
+class FakeContext:
+    def __init__(self):
+        self.pages = []
+
+    async def new_page(self):
+        page = FakePage()
+        self.pages.append(page)
+        return page
+
+
+async def test_concurrent_checkout():
+    """풀 크기만큼 동시에 서로 다른 페이지를 빌려주는지 테스트."""
+    print("=" * 60)
+    print("동시 체크아웃 테스트")
+    print("=" * 60)
+
+    context = FakeContext()
+    pool = PagePool(context, size=2)
+
+    page1 = await pool.acquire()
+    page2 = await pool.acquire()
+    assert page1 is not page2
+    assert pool.stats()["in_use"] == 2
+
+    # 세 번째 요청은 반납될 때까지 대기해야 함
+    waiter = asyncio.create_task(pool.acquire())
+    await asyncio.sleep(0.05)
+    assert not waiter.done()
+
+    await pool.release(page1)
+    page3 = await asyncio.wait_for(waiter, timeout=1)
+    assert page3 is page1
+    assert len(context.pages) == 2
+    print("✅ 풀 크기 제한 및 재사용 확인")
+
+    await pool.release(page2)
+    await pool.release(page3)
+    await pool.close()
+    print()
+
+
+async def test_crashed_page_replaced():
+    """크래시된 페이지가 새 페이지로 교체되는지 테스트."""
+    print("=" * 60)
+    print("크래시 페이지 교체 테스트")
+    print("=" * 60)
+
+    context = FakeContext()
+    pool = PagePool(context, size=1)
+
+    async with pool.page() as page:
+        page.handlers["crash"](page)
+
+    async with pool.page() as replacement:
+        assert replacement is not page
+        assert page.closed
+    print("✅ crash 이벤트 후 교체 확인")
+
+    # health check 실패도 교체 대상
+    replacement.broken = True
+    async with pool.page() as third:
+        assert third is not replacement
+    assert pool.stats()["replaced"] == 2
+    print("✅ health check 실패 시 교체 확인")
+
+    await pool.close()
+    print()
+
+
+async def test_release_hook():
+    """반납된 페이지를 on_release로 정리한 뒤 다시 빌려주는지 테스트."""
+    print("=" * 60)
+    print("반납 정리(on_release) 테스트")
+    print("=" * 60)
+
+    recycled = []
+    gate = asyncio.Event()
+
+    async def recycle(page):
+        await gate.wait()
+        recycled.append(page)
+
+    context = FakeContext()
+    pool = PagePool(context, size=1, on_release=recycle)
+
+    page = await pool.acquire()
+    await pool.release(page)
+    assert pool.stats()["releasing"] == 1 and pool.stats()["idle"] == 0
+    print("✅ 반납한 호출은 정리를 기다리지 않음")
+
+    waiter = asyncio.create_task(pool.acquire())
+    await asyncio.sleep(0.05)
+    assert not waiter.done()
+    gate.set()
+    assert await asyncio.wait_for(waiter, timeout=1) is page
+    assert recycled == [page] and len(context.pages) == 1
+    print("✅ 정리가 끝난 뒤 같은 페이지를 다시 빌려줌")
+
+    async def failing(page):
+        raise RuntimeError("navigation failed")
+
+    pool.on_release = failing
+    await pool.release(page)
+    assert await asyncio.wait_for(pool.acquire(), timeout=1) is page
+    print("✅ 정리에 실패해도 페이지는 계속 사용")
+
+    gate.clear()
+    pool.on_release = recycle
+    await pool.release(page)
+    await pool.close()
+    assert page.closed and pool.stats()["releasing"] == 0
+    print("✅ 풀을 닫으면 진행 중인 정리를 취소하고 페이지를 닫음")
+
+    # 정리 도중 취소되고 close()도 실패한 페이지는 한 번만 버림
+    pool = PagePool(FakeContext(), size=1, on_release=recycle)
+    page = await pool.acquire()
+    page.close_fails = True
+    await pool.release(page)
+    await asyncio.sleep(0)
+    await pool.close()
+    assert pool.stats()["created"] == 0 and pool.stats()["replaced"] == 1
+    print("✅ close()에 실패한 페이지도 빈 자리는 한 번만 반환")
+    print()
+
+
+async def main():
+    await test_concurrent_checkout()
+    await test_crashed_page_replaced()
+    await test_release_hook()
+    print("🎉 모든 테스트 통과!")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
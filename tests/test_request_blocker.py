@@ -0,0 +1,158 @@
+"""네트워크 요청 차단 규칙 테스트 (브라우저 없이 가짜 route로 검증)."""
+
+import asyncio
+import sys
+
+sys.path.insert(0, "src")
+
+from naver_blog_mcp.services.request_blocker import RequestBlocker
+from naver_blog_mcp.services.session_manager import SessionManager
+from naver_blog_mcp.utils.metrics import BLOCKED_REQUESTS
+
+
+class FakeFrame:
+    def __init__(self, parent_frame=None):
+        self.parent_frame = parent_frame
+
+
+MAIN_FRAME = FakeFrame()
+CHILD_FRAME = FakeFrame(parent_frame=MAIN_FRAME)
+
+
+class FakeRequest:
+    def __init__(self, url, resource_type="script", frame=MAIN_FRAME):
+        self.url = url
+        self.resource_type = resource_type
+        self.frame = frame
+
+
+class FakeRoute:
+    def __init__(self, url, resource_type="script"):
+        self.request = FakeRequest(url, resource_type)
+        self.result = None
+
+    async def fallback(self):
+        self.result = "fallback"
+
+    async def abort(self, error_code="failed"):
+        self.result = error_code
+
+
+class FakeContext:
+    def __init__(self):
+        self.routes = []
+
+    async def route(self, pattern, handler):
+        self.routes.append((pattern, handler))
+
+
+class FakeBrowser:
+    def __init__(self):
+        self.contexts = []
+
+    async def new_context(self, **kwargs):
+        context = FakeContext()
+        self.contexts.append((context, kwargs))
+        return context
+
+
+def make_blocker():
+    return RequestBlocker(
+        resource_types=["font", "media"],
+        allowed_domains=["naver.com", "pstatic.net"],
+        blocked_hosts=["wcs.naver.com"],
+    )
+
+
+def test_block_reason():
+    """리소스 유형/차단 호스트/허용 도메인 규칙 테스트."""
+    print("=" * 60)
+    print("요청 차단 규칙 테스트")
+    print("=" * 60)
+
+    blocker = make_blocker()
+    reason = lambda url, kind="script", frame=MAIN_FRAME: blocker.block_reason(
+        FakeRequest(url, kind, frame)
+    )
+
+    assert reason("https://blog.naver.com/PostWriteForm.naver", "document", CHILD_FRAME) is None
+    assert reason("https://blog.editor.naver.com/editor.js") is None
+    assert reason("https://ssl.pstatic.net/static/editor.css", "stylesheet") is None
+    print("✅ 허용 도메인(하위 도메인 포함)의 에디터 리소스는 통과")
+
+    assert reason("https://ssl.pstatic.net/static/nanum.woff2", "font") == "resource_type"
+    assert reason("https://blog.naver.com/intro.mp4", "media") == "resource_type"
+    assert reason("https://wcs.naver.com/wcslog.js") == "blocked_host"
+    assert reason("https://pagead2.googlesyndication.com/pagead/show_ads.js") == "domain"
+    assert reason("https://ad.doubleclick.net/ad", "document", CHILD_FRAME) == "domain"
+    print("✅ 웹폰트/미디어, 통계 호스트, 허용 목록 밖(광고 iframe 포함) 차단")
+
+    assert reason("https://nid.example.com/login", "document") is None
+    assert reason("data:image/png;base64,AAAA", "image") is None
+    print("✅ 최상위 페이지 이동과 data: URL은 차단하지 않음")
+
+    assert RequestBlocker(allowed_domains=[]).block_reason(
+        FakeRequest("https://cdn.example.com/lib.js")
+    ) is None
+    print("✅ 허용 도메인이 비어 있으면 도메인으로는 차단하지 않음")
+    print()
+
+
+async def test_handle_and_counters():
+    """차단은 abort, 나머지는 다음 route 핸들러로 넘기고 횟수를 세는지 테스트."""
+    print("=" * 60)
+    print("route 핸들러/차단 횟수 테스트")
+    print("=" * 60)
+
+    blocker = make_blocker()
+    before = BLOCKED_REQUESTS.value(resource_type="script", reason="domain")
+
+    allowed = FakeRoute("https://blog.naver.com/PostList.naver", "document")
+    await blocker.handle(allowed)
+    assert allowed.result == "fallback"
+    print("✅ 허용 요청은 fallback (모의 서버 등 먼저 등록한 핸들러로)")
+
+    for url, kind in [
+        ("https://pagead2.googlesyndication.com/pagead/show_ads.js", "script"),
+        ("https://ssl.pstatic.net/static/nanum.woff2", "font"),
+        ("https://wcs.naver.com/wcslog.js", "script"),
+    ]:
+        route = FakeRoute(url, kind)
+        await blocker.handle(route)
+        assert route.result == "blockedbyclient"
+
+    assert blocker.stats() == {
+        "blocked_requests": 3,
+        "by_resource_type": {"script": 2, "font": 1},
+    }
+    assert BLOCKED_REQUESTS.value(resource_type="script", reason="domain") == before + 1
+    print("✅ 차단 요청 수 (리소스 유형별, 메트릭)")
+    print()
+
+
+async def test_session_manager_installs_blocker():
+    """SessionManager가 만드는 컨텍스트에 차단 규칙이 붙는지 테스트."""
+    print("=" * 60)
+    print("세션 컨텍스트 차단 규칙 적용 테스트")
+    print("=" * 60)
+
+    blocker = make_blocker()
+    browser = FakeBrowser()
+
+    manager = SessionManager("user", "pw", request_blocker=blocker)
+    context = await manager._new_context(browser, storage_state="auth.json")
+    assert context.routes == [("**/*", blocker.handle)]
+    assert browser.contexts[0][1] == {"storage_state": "auth.json"}
+    print("✅ 새 컨텍스트에 route 등록")
+
+    plain = await SessionManager("user", "pw")._new_context(browser)
+    assert plain.routes == []
+    print("✅ 차단 규칙이 없으면 route를 등록하지 않음 (HTTP 캐시 유지)")
+    print()
+
+
+if __name__ == "__main__":
+    test_block_reason()
+    asyncio.run(test_handle_and_counters())
+    asyncio.run(test_session_manager_installs_blocker())
+    print("🎉 모든 테스트 통과!")
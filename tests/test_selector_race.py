@@ -0,0 +1,202 @@
+"""대체 셀렉터 일괄 검사 테스트 (브라우저 없이 가짜 Frame으로 검증)."""
+
+import asyncio
+import sys
+
+sys.path.insert(0, "src")
+
+from naver_blog_mcp.config import config
+from naver_blog_mcp.utils.selector_helper import (
+    count_selectors,
+    find_element_with_alternatives,
+    matching_selectors,
+    parse_selector,
+    race_selectors,
+)
+from naver_blog_mcp.utils.exceptions import ElementNotFoundError
+
+# 가짜 Frame 결과를 실제 셀렉터 통계 파일에 기록하지 않음
+config.SELECTOR_STATS_ENABLED = False
+
+
+class FakeLocator:
+    def __init__(self, scope, selector):
+        self.scope = scope
+        self.selector = selector
+
+    @property
+    def first(self):
+        return self
+
+    async def count(self):
+        self.scope.round_trips += 1
+        return self.scope.elements.get(self.selector, 0) + self.scope.shadow.get(self.selector, 0)
+
+
+class FakeFrame:
+    """셀렉터별 요소 개수를 정해 둔 가짜 Frame (브라우저 왕복 횟수 기록)."""
+
+    def __init__(self, elements, evaluate_fails=False, shadow=None):
+        self.elements = elements
+        # 열린 shadow root 안의 요소 (locator에만 보이고 일괄 검사에는 안 보임)
+        self.shadow = shadow or {}
+        self.evaluate_fails = evaluate_fails
+        self.round_trips = 0
+        self.probed = []
+
+    def locator(self, selector):
+        return FakeLocator(self, selector)
+
+    async def evaluate(self, script, specs):
+        self.round_trips += 1
+        if self.evaluate_fails:
+            raise RuntimeError("Execution context was destroyed")
+        self.probed = specs
+        counts = []
+        for spec in specs:
+            if spec is None:
+                counts.append(None)
+                continue
+            selector = next(
+                (sel for sel in self.elements if parse_selector(sel) == spec), None
+            )
+            counts.append(self.elements.get(selector, 0))
+        return counts
+
+
+TITLE_SELECTORS = [
+    "div[contenteditable='true'][data-placeholder='제목']",
+    "div[contenteditable='true']:has-text('제목')",
+    "input[placeholder*='제목']",
+    "#title",
+]
+
+
+def test_parse_selector():
+    """Playwright 셀렉터 → 페이지 내 검사 형태 변환 테스트."""
+    print("=" * 60)
+    print("셀렉터 변환 테스트")
+    print("=" * 60)
+
+    assert parse_selector("#title") == {"css": "#title", "text": None, "visible": False}
+    assert parse_selector("button:has-text('발행'):visible") == {
+        "css": "button",
+        "text": "발행",
+        "visible": True,
+    }
+    assert parse_selector('div.publish_area button:has-text("글쓰기")') == {
+        "css": "div.publish_area button",
+        "text": "글쓰기",
+        "visible": False,
+    }
+    print("✅ CSS + 끝에 붙은 :has-text / :visible")
+
+    for selector in (
+        "text=발행",
+        "button:has-text('a'):has-text('b')",
+        "div:has-text('a') > button",
+        "#frame >> button",
+    ):
+        assert parse_selector(selector) is None, selector
+    print("✅ 페이지 안에서 해석할 수 없는 문법은 None")
+    print()
+
+
+async def test_race_single_round_trip():
+    """셀렉터 여러 개를 한 번의 왕복으로 검사하는지 테스트."""
+    print("=" * 60)
+    print("일괄 검사 테스트")
+    print("=" * 60)
+
+    frame = FakeFrame({"#title": 1})
+    assert await race_selectors(frame, TITLE_SELECTORS) == "#title"
+    assert frame.round_trips == 1 and len(frame.probed) == 4
+    print("✅ 네 번째 셀렉터가 맞아도 왕복 1회")
+
+    frame = FakeFrame({"#title": 1, "input[placeholder*='제목']": 2})
+    assert await race_selectors(frame, TITLE_SELECTORS) == "input[placeholder*='제목']"
+    print("✅ 여러 개가 맞으면 리스트 앞쪽 우선")
+
+    frame = FakeFrame({})
+    assert await race_selectors(frame, TITLE_SELECTORS) is None
+    assert await race_selectors(frame, "#title") is None
+    print("✅ 맞는 셀렉터가 없으면 None")
+
+    frame = FakeFrame({"#a": 1, "#c": 3})
+    assert [sel async for sel in matching_selectors(frame, ["#a", "#b", "#c"])] == ["#a", "#c"]
+    assert await count_selectors(frame, ["#a", "#b", "#c"]) == [1, 0, 3]
+    print("✅ 요소가 있는 셀렉터를 순서대로 / 셀렉터별 개수")
+    print()
+
+
+async def test_fallbacks():
+    """해석할 수 없는 셀렉터와 evaluate 실패 시 locator.count() 대체 테스트."""
+    print("=" * 60)
+    print("순차 검사 대체 테스트")
+    print("=" * 60)
+
+    frame = FakeFrame({"text=발행": 1, "#late": 1})
+    assert await race_selectors(frame, ["#missing", "text=발행", "#late"]) == "text=발행"
+    assert frame.probed[1] is None and frame.round_trips == 2
+    print("✅ 해석할 수 없는 셀렉터는 그 차례에만 locator.count()")
+
+    frame = FakeFrame({"#b": 1}, evaluate_fails=True)
+    assert await race_selectors(frame, ["#a", "#b", "#c"]) == "#b"
+    assert frame.round_trips == 3
+    print("✅ evaluate가 실패하면 기존처럼 순차 검사")
+
+    frame = FakeFrame({"#b": 1})
+    assert (await find_element_with_alternatives(frame, ["#a", "#b"])).selector == "#b"
+    assert frame.round_trips == 1
+    try:
+        await find_element_with_alternatives(frame, ["#x"], timeout=0, context="test")
+        raise AssertionError("ElementNotFoundError expected")
+    except ElementNotFoundError:
+        pass
+    print("✅ find_element_with_alternatives도 일괄 검사 사용")
+    print()
+
+
+async def test_find_element_waits():
+    """find_element_with_alternatives의 timeout 대기와 shadow DOM 재확인 테스트."""
+    print("=" * 60)
+    print("요소 대기 테스트")
+    print("=" * 60)
+
+    frame = FakeFrame({})
+
+    async def render_later():
+        await asyncio.sleep(0.15)
+        frame.elements["#late"] = 1
+
+    renderer = asyncio.create_task(render_later())
+    locator = await find_element_with_alternatives(frame, ["#early", "#late"], timeout=1000)
+    await renderer
+    assert locator.selector == "#late"
+    print("✅ timeout 안에 나타난 요소를 다시 검사해 찾음")
+
+    frame = FakeFrame({})
+    loop = asyncio.get_running_loop()
+    started = loop.time()
+    try:
+        await find_element_with_alternatives(frame, ["#a", "#b"], timeout=200)
+        raise AssertionError("ElementNotFoundError expected")
+    except ElementNotFoundError:
+        pass
+    assert 0.2 <= loop.time() - started < 0.5
+    print("✅ 끝까지 없으면 timeout 후 실패")
+
+    frame = FakeFrame({}, shadow={"#in-shadow": 1})
+    assert await race_selectors(frame, ["#in-shadow"]) is None
+    locator = await find_element_with_alternatives(frame, ["#a", "#in-shadow"], timeout=0)
+    assert locator.selector == "#in-shadow"
+    print("✅ 일괄 검사가 못 보는 shadow DOM 요소는 locator로 재확인")
+    print()
+
+
+if __name__ == "__main__":
+    test_parse_selector()
+    asyncio.run(test_race_single_round_trip())
+    asyncio.run(test_fallbacks())
+    asyncio.run(test_find_element_waits())
+    print("🎉 모든 테스트 통과!")
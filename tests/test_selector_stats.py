@@ -0,0 +1,125 @@
+"""셀렉터 적중 통계/순위 테스트 (브라우저 불필요)."""
+
+import asyncio
+import sys
+import tempfile
+from pathlib import Path
+
+sys.path.insert(0, "src")
+
+from naver_blog_mcp.utils import selector_helper
+from naver_blog_mcp.utils.selector_helper import matching_selectors, parse_selector
+from naver_blog_mcp.utils.selector_stats import SelectorStats
+
+SELECTORS = ["#old", ".fallback", "#new"]
+
+
+class FakeFrame:
+    """셀렉터별 요소 개수를 정해 둔 가짜 Frame."""
+
+    def __init__(self, elements):
+        self.elements = elements
+        self.probed = []
+
+    async def evaluate(self, script, specs):
+        self.probed = [spec["css"] for spec in specs]
+        return [
+            next((count for sel, count in self.elements.items() if parse_selector(sel) == spec), 0)
+            for spec in specs
+        ]
+
+
+def test_ranking():
+    """연속으로 빗나간 셀렉터를 뒤로 미루고 다시 맞으면 되돌리는지 테스트."""
+    print("=" * 60)
+    print("셀렉터 순위 테스트")
+    print("=" * 60)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        stats = SelectorStats(str(Path(tmp) / "stats.json"), demote_after=3, save_interval=0)
+
+        assert stats.rank("title", SELECTORS) == SELECTORS
+        print("✅ 통계가 없으면 원래 순서")
+
+        # 네이버 UI가 바뀌어 #new만 맞음
+        for _ in range(2):
+            stats.record("title", {"#old": 0, ".fallback": 0, "#new": 1})
+        assert stats.rank("title", SELECTORS) == SELECTORS
+        stats.record("title", {"#old": 0, ".fallback": 0, "#new": 1})
+        assert stats.rank("title", SELECTORS) == ["#new", "#old", ".fallback"]
+        print("✅ 3번 연속 빗나간 셀렉터는 뒤로")
+
+        stats.record("title", {"#old": 0, ".fallback": 0, "#new": 0})
+        stats.record("popup", {"#a": 0, "#b": 0})
+        assert stats.rank("title", SELECTORS) == ["#new", "#old", ".fallback"]
+        assert "popup" not in stats.report()["keys"]
+        print("✅ 요소가 아예 없으면 기록하지 않음")
+
+        dead = stats.dead_selectors()["title"]
+        assert [item["selector"] for item in dead] == ["#old", ".fallback"]
+        assert dead[0]["hits"] == 0 and dead[0]["consecutive_misses"] == 3
+        print("✅ 죽은 셀렉터 보고")
+
+        stats.record("title", {".fallback": 1, "#new": 1})
+        assert stats.rank("title", SELECTORS) == [".fallback", "#new", "#old"]
+        print("✅ 다시 맞기 시작하면 원래 자리로")
+
+        reloaded = SelectorStats(str(Path(tmp) / "stats.json"), demote_after=3)
+        assert reloaded.rank("title", SELECTORS) == [".fallback", "#new", "#old"]
+        print("✅ 파일에 저장된 통계로 다시 시작")
+    print()
+
+
+def test_flush():
+    """기록 간격 안의 변경은 flush()로 저장되는지 테스트."""
+    print("=" * 60)
+    print("통계 저장 간격 테스트")
+    print("=" * 60)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        path = Path(tmp) / "stats.json"
+        stats = SelectorStats(str(path), save_interval=3600)
+        stats.record("k", {"#a": 1, "#b": 0})
+        stats.record("k", {"#a": 1, "#b": 0})
+        assert SelectorStats(str(path)).report()["keys"]["k"]["#a"]["hits"] == 1
+        stats.flush()
+        assert SelectorStats(str(path)).report()["keys"]["k"]["#a"]["hits"] == 2
+        print("✅ 간격 안의 변경은 flush() 때 기록")
+    print()
+
+
+async def test_matching_selectors_uses_stats():
+    """matching_selectors가 통계 순서로 검사하고 결과를 기록하는지 테스트."""
+    print("=" * 60)
+    print("일괄 검사 + 통계 연동 테스트")
+    print("=" * 60)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        stats = SelectorStats(str(Path(tmp) / "stats.json"), demote_after=2, save_interval=0)
+        original = selector_helper.selector_stats
+        selector_helper.selector_stats = stats
+        try:
+            frame = FakeFrame({"#new": 1})
+            for _ in range(2):
+                assert [sel async for sel in matching_selectors(frame, SELECTORS, "title")] == ["#new"]
+            assert frame.probed == SELECTORS
+
+            # 예전 셀렉터가 다시 생겨도 지금 동작하는 셀렉터가 먼저
+            frame = FakeFrame({"#old": 1, "#new": 1})
+            assert [sel async for sel in matching_selectors(frame, SELECTORS, "title")] == ["#new", "#old"]
+            assert frame.probed == ["#new", "#old", ".fallback"]
+            print("✅ 최근 동작한 셀렉터부터 검사")
+
+            await selector_helper.race_selectors(frame, SELECTORS)
+            assert set(stats.report()["keys"]) == {"title"}
+            print("✅ context가 없으면 통계에 기록하지 않음")
+        finally:
+            selector_helper.selector_stats = original
+    print()
+
+
+if __name__ == "__main__":
+    test_ranking()
+    test_flush()
+    asyncio.run(test_matching_selectors_uses_stats())
+    print("🎉 모든 테스트 통과!")
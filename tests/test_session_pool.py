@@ -0,0 +1,152 @@
+"""계정별 세션 풀 테스트 (브라우저 없이 가짜 컨텍스트로 검증)."""
+
+import asyncio
+import sys
+
+sys.path.insert(0, "src")
+
+from naver_blog_mcp.services.session_pool import SessionPool, parse_accounts
+
+
+class FakePage:
+    def __init__(self):
+        self.closed = False
+
+    def on(self, event, handler):
+        pass
+
+    def is_closed(self):
+        return self.closed
+
+    async def evaluate(self, expression):
+        return True
+
+    async def close(self):
+        self.closed = True
+
+
+class FakeContext:
+    def __init__(self, account):
+        self.account = account
+        self.closed = False
+
+    async def new_page(self):
+        return FakePage()
+
+    async def close(self):
+        self.closed = True
+
+
+def make_pool(logins: list) -> SessionPool:
+    """로그인 대신 가짜 컨텍스트를 만들어 주는 세션 풀."""
+    pool = SessionPool(browser=None, default_account="main", storage_dir="/tmp/state")
+    pool.add_account("main", "pw", storage_path="/tmp/state/auth.json")
+    pool.add_account("sub", "pw2")
+
+    for account in pool.accounts:
+        async def fake_login(browser, headless=True, account=account):
+            await asyncio.sleep(0.01)
+            logins.append(account)
+            return FakeContext(account)
+
+        pool.session_manager(account).get_or_create_session = fake_login
+    return pool
+
+
+def test_parse_accounts():
+    """계정 문자열 해석 테스트."""
+    print("=" * 60)
+    print("계정 목록 해석 테스트")
+    print("=" * 60)
+
+    assert parse_accounts("") == {}
+    assert parse_accounts("a:pw1, b:p:w2") == {"a": "pw1", "b": "p:w2"}
+    try:
+        parse_accounts("broken")
+        raise AssertionError("ValueError expected")
+    except ValueError:
+        pass
+    print("✅ 아이디:비밀번호 해석 (비밀번호의 ':' 허용)")
+    print()
+
+
+async def test_lazy_context_per_account():
+    """계정별 컨텍스트를 처음 사용할 때 한 번만 만드는지 테스트."""
+    print("=" * 60)
+    print("계정별 컨텍스트 지연 생성 테스트")
+    print("=" * 60)
+
+    logins = []
+    pool = make_pool(logins)
+
+    assert pool.session_manager("sub").storage_path == "/tmp/state/auth-sub.json"
+    assert pool.active_context("sub") is None
+    print("✅ 계정별 storage state 경로, 사용 전에는 컨텍스트 없음")
+
+    # 같은 계정을 동시에 요청해도 로그인은 한 번
+    contexts = await asyncio.gather(*(pool.get_context("sub") for _ in range(3)))
+    assert logins == ["sub"]
+    assert all(c is contexts[0] for c in contexts)
+
+    main = await pool.get_context()
+    assert main.account == "main" and logins == ["sub", "main"]
+    print("✅ 동시 요청에도 계정당 로그인 1회, account 생략 시 기본 계정")
+
+    async with pool.page("sub") as page:
+        assert isinstance(page, FakePage)
+    assert pool.stats()["sub"]["pages"]["idle"] == 1
+
+    try:
+        await pool.get_context("unknown")
+        raise AssertionError("ValueError expected")
+    except ValueError:
+        pass
+    print("✅ 계정별 페이지 풀, 미등록 계정 거부")
+
+    await pool.close()
+    assert contexts[0].closed and main.closed
+    print()
+
+
+async def test_refresh_swaps_context():
+    """만료된 세션을 새 컨텍스트로 교체하고, 진행 중인 호출이 끝난 뒤 닫는지 테스트."""
+    print("=" * 60)
+    print("세션 갱신 컨텍스트 교체 테스트")
+    print("=" * 60)
+
+    logins = []
+    pool = make_pool(logins)
+    manager = pool.session_manager()
+
+    async def still_valid(browser, context, headless=True):
+        return context
+
+    async def expired(browser, context, headless=True):
+        return FakeContext("main-relogin")
+
+    old_context = await pool.get_context()
+    manager.refresh_session_if_needed = still_valid
+    assert await pool.refresh_all() == {"main": False}
+    print("✅ 유효한 세션은 그대로 유지")
+
+    manager.refresh_session_if_needed = expired
+    async with pool.page() as in_flight:
+        refresh = asyncio.create_task(pool.refresh_account())
+        await asyncio.sleep(0.05)
+
+        # 교체는 즉시, 이전 컨텍스트는 진행 중인 호출이 끝날 때까지 유지
+        assert (await pool.get_context()).account == "main-relogin"
+        assert not old_context.closed and not in_flight.closed
+    assert await asyncio.wait_for(refresh, timeout=1) is True
+    assert old_context.closed
+    print("✅ 새 컨텍스트로 즉시 교체, 진행 중인 호출 종료 후 이전 컨텍스트 닫음")
+
+    await pool.close()
+    print()
+
+
+if __name__ == "__main__":
+    test_parse_accounts()
+    asyncio.run(test_lazy_context_per_account())
+    asyncio.run(test_refresh_swaps_context())
+    print("🎉 모든 테스트 통과!")
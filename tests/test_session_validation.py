@@ -0,0 +1,109 @@
+"""쿠키 기반 세션 검증 테스트 (브라우저 없이 가짜 컨텍스트로 검증)."""
+
+import asyncio
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+sys.path.insert(0, "src")
+
+from naver_blog_mcp.automation.login import check_auth_cookies
+from naver_blog_mcp.services.session_manager import SessionManager
+
+
+def cookie(name, expires):
+    return {"name": name, "value": "x", "domain": ".naver.com", "expires": expires}
+
+
+class FakeResponse:
+    def __init__(self, status, location=""):
+        self.status = status
+        self.ok = 200 <= status < 300
+        self.url = "https://blog.naver.com/MyBlog.naver"
+        self.headers = {"location": location}
+
+    async def dispose(self):
+        pass
+
+
+class FakeRequest:
+    def __init__(self, response):
+        self.response = response
+        self.calls = 0
+
+    async def get(self, url, **kwargs):
+        self.calls += 1
+        return self.response
+
+
+class FakeContext:
+    def __init__(self, cookies, response=None):
+        self._cookies = cookies
+        self.request = FakeRequest(response or FakeResponse(500))
+        self.pages_opened = 0
+
+    async def cookies(self):
+        return self._cookies
+
+    async def new_page(self):
+        self.pages_opened += 1
+        raise RuntimeError("page navigation should not be needed")
+
+
+def test_check_auth_cookies():
+    """인증 쿠키 존재/만료 판단 테스트."""
+    print("=" * 60)
+    print("인증 쿠키 판단 테스트")
+    print("=" * 60)
+
+    now = time.time()
+    assert check_auth_cookies([], now=now) is False
+    assert check_auth_cookies([cookie("NID_AUT", now + 3600)], now=now) is False
+    print("✅ 인증 쿠키가 없으면 무효")
+
+    valid = [cookie("NID_AUT", now + 3600), cookie("NID_SES", now + 3600)]
+    assert check_auth_cookies(valid, now=now) is True
+    expiring = [cookie("NID_AUT", now + 60), cookie("NID_SES", now + 3600)]
+    assert check_auth_cookies(expiring, now=now) is False
+    print("✅ 만료 시각 확인 (곧 만료되는 쿠키는 무효)")
+
+    session_cookie = [cookie("NID_AUT", now + 3600), cookie("NID_SES", -1)]
+    assert check_auth_cookies(session_cookie, now=now) is None
+    print("✅ 만료 시각 없는 세션 쿠키는 판단 보류")
+    print()
+
+
+async def test_validation_tiers():
+    """쿠키로 판단되면 요청 없이, 보류면 HTTP 확인만 하는지 테스트."""
+    print("=" * 60)
+    print("단계별 세션 검증 테스트")
+    print("=" * 60)
+
+    now = time.time()
+    with tempfile.TemporaryDirectory() as tmp:
+        storage_path = Path(tmp) / "auth.json"
+        storage_path.write_text("{}")
+        manager = SessionManager("user", "pw", storage_path=str(storage_path))
+
+        context = FakeContext([cookie("NID_AUT", now + 3600), cookie("NID_SES", now + 3600)])
+        assert await manager.is_session_valid(context) is True
+        assert context.request.calls == 0 and context.pages_opened == 0
+        print("✅ 쿠키만으로 판단 (네트워크 요청 없음)")
+
+        session_cookies = [cookie("NID_AUT", now + 3600), cookie("NID_SES", -1)]
+        context = FakeContext(session_cookies, FakeResponse(302, "https://blog.naver.com/user"))
+        assert await manager.is_session_valid(context) is True
+        context = FakeContext(
+            session_cookies, FakeResponse(302, "https://nid.naver.com/nidlogin.login")
+        )
+        assert await manager.is_session_valid(context) is False
+        assert context.request.calls == 1 and context.pages_opened == 0
+        print("✅ 판단 보류 시 HTTP 리다이렉트로 확인 (페이지 열지 않음)")
+    print()
+
+
+if __name__ == "__main__":
+    test_check_auth_cookies()
+    asyncio.run(test_validation_tiers())
+    print("🎉 모든 테스트 통과!")
@@ -0,0 +1,121 @@
+"""단계별 span 기록 및 히스토그램 테스트 (브라우저 불필요)."""
+
+import asyncio
+import json
+import logging
+import sys
+
+sys.path.insert(0, "src")
+
+from naver_blog_mcp.utils.metrics import Histogram, STEP_DURATION, registry
+from naver_blog_mcp.utils.timing import current_recorder, recording, span, traced
+
+
+@traced("publish")
+async def fake_publish(fail: bool = False) -> dict:
+    with span("publish.dialog"):
+        await asyncio.sleep(0.01)
+    if fail:
+        raise RuntimeError("boom")
+    return {"success": True}
+
+
+def test_histogram_render():
+    """Prometheus 텍스트 형식 출력 테스트."""
+    print("=" * 60)
+    print("히스토그램 출력 테스트")
+    print("=" * 60)
+
+    histogram = Histogram("test_seconds", "Test", label_names=("step",), buckets=(0.1, 1))
+    histogram.observe(0.05, step="a")
+    histogram.observe(0.5, step="a")
+    histogram.observe(5, step="a")
+
+    lines = histogram.render()
+    assert 'test_seconds_bucket{step="a",le="0.1"} 1' in lines
+    assert 'test_seconds_bucket{step="a",le="1"} 2' in lines
+    assert 'test_seconds_bucket{step="a",le="+Inf"} 3' in lines
+    assert 'test_seconds_count{step="a"} 3' in lines
+    assert histogram.snapshot(step="a")["sum"] == 5.55
+    print("✅ 누적 버킷, +Inf, sum/count")
+
+    try:
+        histogram.observe(1, other="x")
+        raise AssertionError("ValueError expected")
+    except ValueError:
+        pass
+    print("✅ 레이블 불일치 거부")
+    print()
+
+
+async def test_spans_recorded():
+    """중첩 span, 실패 상태, JSON 로그, 히스토그램 누적 테스트."""
+    print("=" * 60)
+    print("span 기록 테스트")
+    print("=" * 60)
+
+    STEP_DURATION.clear()
+    records = []
+    handler = logging.Handler()
+    handler.emit = lambda record: records.append(record.getMessage())
+    timing_logger = logging.getLogger("naver_blog_mcp.utils.timing")
+    timing_logger.setLevel(logging.INFO)
+    timing_logger.addHandler(handler)
+
+    with recording("create_post", request_id="r1") as recorder:
+        await fake_publish()
+        try:
+            await fake_publish(fail=True)
+        except RuntimeError:
+            pass
+    assert current_recorder() is None
+
+    spans = recorder.report()["spans"]
+    assert [s["name"] for s in spans] == ["publish", "publish.dialog"] * 2
+    assert spans[1]["parent"] == "publish" and spans[0]["parent"] is None
+    assert [s["status"] for s in spans if s["name"] == "publish"] == ["ok", "error"]
+    print("✅ 부모 span, 실패 상태 기록")
+
+    logged = json.loads(records[-1])
+    assert logged["event"] == "spans" and logged["request_id"] == "r1"
+    assert len(logged["spans"]) == 4
+    print("✅ 한 줄 JSON 로그")
+
+    assert STEP_DURATION.snapshot(step="publish", status="ok")["count"] == 1
+    assert STEP_DURATION.snapshot(step="publish", status="error")["count"] == 1
+    assert 'naver_blog_step_duration_seconds_count{step="publish.dialog",status="ok"} 2' in registry.render()
+    print("✅ 단계별 히스토그램 누적")
+
+    # 바깥에서 이미 기록 중이면 합쳐지고 로그는 한 번
+    records.clear()
+    with recording("tool") as outer:
+        with recording("create_post") as inner:
+            await fake_publish()
+    assert inner is outer and len(records) == 1
+    print("✅ 중첩 recording은 바깥 기록기 사용")
+    print()
+
+
+async def test_concurrent_recorders_isolated():
+    """동시에 실행되는 Tool 호출의 span이 섞이지 않는지 테스트."""
+    print("=" * 60)
+    print("동시 호출 span 분리 테스트")
+    print("=" * 60)
+
+    async def call(request_id: str, times: int):
+        with recording("create_post", request_id=request_id) as recorder:
+            for _ in range(times):
+                await fake_publish()
+        return recorder
+
+    first, second = await asyncio.gather(call("a", 1), call("b", 3))
+    assert len(first.spans) == 2 and len(second.spans) == 6
+    print("✅ 호출(Task)별로 span 분리")
+    print()
+
+
+if __name__ == "__main__":
+    test_histogram_render()
+    asyncio.run(test_spans_recorded())
+    asyncio.run(test_concurrent_recorders_isolated())
+    print("🎉 모든 테스트 통과!")
@@ -0,0 +1,176 @@
+"""TraceManager 녹화 모드/보존 정책 테스트 (브라우저 없이 가짜 컨텍스트로 검증)."""
+
+import asyncio
+import os
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+sys.path.insert(0, "src")
+
+from naver_blog_mcp.utils.trace_manager import TraceManager
+
+
+class FakeTracing:
+    """Playwright처럼 chunk를 하나만 열 수 있는 가짜 tracing."""
+
+    def __init__(self, size=1000):
+        self.size = size
+        self.started = 0
+        self.chunks = 0
+        self.chunk_open = False
+
+    async def start(self, **kwargs):
+        assert self.started == 0, "tracing.start() called twice"
+        self.started += 1
+        await self.start_chunk()
+
+    async def start_chunk(self, **kwargs):
+        assert not self.chunk_open, "chunk already open"
+        self.chunk_open = True
+        self.chunks += 1
+
+    async def stop_chunk(self, path=None):
+        assert self.chunk_open
+        self.chunk_open = False
+        if path:
+            Path(path).write_bytes(b"x" * self.size)
+
+
+class FakeContext:
+    def __init__(self, size=1000):
+        self.tracing = FakeTracing(size)
+
+
+async def run_call(manager, context, name, success, delay=0.0):
+    async with manager.trace(context, name=name) as scope:
+        await asyncio.sleep(delay)
+        scope.success = success
+    return scope.path
+
+
+async def test_modes():
+    """모드별 녹화/저장 여부 테스트."""
+    print("=" * 60)
+    print("Trace 모드 테스트")
+    print("=" * 60)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        # tracing 상태는 컨텍스트별이므로 모드마다 새 컨텍스트 사용
+        context = FakeContext()
+        off = TraceManager(traces_dir=tmp, mode="off")
+        assert await run_call(off, context, "call", success=False) is None
+        assert context.tracing.started == 0
+        print("✅ off: 녹화하지 않음")
+
+        context = FakeContext()
+        on_failure = TraceManager(traces_dir=tmp, mode="on_failure")
+        assert await run_call(on_failure, context, "ok", success=True) is None
+        assert await run_call(on_failure, context, "bad", success=False) is not None
+        stats = on_failure.stats()
+        assert stats["traced"] == 2 and stats["saved"] == 1 and stats["discarded"] == 1
+        print("✅ on_failure: 성공한 호출은 버리고 실패만 저장")
+
+        context = FakeContext()
+        sampled = TraceManager(traces_dir=tmp, mode="sampled", sample_rate=0.0)
+        await run_call(sampled, context, "call", success=False)
+        assert sampled.stats()["traced"] == 0 and sampled.stats()["calls"] == 1
+        sampled.sample_rate = 1.0
+        assert await run_call(sampled, context, "call", success=True) is not None
+        print("✅ sampled: 비율만큼만 녹화")
+
+        context = FakeContext()
+        full = TraceManager(traces_dir=tmp, mode="full")
+        assert await run_call(full, context, "call", success=True) is not None
+        assert full.stats()["bytes_written"] == 1000
+        print(f"✅ full: 전부 저장, 지표 {full.stats()}")
+    print()
+
+
+async def test_concurrent_scopes():
+    """같은 컨텍스트에서 겹친 호출이 서로의 Trace를 덮어쓰지 않는지 테스트."""
+    print("=" * 60)
+    print("동시 호출 Trace 스코프 테스트")
+    print("=" * 60)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        manager = TraceManager(traces_dir=tmp, mode="on_failure")
+        context = FakeContext()
+
+        async def call(name, success, delay):
+            async with manager.trace(context, name=name) as scope:
+                await asyncio.sleep(delay)
+                scope.success = success
+            return scope
+
+        ok, failed = await asyncio.gather(
+            call("ok", success=True, delay=0.05),
+            call("bad", success=False, delay=0.01),
+        )
+        # 겹친 두 호출은 chunk 하나를 공유하고, 실패가 있으므로 마지막 호출이 끝날 때 저장됨
+        assert ok.path == failed.path and ok.path is not None
+        assert ok.request_id in ok.path and failed.request_id in ok.path
+        assert context.tracing.started == 1 and context.tracing.chunks == 1
+        assert manager.stats()["traced"] == 2 and manager.stats()["saved"] == 1
+        print("✅ 겹친 호출은 chunk 공유, 둘 다 기록됨")
+
+        # request_id가 같은 겹친 스코프도 따로 세어 마지막이 끝날 때까지 chunk 유지
+        async def same_id(delay, success):
+            async with manager.trace(context, name="dup", request_id="req") as scope:
+                await asyncio.sleep(delay)
+                assert context.tracing.chunk_open, "chunk closed while a scope is running"
+                scope.success = success
+            return scope
+
+        first, last = await asyncio.gather(same_id(0.01, True), same_id(0.05, False))
+        assert first.path == last.path and last.path is not None
+        assert context.tracing.chunks == 2 and manager.active_scopes(context) == 0
+        print("✅ request_id가 같아도 스코프별로 참여 관리")
+
+        # 이후 호출은 tracing.start() 없이 새 chunk로
+        assert await run_call(manager, context, "next", success=True) is None
+        assert context.tracing.started == 1 and context.tracing.chunks == 3
+        assert manager.active_scopes(context) == 0
+        print("✅ 호출마다 새 chunk (tracing.start는 컨텍스트당 1회)")
+
+        # 예외는 실패로 기록
+        try:
+            async with manager.trace(context, name="boom") as scope:
+                raise RuntimeError("boom")
+        except RuntimeError:
+            pass
+        assert scope.success is False and scope.path is not None
+        print("✅ 블록 예외는 실패로 저장")
+    print()
+
+
+async def test_retention():
+    """디렉토리 크기 제한 테스트."""
+    print("=" * 60)
+    print("Trace 보존 정책 테스트")
+    print("=" * 60)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        # 오래된 Trace 3개 (각 1000B)
+        for i in range(3):
+            old = Path(tmp) / f"old{i}.zip"
+            old.write_bytes(b"x" * 1000)
+            mtime = time.time() - 100 + i
+            os.utime(old, (mtime, mtime))
+
+        manager = TraceManager(traces_dir=tmp, mode="full", max_dir_bytes=2500)
+        saved = await run_call(manager, FakeContext(), "new", success=True)
+
+        remaining = sorted(p.name for p in Path(tmp).glob("*.zip"))
+        assert remaining == sorted([Path(saved).name, "old2.zip"]), remaining
+        assert manager.stats()["pruned"] == 2
+        print(f"✅ 오래된 파일부터 삭제: {remaining}")
+    print()
+
+
+if __name__ == "__main__":
+    asyncio.run(test_modes())
+    asyncio.run(test_concurrent_scopes())
+    asyncio.run(test_retention())
+    print("🎉 모든 테스트 통과!")
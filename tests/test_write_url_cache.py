@@ -0,0 +1,124 @@
+"""글쓰기 URL 캐시 테스트 (브라우저 없이 가짜 페이지로 검증)."""
+
+import asyncio
+import sys
+
+sys.path.insert(0, "src")
+
+from naver_blog_mcp.automation import post_actions
+from naver_blog_mcp.config import config
+from naver_blog_mcp.automation.post_actions import (
+    _extract_blog_id,
+    get_cached_write_target,
+    navigate_to_post_write_page,
+)
+
+# 가짜 페이지 결과를 실제 셀렉터 통계 파일에 기록하지 않음
+config.SELECTOR_STATS_ENABLED = False
+
+
+class FakeLocator:
+    def __init__(self, page, selector):
+        self.page = page
+        self.selector = selector
+
+    @property
+    def first(self):
+        return self
+
+    async def count(self):
+        on_main = self.page.url == "https://blog.naver.com"
+        return 1 if on_main and "postwrite" in self.selector else 0
+
+    async def get_attribute(self, name):
+        return "/myblog/postwrite"
+
+
+class FakeContext:
+    pass
+
+
+class FakePage:
+    """goto 기록과 리다이렉트만 흉내내는 가짜 페이지."""
+
+    def __init__(self, context, redirects=None):
+        self.context = context
+        self.url = "about:blank"
+        self.visited = []
+        self.redirects = redirects or {}
+
+    async def goto(self, url, **kwargs):
+        self.visited.append(url)
+        self.url = self.redirects.get(url, url)
+
+    async def wait_for_selector(self, selector, **kwargs):
+        pass
+
+    def locator(self, selector):
+        return FakeLocator(self, selector)
+
+
+async def no_wait(page, timeout=0):
+    pass
+
+
+def test_extract_blog_id():
+    """URL 형식별 blog_id 추출 테스트."""
+    print("=" * 60)
+    print("blog_id 추출 테스트")
+    print("=" * 60)
+
+    assert _extract_blog_id("https://blog.naver.com/myblog/postwrite") == "myblog"
+    assert _extract_blog_id("https://blog.naver.com/myblog?Redirect=Write") == "myblog"
+    assert _extract_blog_id("https://blog.naver.com/PostWriteForm.naver?blogId=abc") == "abc"
+    assert _extract_blog_id("https://blog.naver.com/postwrite") is None
+    print("✅ 경로/쿼리에서 blog_id 추출")
+    print()
+
+
+async def test_write_url_cached_per_session():
+    """두 번째 글부터 블로그 메인을 거치지 않고, 어긋나면 다시 찾는지 테스트."""
+    print("=" * 60)
+    print("글쓰기 URL 캐시 테스트")
+    print("=" * 60)
+
+    post_actions.wait_for_editor_ready = no_wait
+    context = FakeContext()
+
+    page = FakePage(context)
+    await navigate_to_post_write_page(page)
+    assert page.visited == ["https://blog.naver.com", "https://blog.naver.com/myblog/postwrite"]
+    assert get_cached_write_target(context)["blog_id"] == "myblog"
+
+    page = FakePage(context)
+    await navigate_to_post_write_page(page)
+    assert page.visited == ["https://blog.naver.com/myblog/postwrite"]
+    print("✅ 두 번째부터 블로그 메인 로딩 생략")
+
+    # 다른 세션(컨텍스트)은 따로 찾음
+    other = FakePage(FakeContext())
+    await navigate_to_post_write_page(other)
+    assert other.visited[0] == "https://blog.naver.com"
+    print("✅ 세션별 캐시")
+
+    # 캐시된 URL이 엉뚱한 곳으로 가면 캐시를 버리고 다시 찾음
+    page = FakePage(context, redirects={
+        "https://blog.naver.com/myblog/postwrite": "https://blog.naver.com/myblog/PostList.naver",
+    })
+    try:
+        await navigate_to_post_write_page(page)
+        raise AssertionError("NaverBlogPostError expected")
+    except post_actions.NaverBlogPostError:
+        pass
+    assert page.visited[:2] == [
+        "https://blog.naver.com/myblog/postwrite",
+        "https://blog.naver.com",
+    ]
+    print("✅ 예상과 다른 곳에 도착하면 캐시 무효화 후 재탐색")
+    print()
+
+
+if __name__ == "__main__":
+    test_extract_blog_id()
+    asyncio.run(test_write_url_cached_per_session())
+    print("🎉 모든 테스트 통과!")